@@ -0,0 +1,44 @@
+from pydantic import BaseModel, Field, model_validator
+from siphon_api.enums import SourceType
+from siphon_api.models import SearchResult
+
+
+class SiphonSearchRequest(BaseModel):
+    query: str = Field(
+        ...,
+        min_length=1,
+        description='Search terms; supports "quoted phrases", OR and -exclusions.',
+    )
+    source_type: SourceType | None = Field(
+        default=None, description="Restrict results to one source type."
+    )
+    limit: int = Field(default=20, ge=1, le=100, description="Maximum results.")
+
+
+class SiphonRelatedRequest(BaseModel):
+    uris: list[str] = Field(
+        default_factory=list, description="Seed content; excluded from the results."
+    )
+    query: str | None = Field(
+        default=None, description="Optional text to steer the expansion."
+    )
+    k: int = Field(default=10, ge=1, le=100, description="Maximum results.")
+
+    @model_validator(mode="after")
+    def require_seed(self):
+        if not self.uris and not self.query:
+            raise ValueError("find_related needs seed uris, a query, or both.")
+        return self
+
+
+class SiphonSearchResponse(BaseModel):
+    query: str = Field(..., description="The query that was run.")
+    results: list[SearchResult] = Field(
+        default_factory=list, description="Hits, best first."
+    )
+
+
+class SiphonRelatedResponse(BaseModel):
+    results: list[SearchResult] = Field(
+        default_factory=list, description="Related content, most similar first."
+    )
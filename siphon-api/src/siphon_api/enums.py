@@ -27,3 +27,14 @@ class ActionType(str, Enum):
     TOKENIZE = "tokenize"
     ENRICH = "enrich"
     GULP = "gulp"
+
+
+class ResourceClass(str, Enum):
+    """
+    The bottleneck a strategy's work is bound by; each class is scheduled separately.
+    """
+
+    GPU = "gpu"  # Whisper transcription, diarization
+    CPU = "cpu"  # Document / HTML conversion
+    NETWORK = "network"  # HTTP fetches, third-party APIs
+    LLM = "llm"  # Model calls (enrichment)
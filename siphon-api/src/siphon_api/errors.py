@@ -23,3 +23,7 @@ class SiphonEnricherError(Exception):
 # Source-specific
 class ArticleCacheError(Exception):
     pass
+
+
+class StageCacheError(Exception):
+    pass
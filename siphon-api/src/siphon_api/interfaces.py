@@ -35,3 +35,39 @@ class EnricherStrategy(Protocol):
     source_type: SourceType
 
     def enrich(self, content: ContentData, preferred_model: str) -> EnrichedData: ...
+
+
+class AsyncParserStrategy(Protocol):
+    """
+    Async interface for source parsing strategies.
+    can_handle stays synchronous: routing must never wait on I/O.
+    """
+
+    source_type: SourceType
+
+    def can_handle(self, source: str) -> bool: ...
+
+    async def parse_async(self, source: str) -> SourceInfo: ...
+
+
+class AsyncExtractorStrategy(Protocol):
+    """
+    Async interface for content extraction strategies.
+    Implement alongside ExtractorStrategy when extraction is natively awaitable (e.g. HTTP).
+    """
+
+    source_type: SourceType
+
+    async def extract_async(self, source: SourceInfo) -> ContentData: ...
+
+
+class AsyncEnricherStrategy(Protocol):
+    """
+    Async interface for content enrichment strategies.
+    """
+
+    source_type: SourceType
+
+    async def enrich_async(
+        self, content: ContentData, preferred_model: str
+    ) -> EnrichedData: ...
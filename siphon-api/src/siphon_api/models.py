@@ -47,6 +47,16 @@ class EnrichedData(BaseModel):
     entities: list[str] = Field(default_factory=list)
 
 
+class PipelineTrace(BaseModel):
+    """
+    Per-request pipeline timings and cache outcomes. Diagnostic only; not persisted.
+    """
+
+    source_type: SourceType | None = None
+    timings: dict[str, float] = Field(default_factory=dict)  # Stage name -> seconds
+    cache_hits: dict[str, bool] = Field(default_factory=dict)  # Cache name -> hit?
+
+
 class ProcessedContent(BaseModel):
     """
     Final aggregate - main output of Siphon pipeline.
@@ -60,6 +70,7 @@ class ProcessedContent(BaseModel):
     tags: list[str] = Field(default_factory=list)
     created_at: int
     updated_at: int
+    trace: PipelineTrace | None = None  # Filled by the pipeline that produced this object
 
     # Convenience properties
     @property
@@ -91,6 +102,67 @@ class ProcessedContent(BaseModel):
         return self.enrichment.summary
 
 
+class ProcessedContentSummary(BaseModel):
+    """
+    ProcessedContent without its content (text and metadata): the lightweight view
+    repository listings and title/summary lookups return.
+    """
+
+    kind: Literal["ProcessedContentSummary"] = "ProcessedContentSummary"  # Discriminator
+
+    source: SourceInfo
+    enrichment: EnrichedData
+    tags: list[str] = Field(default_factory=list)
+    created_at: int
+    updated_at: int
+
+    # Convenience properties
+    @property
+    def source_type(self) -> SourceType:
+        return self.source.source_type
+
+    @property
+    def uri(self) -> str:
+        return self.source.uri
+
+    @property
+    def title(self) -> str:
+        return self.enrichment.title
+
+    @property
+    def description(self) -> str:
+        return self.enrichment.description
+
+    @property
+    def summary(self) -> str:
+        return self.enrichment.summary
+
+
+class SearchResult(BaseModel):
+    """
+    One full-text search hit: the matching content's summary, its relevance rank
+    (higher is better) and a snippet with the matched terms marked.
+    """
+
+    kind: Literal["SearchResult"] = "SearchResult"  # Discriminator
+
+    summary: ProcessedContentSummary
+    rank: float
+    snippet: str = ""
+
+
+class ContentPage(BaseModel):
+    """
+    One keyset page of repository summaries. Pass `next_after_id` back as `after_id`
+    for the following page; it is None once the listing is exhausted.
+    """
+
+    kind: Literal["ContentPage"] = "ContentPage"  # Discriminator
+
+    items: list[ProcessedContentSummary] = Field(default_factory=list)
+    next_after_id: int | None = None
+
+
 PipelineClass = (
     ProcessedContent | ContentData | EnrichedData | SourceInfo
 )  # Hence our discriminator field 'kind'
@@ -0,0 +1,78 @@
+"""
+Microbenchmark: DispatchIndex routing vs. the original linear can_handle scan.
+
+Builds the registered parsers once, then routes a mixed set of sources (YouTube, Drive and article URLs, plus real temp files with doc/audio/unknown extensions) through both strategies and reports per-source latency. Also checks that both strategies pick the same parser for every source.
+
+Usage:
+    python dev/benchmarks/bench_dispatch.py --rounds 20000
+"""
+
+from siphon_server.core.dispatch import DispatchIndex
+from siphon_server.sources.registry import load_registry
+from siphon_api.enums import SourceType
+from pathlib import Path
+import argparse
+import tempfile
+import timeit
+
+
+def load_parsers() -> list:
+    parsers = []
+    for source_type in load_registry():
+        module = __import__(
+            f"siphon_server.sources.{source_type.lower()}.parser", fromlist=[""]
+        )
+        parser_class = getattr(module, SourceType[source_type.upper()] + "Parser", None)
+        if parser_class:
+            parsers.append(parser_class())
+    return parsers
+
+
+def linear_route(parsers: list, source: str):
+    for parser in parsers:
+        if parser.can_handle(source=source):
+            return parser
+    return None
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--rounds", type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    parsers = load_parsers()
+    index = DispatchIndex(parsers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for name in ["report.pdf", "notes.md", "talk.mp3", "photo.xyz"]:
+            path = Path(tmp) / name
+            path.write_bytes(b"x")
+            files.append(str(path))
+        sources = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://docs.google.com/document/d/abc123/edit",
+            "https://blog.example.com/posts/2024/some-article?utm_source=x",
+            "https://news.ycombinator.com/item?id=1",
+            *files,
+        ]
+
+        for source in sources:
+            linear, indexed = linear_route(parsers, source), index.route(source)
+            assert linear is indexed, f"Routing mismatch for {source}: {linear} != {indexed}"
+
+        print(f"{'source':<55} {'linear (us)':>12} {'index (us)':>12} {'speedup':>8}")
+        for source in sources:
+            t_linear = timeit.timeit(lambda: linear_route(parsers, source), number=args.rounds)
+            t_index = timeit.timeit(lambda: index.route(source), number=args.rounds)
+            us_linear = t_linear / args.rounds * 1e6
+            us_index = t_index / args.rounds * 1e6
+            label = source if len(source) <= 55 else "..." + source[-52:]
+            print(
+                f"{label:<55} {us_linear:>12.2f} {us_index:>12.2f} {us_linear / us_index:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
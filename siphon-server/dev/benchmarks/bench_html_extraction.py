@@ -0,0 +1,129 @@
+"""
+HTML extraction benchmark: the article_html_backend choices on a saved corpus.
+
+Runs every backend in --backends over each *.html file in --corpus, each backend in its own fresh process so memory figures don't leak between them, and reports per backend:
+- pages extracted / failed,
+- latency per page (median, p95) and total, best of --repeat passes,
+- peak RSS of the worker process and of its children (readabilipy's Node processes),
+- parity with the first backend: mean word-level similarity of the Markdown (difflib ratio, 1.0 = identical) and the share of pages whose titles agree.
+
+--fetch FILE saves the URLs listed in FILE (one per line) into --corpus first, through the shared HTTP client, so the corpus can be rebuilt and then reused offline.
+
+Usage:
+    python dev/benchmarks/bench_html_extraction.py --corpus /tmp/html --fetch urls.txt
+    python dev/benchmarks/bench_html_extraction.py --corpus /tmp/html --backends readabilipy trafilatura
+"""
+
+from siphon_server.sources.article.html import BACKENDS, get_backend
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+from pathlib import Path
+import multiprocessing
+import statistics
+import argparse
+import resource
+import time
+
+
+def fetch_corpus(url_file: Path, corpus: Path) -> None:
+    from siphon_server.core.http_client import HTTP
+    from siphon_server.sources.article.extractor import USER_AGENT
+
+    corpus.mkdir(parents=True, exist_ok=True)
+    urls = [line.strip() for line in url_file.read_text().splitlines() if line.strip()]
+    for n, url in enumerate(urls):
+        try:
+            response = HTTP.request(
+                "GET", url, follow_redirects=True, headers={"User-Agent": USER_AGENT}
+            )
+            response.raise_for_status()
+        except Exception as e:
+            print(f"skipped {url}: {e}")
+            continue
+        (corpus / f"{n:04d}.html").write_text(response.text)
+    print(f"saved {len(list(corpus.glob('*.html')))} pages to {corpus}")
+
+
+def run_backend(name: str, paths: list[Path], repeat: int) -> dict:
+    """In a worker process: extract every page repeat times; keep the best pass."""
+    backend = get_backend(name)
+    pages = [path.read_text(errors="replace") for path in paths]
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    best: list[float] | None = None
+    outputs: list[tuple[str, str | None] | None] = []
+    for _ in range(repeat):
+        latencies, outputs = [], []
+        for html in pages:
+            start = time.perf_counter()
+            try:
+                text, metadata = backend(html)
+                outputs.append((text, metadata.get("title")))
+            except Exception:
+                outputs.append(None)
+            latencies.append(time.perf_counter() - start)
+        if best is None or sum(latencies) < sum(best):
+            best = latencies
+    return {
+        "latencies": best or [],
+        "outputs": outputs,
+        "rss_before": rss_before,
+        "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "children_rss": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    }
+
+
+def similarity(a: str, b: str) -> float:
+    return SequenceMatcher(None, a.split(), b.split(), autojunk=False).ratio()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--corpus", type=Path, required=True)
+    arg_parser.add_argument("--fetch", type=Path, default=None)
+    arg_parser.add_argument("--backends", nargs="+", default=list(BACKENDS))
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    if args.fetch is not None:
+        fetch_corpus(args.fetch, args.corpus)
+    paths = sorted(args.corpus.glob("*.html"))
+    if not paths:
+        arg_parser.error(f"no *.html files in {args.corpus}")
+    corpus_mb = sum(path.stat().st_size for path in paths) / 1e6
+    print(f"{len(paths)} pages, {corpus_mb:.1f} MB of HTML, best of {args.repeat} passes")
+
+    results = {}
+    spawn = multiprocessing.get_context("spawn")
+    for name in args.backends:
+        with ProcessPoolExecutor(1, mp_context=spawn) as pool:
+            results[name] = pool.submit(run_backend, name, paths, args.repeat).result()
+
+    reference = results[args.backends[0]]["outputs"]
+    print(
+        f"{'backend':<12} {'ok':>5} {'failed':>6} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'total s':>8} {'RSS MB':>7} {'+run MB':>7} {'child MB':>8} "
+        f"{'parity':>6} {'titles':>6}"
+    )
+    for name in args.backends:
+        result = results[name]
+        latencies = sorted(result["latencies"])
+        ok = [out for out in result["outputs"] if out is not None]
+        pairs = [
+            (out, ref)
+            for out, ref in zip(result["outputs"], reference)
+            if out is not None and ref is not None
+        ]
+        parity = statistics.fmean(similarity(o[0], r[0]) for o, r in pairs) if pairs else 0.0
+        titles = sum(o[1] == r[1] for o, r in pairs) / len(pairs) if pairs else 0.0
+        print(
+            f"{name:<12} {len(ok):>5} {len(latencies) - len(ok):>6} "
+            f"{statistics.median(latencies) * 1e3:>8.1f} "
+            f"{latencies[int(0.95 * (len(latencies) - 1))] * 1e3:>8.1f} "
+            f"{sum(latencies):>8.2f} {result['rss'] / 1024:>7.0f} "
+            f"{(result['rss'] - result['rss_before']) / 1024:>7.0f} "
+            f"{result['children_rss'] / 1024:>8.0f} {parity:>6.2f} {titles:>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
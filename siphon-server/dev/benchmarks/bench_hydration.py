@@ -0,0 +1,196 @@
+"""
+Hydration benchmark: where the CPU goes when a bulk read turns --rows repository rows into ProcessedContent.
+
+Builds ORM rows in memory (no database needed; bodies are compressed the way the repository stores them) and times each step of `converters.from_orm`, best of --repeat runs with the garbage collector paused:
+- body decompression, with a fresh zstd context per call (the old bodies.py) and with the per-thread context bodies.py now keeps,
+- validated construction: the model constructors from_orm uses,
+- pydantic's `model_construct` on the same values: the "trusted", unvalidated alternative,
+- `from_orm` end to end.
+
+Every path must produce equal objects. With --sqlite PATH the benchmark also seeds a SQLite repository and times `iter_all` end to end, which adds the database fetch and JSON decoding.
+
+Usage:
+    python dev/benchmarks/bench_hydration.py --rows 10000
+    python dev/benchmarks/bench_hydration.py --rows 10000 --sqlite /tmp/bench.db
+"""
+
+from siphon_api.enums import SourceType
+from siphon_api.models import ContentData, EnrichedData, ProcessedContent, SourceInfo
+from siphon_server.database.postgres.bodies import ZSTD_LEVEL, body_row, body_text
+from siphon_server.database.postgres.converters import from_orm, to_orm
+from siphon_server.database.postgres.models import ContentBodyORM
+from collections.abc import Callable
+from pathlib import Path
+import argparse
+import time
+import gc
+
+
+def make_item(n: int) -> ProcessedContent:
+    uri = f"youtube:///bench{n:06d}"
+    return ProcessedContent(
+        source=SourceInfo(source_type=SourceType.YOUTUBE, uri=uri, original_source=uri),
+        content=ContentData(
+            source_type=SourceType.YOUTUBE,
+            text=f"transcript {n} " * 1500,
+            metadata={
+                "channel": "bench",
+                "duration": 600 + n,
+                "tags": [f"tag{i}" for i in range(20)],
+                "chapters": [{"start": i * 30, "title": f"c{i}"} for i in range(10)],
+            },
+        ),
+        enrichment=EnrichedData(
+            source_type=SourceType.YOUTUBE,
+            title=f"Item {n}",
+            description="description " * 20,
+            summary="summary " * 80,
+            topics=[f"topic{i}" for i in range(8)],
+            entities=[f"entity{i}" for i in range(8)],
+        ),
+        tags=["bench"],
+        created_at=n,
+        updated_at=n,
+    )
+
+
+def make_rows(items: list[ProcessedContent]) -> list:
+    rows = []
+    for pc in items:
+        orm_obj = to_orm(pc)
+        orm_obj.body = ContentBodyORM(**body_row(pc.text))
+        rows.append(orm_obj)
+    return rows
+
+
+def decompress_fresh(orm) -> str:
+    import zstandard
+
+    return zstandard.ZstdDecompressor().decompress(orm.body.body).decode()
+
+
+def validated(orm, text: str) -> ProcessedContent:
+    source_type = SourceType(orm.source_type)
+    return ProcessedContent(
+        source=SourceInfo(
+            source_type=source_type,
+            uri=orm.uri,
+            original_source=orm.original_source,
+            hash=orm.source_hash,
+        ),
+        content=ContentData(
+            source_type=source_type,
+            text=text,
+            metadata=orm.content_metadata or {},
+            token_count=orm.content_tokens,
+        ),
+        enrichment=EnrichedData(
+            source_type=source_type,
+            title=orm.title or "",
+            description=orm.description or "",
+            summary=orm.summary or "",
+            topics=orm.topics or [],
+            entities=orm.entities or [],
+        ),
+        tags=orm.tags or [],
+        created_at=orm.created_at,
+        updated_at=orm.updated_at,
+    )
+
+
+def constructed(orm, text: str) -> ProcessedContent:
+    source_type = SourceType(orm.source_type)
+    return ProcessedContent.model_construct(
+        source=SourceInfo.model_construct(
+            source_type=source_type,
+            uri=orm.uri,
+            original_source=orm.original_source,
+            hash=orm.source_hash,
+        ),
+        content=ContentData.model_construct(
+            source_type=source_type,
+            text=text,
+            metadata=orm.content_metadata or {},
+            token_count=orm.content_tokens,
+        ),
+        enrichment=EnrichedData.model_construct(
+            source_type=source_type,
+            title=orm.title or "",
+            description=orm.description or "",
+            summary=orm.summary or "",
+            topics=orm.topics or [],
+            entities=orm.entities or [],
+        ),
+        tags=orm.tags or [],
+        created_at=orm.created_at,
+        updated_at=orm.updated_at,
+    )
+
+
+def timed(label: str, rows: int, repeat: int, fn: Callable[[], list]) -> list:
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    print(f"{label:<32} {best * 1e3:>9.1f} {best / rows * 1e6:>9.2f}")
+    return result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--rows", type=int, default=10_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--sqlite", type=Path, default=None)
+    args = arg_parser.parse_args()
+    rows, repeat = args.rows, args.repeat
+
+    items = [make_item(n) for n in range(rows)]
+    orm_rows = make_rows(items)
+    texts = [body_text(orm.body) for orm in orm_rows]
+
+    print(f"zstd level {ZSTD_LEVEL}, {len(texts[0])} characters per body")
+    print(f"{'step':<32} {'best ms':>9} {'us/row':>9}")
+    timed(
+        "decompress (fresh context)",
+        rows,
+        repeat,
+        lambda: [decompress_fresh(orm) for orm in orm_rows],
+    )
+    timed(
+        "decompress (per-thread context)",
+        rows,
+        repeat,
+        lambda: [body_text(orm.body) for orm in orm_rows],
+    )
+    slow = timed(
+        "validated constructors",
+        rows,
+        repeat,
+        lambda: [validated(orm, text) for orm, text in zip(orm_rows, texts)],
+    )
+    trusted = timed(
+        "model_construct",
+        rows,
+        repeat,
+        lambda: [constructed(orm, text) for orm, text in zip(orm_rows, texts)],
+    )
+    hydrated = timed("from_orm", rows, repeat, lambda: [from_orm(o) for o in orm_rows])
+    assert slow == trusted == hydrated == items, "hydration paths disagree"
+
+    if args.sqlite is not None:
+        from siphon_server.database.sqlite.repository import SQLiteContentRepository
+
+        args.sqlite.unlink(missing_ok=True)
+        repository = SQLiteContentRepository(args.sqlite, cache_size=0)
+        timed("sqlite upsert_many", rows, 1, lambda: [repository.upsert_many(items)])
+        read = timed("sqlite iter_all", rows, repeat, lambda: list(repository.iter_all()))
+        assert read == items, "sqlite round trip disagrees"
+
+
+if __name__ == "__main__":
+    main()
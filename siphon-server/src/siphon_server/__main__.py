@@ -1,4 +1,155 @@
-def main() -> None:
-    print("hello from siphon_server")
+"""
+siphon-server command line.
+
+Usage:
+    siphon-server --import-profile                 # cold-start import report for the pipeline
+    siphon-server --import-profile siphon_server.sources.youtube.extractor --top 10
+    siphon-server parse https://youtu.be/dQw4w9WgXcQ
+    siphon-server batch backfill.txt --workers 8   # resumable; re-run to continue
+    siphon-server search "vector databases" --type YouTube --limit 5
+    siphon-server embed --batch-size 64            # embed new/changed content for find_related
+"""
+
+from siphon_api.enums import ActionType, SourceType
+from pathlib import Path
+import argparse
+import sys
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="siphon-server")
+    parser.add_argument(
+        "--import-profile",
+        nargs="?",
+        const="siphon_server.core.pipeline",
+        metavar="MODULE",
+        help="Report cold-start import time of MODULE (default: the pipeline).",
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="Rows in the import profile report."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    parse = subparsers.add_parser("parse", help="Parse a source into SourceInfo.")
+    parse.add_argument("source")
+
+    batch = subparsers.add_parser(
+        "batch", help="Process a manifest across worker processes (resumable)."
+    )
+    batch.add_argument(
+        "manifest", type=Path, help="Text file, JSONL file, or directory of sources."
+    )
+    batch.add_argument("--workers", type=int, default=4)
+    batch.add_argument(
+        "--action",
+        type=ActionType,
+        choices=list(ActionType),
+        default=ActionType.GULP,
+        metavar="{" + ",".join(a.value for a in ActionType) + "}",
+    )
+    batch.add_argument("--model", default=None, help="Preferred enrichment model.")
+    batch.add_argument(
+        "--no-cache", action="store_true", help="Ignore cached results and reprocess."
+    )
+    batch.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Re-check cached articles with their origin; re-persist changed ones.",
+    )
+    batch.add_argument(
+        "--jobs", type=Path, default=None, help="Job database (default: per manifest)."
+    )
+    batch.add_argument(
+        "--retry-failed", action="store_true", help="Also retry items that failed before."
+    )
+
+    search = subparsers.add_parser("search", help="Full-text search persisted content.")
+    search.add_argument("query", help='Search terms ("phrases", OR, -term).')
+    search.add_argument(
+        "--type",
+        dest="source_type",
+        type=SourceType,
+        choices=list(SourceType),
+        default=None,
+        metavar="{" + ",".join(t.value for t in SourceType) + "}",
+    )
+    search.add_argument("--limit", type=int, default=10)
+
+    embed = subparsers.add_parser(
+        "embed", help="Embed new or changed content into the pgvector store."
+    )
+    embed.add_argument("--batch-size", type=int, default=64, help="Rows per batch.")
+    embed.add_argument("--limit", type=int, default=None, help="Stop after N rows.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.import_profile:
+        from siphon_server.core.import_profile import (
+            profile_imports,
+            print_import_profile,
+        )
+
+        print_import_profile(profile_imports(args.import_profile), n=args.top)
+        return 0
+
+    match args.command:
+        case "parse":
+            from siphon_server.core.pipeline import SiphonPipeline
+
+            source_info = SiphonPipeline().process(args.source, action=ActionType.PARSE)
+            print(source_info.model_dump_json(indent=2))
+        case "batch":
+            from siphon_server.core.batch_runner import run_batch, print_batch_report
+
+            report = run_batch(
+                args.manifest,
+                workers=args.workers,
+                action=args.action,
+                use_cache=not args.no_cache,
+                preferred_model=args.model,
+                job_db=args.jobs,
+                retry_failed=args.retry_failed,
+                revalidate=args.revalidate,
+            )
+            print_batch_report(report)
+            return 130 if report.interrupted else (1 if report.failed else 0)
+        case "search":
+            from siphon_api.api.siphon_search import SiphonSearchRequest
+            from siphon_server.core.pipeline import SiphonPipeline
+            from rich.console import Console
+
+            request = SiphonSearchRequest(
+                query=args.query, source_type=args.source_type, limit=args.limit
+            )
+            response = SiphonPipeline().search(request)
+            console = Console()
+            for result in response.results:
+                console.print(
+                    f"[bold]{result.summary.title or result.summary.uri}[/bold] "
+                    f"[dim]{result.summary.uri} ({result.rank:.3f})[/dim]"
+                )
+                console.print(result.snippet, markup=False)
+                console.print()
+            if not response.results:
+                console.print("No results.")
+        case "embed":
+            from siphon_server.database.postgres.setup import create_embedding_tables
+            from siphon_server.database.vector.backfill import backfill_embeddings
+
+            create_embedding_tables()
+            report = backfill_embeddings(batch_size=args.batch_size, limit=args.limit)
+            print(
+                f"{report.rows} rows scanned, {report.embedded} chunks embedded, "
+                f"{report.unchanged} unchanged in {report.elapsed:.1f}s"
+            )
+        case _:
+            parser.print_help()
+    return 0
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -9,20 +9,114 @@ class Settings:
     default_model: str
     log_level: int
     cache: bool
+    offload_workers: int
+    stage_cache: bool
+    work_leases: bool
+    work_lease_ttl: float
+    resource_slots: dict[str, int]
+    repository_cache_size: int
+    repository_cache_ttl: float
+    repository_batch_size: int
+    repository_backend: str
+    sqlite_path: str
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_timeout: float
+    db_pool_recycle: int
+    db_pool_pre_ping: bool
+    db_statement_timeout: float
+    embedding_model: str
+    embedding_url: str
+    embedding_dimensions: int
+    embedding_batch_size: int
+    embedding_chunk_chars: int
+    embedding_max_chunks: int
+    http_max_connections: int
+    http_max_keepalive: int
+    http_keepalive_expiry: float
+    http_per_host: int
+    http_connect_timeout: float
+    http_timeout: float
+    http2: bool
+    article_bulk_concurrency: int
+    article_bulk_per_host: int
+    article_bulk_attempts: int
+    article_cache_max_age: float
+    article_revalidate: bool
+    article_html_backend: str
+    process_pool_workers: int
+    process_pool_max_tasks: int
+    process_pool_max_rss_mb: int
 
 
 def load_settings() -> Settings:
     """Load settings with precedence: ENV VARS > config file > defaults"""
 
     # Defaults (lowest priority)
-    config = {"default_model": "gpt-oss:latest", "log_level": 2, "cache": True}
+    config = {
+        "default_model": "gpt-oss:latest",
+        "log_level": 2,
+        "cache": True,
+        "offload_workers": 32,  # Thread cap for sync work called from async code
+        "stage_cache": True,  # Cache extracted/enriched stage outputs (core.stage_cache)
+        "work_leases": True,  # Serialize identical work across processes (core.pipeline)
+        "work_lease_ttl": 3600.0,  # Seconds before a dead holder's work lease frees up
+        # Concurrent work allowed per ResourceClass (core.scheduler)
+        "resource_slots": {
+            "gpu": 1,
+            "cpu": os.cpu_count() or 4,
+            "network": 32,
+            "llm": 8,
+        },
+        "repository_cache_size": 1024,  # Hydrated rows kept in memory; 0 disables
+        "repository_cache_ttl": 300.0,  # Seconds before a cached row is re-read
+        "repository_batch_size": 500,  # Rows per statement in bulk reads and upserts
+        "repository_backend": "postgres",  # Or "sqlite" (embedded; database.backend)
+        "sqlite_path": "",  # Empty: $XDG_DATA_HOME/siphon/siphon.db
+        # Postgres connection pools (sync and asyncpg engines each get one)
+        "db_pool_size": 10,
+        "db_max_overflow": 20,
+        "db_pool_timeout": 30.0,  # Seconds to wait for a free connection
+        "db_pool_recycle": 1800,  # Seconds before a connection is replaced
+        "db_pool_pre_ping": True,  # Test connections on checkout
+        "db_statement_timeout": 30.0,  # Seconds; 0 disables
+        # Embeddings for semantic expansion (database.vector); any OpenAI-compatible API
+        "embedding_model": "nomic-embed-text",
+        "embedding_url": "http://localhost:11434/v1/embeddings",
+        "embedding_dimensions": 768,  # Must match the model and content_embeddings
+        "embedding_batch_size": 64,  # Texts per embeddings request
+        "embedding_chunk_chars": 2000,  # Characters of extracted text per chunk
+        "embedding_max_chunks": 8,  # Text chunks embedded per item (plus its summary)
+        # Shared HTTP clients for fetches and service calls (core.http_client)
+        "http_max_connections": 100,
+        "http_max_keepalive": 20,  # Idle connections kept open
+        "http_keepalive_expiry": 60.0,  # Seconds an idle connection stays open
+        "http_per_host": 8,  # Requests in flight per host
+        "http_connect_timeout": 10.0,
+        "http_timeout": 30.0,  # Read/write/pool timeout unless a call passes its own
+        "http2": True,  # Needs the h2 package; otherwise HTTP/1.1
+        # ArticleExtractor.extract_many_async (sources.article.bulk)
+        "article_bulk_concurrency": 32,  # Requests in flight across all hosts
+        "article_bulk_per_host": 4,  # Ceiling for each host's adaptive limit
+        "article_bulk_attempts": 4,  # Tries per URL on 429/503/5xx/transport errors
+        "article_cache_max_age": 0.0,  # Seconds before a cached article is revalidated; 0: never
+        "article_revalidate": False,  # Revalidate every cached article, stage cache and repository too
+        "article_html_backend": "readabilipy",  # Or "trafilatura" (sources.article.html)
+        # Worker processes for HTML/Markdown/MarkItDown conversion (core.process_pool)
+        "process_pool_workers": os.cpu_count() or 4,  # 0 runs conversions inline
+        "process_pool_max_tasks": 200,  # Conversions before a worker is replaced
+        "process_pool_max_rss_mb": 1024,  # Worker peak RSS that recycles the pool; 0: off
+    }
 
     # Load from config file if it exists
     config_path = Path.home() / ".config" / "siphon" / "config.toml"
     if config_path.exists():
         with open(config_path, "rb") as f:
             file_config = tomllib.load(f)
+            # A partial [resource_slots] table overrides only the classes it names
+            slots = {**config["resource_slots"], **file_config.pop("resource_slots", {})}
             config.update(file_config)
+            config["resource_slots"] = slots
 
     # Override with environment variables (highest priority)
     if "SIPHON_DEFAULT_MODEL" in os.environ:
@@ -34,6 +128,99 @@ def load_settings() -> Settings:
     if "SIPHON_CACHE" in os.environ:
         config["cache"] = os.environ["CACHE"].lower() in ("true", "1", "yes")
 
+    if "SIPHON_OFFLOAD_WORKERS" in os.environ:
+        config["offload_workers"] = int(os.environ["SIPHON_OFFLOAD_WORKERS"])
+
+    if "SIPHON_STAGE_CACHE" in os.environ:
+        config["stage_cache"] = os.environ["SIPHON_STAGE_CACHE"].lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+
+    if "SIPHON_WORK_LEASES" in os.environ:
+        config["work_leases"] = os.environ["SIPHON_WORK_LEASES"].lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+
+    if "SIPHON_WORK_LEASE_TTL" in os.environ:
+        config["work_lease_ttl"] = float(os.environ["SIPHON_WORK_LEASE_TTL"])
+
+    if "SIPHON_RESOURCE_SLOTS" in os.environ:
+        # e.g. SIPHON_RESOURCE_SLOTS="gpu=1,llm=4"
+        for pair in os.environ["SIPHON_RESOURCE_SLOTS"].split(","):
+            name, _, slots = pair.partition("=")
+            config["resource_slots"][name.strip().lower()] = int(slots)
+
+    if "SIPHON_REPOSITORY_CACHE_SIZE" in os.environ:
+        config["repository_cache_size"] = int(os.environ["SIPHON_REPOSITORY_CACHE_SIZE"])
+
+    if "SIPHON_REPOSITORY_CACHE_TTL" in os.environ:
+        config["repository_cache_ttl"] = float(os.environ["SIPHON_REPOSITORY_CACHE_TTL"])
+
+    if "SIPHON_REPOSITORY_BATCH_SIZE" in os.environ:
+        config["repository_batch_size"] = int(os.environ["SIPHON_REPOSITORY_BATCH_SIZE"])
+
+    if "SIPHON_REPOSITORY_BACKEND" in os.environ:
+        config["repository_backend"] = os.environ["SIPHON_REPOSITORY_BACKEND"].lower()
+
+    if "SIPHON_SQLITE_PATH" in os.environ:
+        config["sqlite_path"] = os.environ["SIPHON_SQLITE_PATH"]
+
+    for key, cast in (
+        ("db_pool_size", int),
+        ("db_max_overflow", int),
+        ("db_pool_timeout", float),
+        ("db_pool_recycle", int),
+        ("db_statement_timeout", float),
+    ):
+        if f"SIPHON_{key.upper()}" in os.environ:
+            config[key] = cast(os.environ[f"SIPHON_{key.upper()}"])
+
+    if "SIPHON_EMBEDDING_MODEL" in os.environ:
+        config["embedding_model"] = os.environ["SIPHON_EMBEDDING_MODEL"]
+
+    if "SIPHON_EMBEDDING_URL" in os.environ:
+        config["embedding_url"] = os.environ["SIPHON_EMBEDDING_URL"]
+
+    for key, cast in (
+        ("http_max_connections", int),
+        ("http_max_keepalive", int),
+        ("http_keepalive_expiry", float),
+        ("http_per_host", int),
+        ("http_connect_timeout", float),
+        ("http_timeout", float),
+        ("article_bulk_concurrency", int),
+        ("article_bulk_per_host", int),
+        ("article_bulk_attempts", int),
+        ("article_cache_max_age", float),
+        ("process_pool_workers", int),
+        ("process_pool_max_tasks", int),
+        ("process_pool_max_rss_mb", int),
+    ):
+        if f"SIPHON_{key.upper()}" in os.environ:
+            config[key] = cast(os.environ[f"SIPHON_{key.upper()}"])
+
+    if "SIPHON_HTTP2" in os.environ:
+        config["http2"] = os.environ["SIPHON_HTTP2"].lower() in ("true", "1", "yes")
+
+    if "SIPHON_ARTICLE_REVALIDATE" in os.environ:
+        config["article_revalidate"] = os.environ[
+            "SIPHON_ARTICLE_REVALIDATE"
+        ].lower() in ("true", "1", "yes")
+
+    if "SIPHON_ARTICLE_HTML_BACKEND" in os.environ:
+        config["article_html_backend"] = os.environ["SIPHON_ARTICLE_HTML_BACKEND"].lower()
+
+    if "SIPHON_DB_POOL_PRE_PING" in os.environ:
+        config["db_pool_pre_ping"] = os.environ["SIPHON_DB_POOL_PRE_PING"].lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+
     return Settings(**config)
 
 
@@ -0,0 +1,87 @@
+"""
+Bridges between the sync strategy interfaces and the async pipeline path.
+
+`SiphonPipeline.process_async` awaits blocking work on one process-wide, bounded thread pool (`run_sync`). The pool size (`settings.offload_workers`) caps the number of threads no matter how many ingestions are in flight on the event loop: excess work queues on the executor instead of spawning threads. Parsers that implement `parse_async` (`siphon_api.interfaces`) are used as-is; any other parser is wrapped in `ThreadedParser`, which runs `parse` on that pool. Extractors and enrichers without `extract_async` / `enrich_async` run on their resource class's scheduler slots instead (`core.scheduler`), so this module has no adapter for them.
+
+Usage:
+```python
+from siphon_server.core.async_adapters import as_async_parser, run_sync
+
+parser = as_async_parser(YouTubeParser())
+source_info = await parser.parse_async(source)
+exists = await run_sync(repository.exists, source_info.uri)
+```
+"""
+
+from siphon_server.config import settings
+from siphon_api.interfaces import ParserStrategy, AsyncParserStrategy
+from siphon_api.models import SourceInfo
+from siphon_api.enums import SourceType
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+import contextvars
+import threading
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_offload_executor() -> ThreadPoolExecutor:
+    """
+    Process-wide executor for blocking calls made from async code.
+    Created on first use so importing this module never spawns threads.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                logger.debug(
+                    f"Creating offload executor with {settings.offload_workers} workers."
+                )
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.offload_workers,
+                    thread_name_prefix="siphon-offload",
+                )
+    return _executor
+
+
+async def run_sync(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Await a blocking callable on the shared offload executor.
+    Context variables (e.g. the current metrics trace) carry over to the worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_offload_executor(), partial(context.run, fn, *args, **kwargs)
+    )
+
+
+class ThreadedParser(AsyncParserStrategy):
+    """
+    Async face for a sync ParserStrategy.
+    """
+
+    def __init__(self, parser: ParserStrategy):
+        self.wrapped = parser
+        self.source_type: SourceType = parser.source_type
+
+    def can_handle(self, source: str) -> bool:
+        return self.wrapped.can_handle(source=source)
+
+    async def parse_async(self, source: str) -> SourceInfo:
+        return await run_sync(self.wrapped.parse, source=source)
+
+
+def as_async_parser(parser: ParserStrategy) -> AsyncParserStrategy:
+    if hasattr(parser, "parse_async"):
+        return parser  # pyright: ignore[reportReturnType]
+    return ThreadedParser(parser)
+
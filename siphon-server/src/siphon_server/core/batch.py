@@ -0,0 +1,223 @@
+"""
+Staged batch execution for `SiphonPipeline.process_many`.
+
+A batch is run as a chain of stages (parse → lookup → extract → enrich → persist), each with its own pool of worker threads and a bounded inbound queue. Items flow through the chain independently, so a slow network fetch for one source overlaps with LLM enrichment of another, and the bounded queues apply backpressure to the feeder instead of materializing the whole batch in memory. A stage may finish an item early (e.g. a repository cache hit, or an action that stops at EXTRACT); finished items are yielded immediately, in completion order, each tagged with its result or its error.
+
+Usage:
+```python
+from siphon_server.core.batch import Stage, run_stages
+
+stages = [Stage("parse", parse_fn, workers=2), Stage("extract", extract_fn, workers=8)]
+for result in run_stages(sources, stages, queue_size=16):
+    print(result.source, result.error or result.result)
+```
+"""
+
+from __future__ import annotations
+from siphon_api.models import (
+    SourceInfo,
+    ContentData,
+    EnrichedData,
+    PipelineClass,
+    PipelineTrace,
+)
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+import threading
+import queue
+import logging
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()  # Sentinel: tells a stage worker its inbound queue is exhausted
+_POLL_INTERVAL = 0.1  # Seconds between checks of the stop event while blocked
+
+
+@dataclass
+class BatchItem:
+    """
+    Mutable per-source state carried between stages.
+    A stage sets `result` and `done` to short-circuit the rest of the chain.
+    """
+
+    index: int
+    source: str
+    source_info: SourceInfo | None = None
+    content_data: ContentData | None = None
+    enriched_data: EnrichedData | None = None
+    result: PipelineClass | None = None
+    error: Exception | None = None
+    done: bool = False
+    trace: PipelineTrace | None = None
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of one source in a batch. Exactly one of result / error is set.
+    """
+
+    index: int
+    source: str
+    result: PipelineClass | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class Stage:
+    """
+    One step of the batch chain: `fn` mutates the item in place.
+
+    A stage may be split into lanes: `lane` names the lane an item belongs to, and
+    `lanes` maps each lane name to its worker count (replacing `workers`). Each lane has
+    its own queue and threads, so a backlog in one lane never occupies another's workers.
+    """
+
+    name: str
+    fn: Callable[[BatchItem], None]
+    workers: int = 1
+    lane: Callable[[BatchItem], str] | None = None
+    lanes: dict[str, int] = field(default_factory=dict)
+
+    def lane_workers(self) -> dict[str | None, int]:
+        if self.lane is None:
+            return {None: self.workers}
+        return dict(self.lanes)
+
+
+def run_stages(
+    sources: Iterable[str], stages: list[Stage], queue_size: int = 16
+) -> Iterator[BatchResult]:
+    """
+    Run every source through the stage chain, yielding results as they complete.
+
+    Each stage (or each lane of a laned stage) gets its own worker threads reading from
+    its own queue bounded at `queue_size`.
+    Exceptions raised by a stage are caught and attached to the item, which then exits the
+    chain; they never abort the batch. Closing the generator early stops all workers.
+    """
+    if not stages:
+        raise ValueError("run_stages requires at least one stage.")
+    lane_workers = [stage.lane_workers() for stage in stages]
+    if any(not lanes or min(lanes.values()) < 1 for lanes in lane_workers):
+        raise ValueError("Every stage (and every lane) needs at least one worker.")
+
+    stop = threading.Event()
+    inboxes: list[dict[str | None, queue.Queue]] = [
+        {lane: queue.Queue(maxsize=queue_size) for lane in lanes}
+        for lanes in lane_workers
+    ]
+    outbox: queue.Queue = queue.Queue()
+    remaining = [sum(lanes.values()) for lanes in lane_workers]
+    remaining_lock = threading.Lock()
+    feed_errors: list[Exception] = []
+
+    def put(q: queue.Queue, item: object) -> bool:
+        """Blocking put that gives up once the batch is stopped."""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def forward(position: int, item: BatchItem) -> bool:
+        """Put item on the inbox of its lane at position (or finish it on a bad lane)."""
+        stage = stages[position]
+        try:
+            lane = stage.lane(item) if stage.lane is not None else None
+            inbox = inboxes[position][lane]
+        except Exception as e:
+            logger.warning(f"[{stage.name}] no lane for {item.source}: {e}")
+            item.error = e
+            item.done = True
+            outbox.put(item)
+            return True
+        return put(inbox, item)
+
+    def close(position: int) -> None:
+        """Tell every worker of every lane at position that its inbox is exhausted."""
+        for lane, workers in lane_workers[position].items():
+            for _ in range(workers):
+                put(inboxes[position][lane], _STOP)
+
+    def feed() -> None:
+        try:
+            for index, source in enumerate(sources):
+                if not forward(0, BatchItem(index=index, source=source)):
+                    return
+        except Exception as e:
+            logger.error(f"Batch source iterator failed: {e}")
+            feed_errors.append(e)
+        finally:
+            close(0)
+
+    def work(position: int, lane: str | None) -> None:
+        stage = stages[position]
+        inbox = inboxes[position][lane]
+        last_stage = position + 1 == len(stages)
+        try:
+            while not stop.is_set():
+                try:
+                    item = inbox.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if item is _STOP:
+                    break
+                try:
+                    stage.fn(item)
+                except Exception as e:
+                    logger.warning(f"[{stage.name}] failed for {item.source}: {e}")
+                    item.error = e
+                    item.done = True
+                if item.done or last_stage:
+                    outbox.put(item)
+                else:
+                    forward(position + 1, item)
+        finally:
+            # The last worker of a stage to exit closes the next stage's inbox.
+            with remaining_lock:
+                remaining[position] -= 1
+                last = remaining[position] == 0
+            if last:
+                if last_stage:
+                    outbox.put(_STOP)
+                else:
+                    close(position + 1)
+
+    threads = [threading.Thread(target=feed, name="siphon-batch-feed", daemon=True)]
+    for position, stage in enumerate(stages):
+        for lane, workers in lane_workers[position].items():
+            prefix = f"siphon-batch-{stage.name}" + (f"-{lane}" if lane else "")
+            for n in range(workers):
+                threads.append(
+                    threading.Thread(
+                        target=work,
+                        args=(position, lane),
+                        name=f"{prefix}-{n}",
+                        daemon=True,
+                    )
+                )
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = outbox.get()
+            if item is _STOP:
+                break
+            yield BatchResult(
+                index=item.index,
+                source=item.source,
+                result=None if item.error else item.result,
+                error=item.error,
+            )
+        if feed_errors:
+            raise feed_errors[0]
+    finally:
+        stop.set()
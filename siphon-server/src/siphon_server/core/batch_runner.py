@@ -0,0 +1,290 @@
+"""
+Multi-process bulk ingestion behind `siphon-server batch`.
+
+`process_many` overlaps stages with threads inside one process; for backfills of tens of thousands of files and URLs, CPU-bound extraction (document conversion, transcription) needs more than one interpreter. `run_batch` reads a manifest, records every source in a durable `JobStore`, and shards the pending sources across N worker processes. Each worker builds and warms one `SiphonPipeline` at startup and reuses it for every item it is given. The coordinator keeps at most two items per worker in flight, writes each outcome to the job table as it arrives, and on Ctrl-C or a crash leaves the store resumable: re-running the same manifest skips completed sources.
+
+Manifests:
+- a directory: every file under it, recursively, in sorted order
+- `*.jsonl`: one JSON string, or object with a `source` key, per line
+- anything else: one source per line; blank lines and `#` comments are ignored
+
+Usage:
+```python
+from siphon_server.core.batch_runner import run_batch, print_batch_report
+
+report = run_batch(Path("backfill.txt"), workers=8)
+print_batch_report(report)
+```
+"""
+
+from siphon_api.enums import ActionType
+from siphon_server.core.job_store import JobStore, JobOutcome, default_job_db
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from collections.abc import Iterator
+from pathlib import Path
+import multiprocessing
+import statistics
+import json
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourceTypeLatency:
+    source_type: str
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    max: float
+
+
+@dataclass
+class BatchReport:
+    manifest: Path
+    job_db: Path
+    attempted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0  # Already done in an earlier run
+    interrupted: bool = False
+    elapsed: float = 0.0
+    latency: list[SourceTypeLatency] = field(default_factory=list)
+    failures: list[JobOutcome] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Completed items (succeeded or failed) per second of wall time."""
+        return self.attempted / self.elapsed if self.elapsed else 0.0
+
+
+def read_manifest(path: Path) -> Iterator[str]:
+    """
+    Yield the sources listed by a manifest file or directory.
+    """
+    if path.is_dir():
+        for file in sorted(p for p in path.rglob("*") if p.is_file()):
+            yield str(file.resolve())
+        return
+    with path.open("r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if path.suffix.lower() == ".jsonl":
+                entry = json.loads(line)
+                if isinstance(entry, dict):
+                    entry = entry.get("source")
+                if not isinstance(entry, str):
+                    raise ValueError(
+                        f"{path}:{line_number}: expected a string or an object with 'source'"
+                    )
+                line = entry
+            yield line
+
+
+# Worker process state: one warm pipeline per process
+_pipeline = None
+
+
+def _init_worker(revalidate: bool = False) -> None:
+    global _pipeline
+    from siphon_server.config import settings
+    from siphon_server.core.pipeline import SiphonPipeline
+    from siphon_server.core.process_pool import PROCESS_POOL
+
+    # Before any strategy is built: extractors read it once, at construction
+    if revalidate:
+        settings.article_revalidate = True
+
+    # Already one process per worker: convert inline rather than nest a second pool
+    PROCESS_POOL.inline = True
+    _pipeline = SiphonPipeline()
+    try:
+        _pipeline.warmup()
+    except Exception as e:
+        # A source with missing credentials must not take the whole pool down;
+        # its strategies are built (and fail) per item instead.
+        logger.warning(f"Worker warmup incomplete: {e}")
+
+
+def _run_item(
+    source: str, action: ActionType, use_cache: bool, preferred_model: str
+) -> JobOutcome:
+    assert _pipeline is not None, "Worker was not initialized"
+    start = time.perf_counter()
+    try:
+        result = _pipeline.process(
+            source, action=action, use_cache=use_cache, preferred_model=preferred_model
+        )
+    except Exception as e:
+        return JobOutcome(
+            source=source,
+            ok=False,
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+    source_info = getattr(result, "source", result)
+    return JobOutcome(
+        source=source,
+        ok=True,
+        seconds=time.perf_counter() - start,
+        uri=getattr(source_info, "uri", None),
+        source_type=result.source_type.value,
+    )
+
+
+def run_batch(
+    manifest: Path,
+    workers: int = 4,
+    action: ActionType = ActionType.GULP,
+    use_cache: bool = True,
+    preferred_model: str | None = None,
+    job_db: Path | None = None,
+    retry_failed: bool = False,
+    revalidate: bool = False,
+) -> BatchReport:
+    """
+    Process every pending source in manifest across `workers` processes.
+    revalidate turns on the `article_revalidate` setting in the workers: cached
+    articles are re-checked with the origin (a conditional GET) and re-persisted if
+    they changed, instead of being served from the repository or stage cache.
+    Returns a BatchReport; KeyboardInterrupt stops the run cleanly (report.interrupted).
+    """
+    if preferred_model is None:
+        from siphon_server.config import settings
+
+        preferred_model = settings.default_model
+
+    job_db = job_db or default_job_db(manifest)
+    store = JobStore(job_db)
+    added = store.add(read_manifest(manifest))
+    recovered = store.recover(retry_failed=retry_failed)
+    pending = store.pending()
+    report = BatchReport(
+        manifest=manifest,
+        job_db=job_db,
+        skipped=store.counts().get("done", 0),
+    )
+    logger.info(
+        f"Batch {manifest}: {added} new, {recovered} resumed, {len(pending)} pending."
+    )
+
+    outcomes: list[JobOutcome] = []
+    in_flight: dict[Future, str] = {}
+    queue = iter(pending)
+    start = time.perf_counter()
+    # Spawn, not fork: workers must not inherit the coordinator's threads or connections
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(revalidate,),
+    )
+    try:
+        while True:
+            while len(in_flight) < 2 * workers:
+                source = next(queue, None)
+                if source is None:
+                    break
+                store.mark_running(source)
+                future = executor.submit(
+                    _run_item, source, action, use_cache, preferred_model
+                )
+                in_flight[future] = source
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                source = in_flight.pop(future)
+                try:
+                    outcome = future.result()
+                except Exception as e:  # Worker died (e.g. OOM-killed) or init failed
+                    outcome = JobOutcome(
+                        source=source, ok=False, seconds=0.0, error=f"{type(e).__name__}: {e}"
+                    )
+                store.record(outcome)
+                outcomes.append(outcome)
+    except KeyboardInterrupt:
+        report.interrupted = True
+        logger.warning("Batch interrupted; unfinished items will resume on the next run.")
+    finally:
+        executor.shutdown(wait=not report.interrupted, cancel_futures=True)
+        store.release(in_flight.values())
+        store.close()
+
+    report.elapsed = time.perf_counter() - start
+    _summarize(report, outcomes)
+    return report
+
+
+def _summarize(report: BatchReport, outcomes: list[JobOutcome]) -> None:
+    report.attempted = len(outcomes)
+    report.succeeded = sum(1 for o in outcomes if o.ok)
+    report.failed = report.attempted - report.succeeded
+    report.failures = [o for o in outcomes if not o.ok]
+
+    by_type: dict[str, list[float]] = {}
+    for outcome in outcomes:
+        if outcome.ok:
+            by_type.setdefault(outcome.source_type or "unknown", []).append(
+                outcome.seconds
+            )
+    for source_type, seconds in sorted(by_type.items()):
+        seconds.sort()
+        report.latency.append(
+            SourceTypeLatency(
+                source_type=source_type,
+                count=len(seconds),
+                mean=statistics.fmean(seconds),
+                p50=_percentile(seconds, 0.50),
+                p95=_percentile(seconds, 0.95),
+                max=seconds[-1],
+            )
+        )
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, round(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def print_batch_report(report: BatchReport, max_failures: int = 10) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    status = "[yellow]interrupted[/yellow]" if report.interrupted else "[green]complete[/green]"
+    console.print(f"Batch {report.manifest} {status} (jobs: {report.job_db})")
+    console.print(
+        f"{report.succeeded} succeeded, {report.failed} failed, "
+        f"{report.skipped} already done; {report.elapsed:.1f}s, "
+        f"{report.throughput:.2f} items/s"
+    )
+
+    if report.latency:
+        table = Table(title="Latency by source type (seconds)")
+        for column in ("Source type", "Count", "Mean", "p50", "p95", "Max"):
+            table.add_column(column, justify="left" if column == "Source type" else "right")
+        for row in report.latency:
+            table.add_row(
+                row.source_type,
+                str(row.count),
+                f"{row.mean:.2f}",
+                f"{row.p50:.2f}",
+                f"{row.p95:.2f}",
+                f"{row.max:.2f}",
+            )
+        console.print(table)
+
+    if report.failures:
+        table = Table(title=f"Failures (first {max_failures})")
+        table.add_column("Source")
+        table.add_column("Error")
+        for outcome in report.failures[:max_failures]:
+            table.add_row(outcome.source, outcome.error or "")
+        console.print(table)
@@ -0,0 +1,108 @@
+"""
+Constant-time routing of a source string to its parser.
+
+`SourceParser` used to call `can_handle` on every registered parser in registry order; file-based parsers each stat the path and `ArticleParser` scans a domain list, so every source paid for every parser. `DispatchIndex` is built once at startup from optional routing hints that parsers declare as class attributes:
+
+- `dispatch_hosts`: host suffixes the parser owns (e.g. `("youtube.com", "youtu.be")`), indexed for http and https.
+- `dispatch_url_fallback`: the parser takes any http(s) URL whose host is not indexed (ArticleParser).
+- `dispatch_extension_categories`: keys of `siphon_api.file_types.EXTENSIONS` the parser accepts; reversed into an extension → parser map.
+
+Routing a URL walks the host's suffixes (`www.youtube.com`, `youtube.com`, `com`), one dict lookup each; routing a path is one dict lookup on its extension. The chosen parser's `can_handle` still has the final word, so at most one parser stats the file. When two parsers claim the same key, the one whose `SourceType` is declared first wins, independent of registry file order. Parsers without hints are scanned linearly after an index miss, so a freshly scaffolded source works before it declares any.
+
+Usage:
+```python
+index = DispatchIndex([YouTubeParser(), ArticleParser(), DocParser()])
+parser = index.route("https://youtu.be/dQw4w9WgXcQ")  # -> YouTubeParser instance
+```
+"""
+
+from siphon_api.interfaces import ParserStrategy
+from siphon_api.file_types import EXTENSIONS
+from siphon_api.enums import SourceType
+from urllib.parse import urlsplit
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+URL_SCHEMES = ("http", "https")
+_TYPE_ORDER = {source_type: position for position, source_type in enumerate(SourceType)}
+
+
+class DispatchIndex:
+    """
+    Hash-based source → parser routing built from parser routing hints.
+    """
+
+    def __init__(self, parsers: list[ParserStrategy]):
+        ordered = sorted(
+            parsers, key=lambda p: _TYPE_ORDER.get(p.source_type, len(_TYPE_ORDER))
+        )
+        self.hosts: dict[tuple[str, str], ParserStrategy] = {}
+        self.extensions: dict[str, ParserStrategy] = {}
+        self.url_fallback: ParserStrategy | None = None
+        self.unindexed: list[ParserStrategy] = []
+
+        for parser in ordered:
+            hosts = getattr(parser, "dispatch_hosts", ())
+            categories = getattr(parser, "dispatch_extension_categories", ())
+            fallback = getattr(parser, "dispatch_url_fallback", False)
+            if not (hosts or categories or fallback):
+                self.unindexed.append(parser)
+                continue
+            for host in hosts:
+                for scheme in URL_SCHEMES:
+                    self._claim(self.hosts, (scheme, host.lower()), parser)
+            for category in categories:
+                for extension in EXTENSIONS[category]:
+                    self._claim(self.extensions, extension, parser)
+            if fallback:
+                if self.url_fallback is None:
+                    self.url_fallback = parser
+                else:
+                    logger.warning(
+                        f"URL fallback already owned by {type(self.url_fallback).__name__}; "
+                        f"ignoring {type(parser).__name__}."
+                    )
+
+    @staticmethod
+    def _claim(table: dict, key, parser: ParserStrategy) -> None:
+        owner = table.get(key)
+        if owner is None:
+            table[key] = parser
+        elif owner is not parser:
+            logger.debug(
+                f"Dispatch key {key!r} claimed by {type(owner).__name__}; "
+                f"{type(parser).__name__} has lower priority."
+            )
+
+    def candidate(self, source: str) -> ParserStrategy | None:
+        """
+        Index lookup only: the parser that should handle source, unconfirmed.
+        """
+        scheme, sep, rest = source.partition("://")
+        if sep:
+            scheme = scheme.lower()
+            if scheme not in URL_SCHEMES:
+                return None
+            host = (urlsplit(source).hostname or "").lower()
+            while host:
+                parser = self.hosts.get((scheme, host))
+                if parser is not None:
+                    return parser
+                _, _, host = host.partition(".")
+            return self.url_fallback
+        extension = os.path.splitext(source)[1].lower()
+        return self.extensions.get(extension)
+
+    def route(self, source: str) -> ParserStrategy | None:
+        """
+        Return the parser for source, or None if no parser accepts it.
+        """
+        parser = self.candidate(source)
+        if parser is not None and parser.can_handle(source=source):
+            return parser
+        for parser in self.unindexed:
+            if parser.can_handle(source=source):
+                return parser
+        return None
@@ -0,0 +1,192 @@
+"""
+Process-wide pooled HTTP clients.
+
+Extractors and service clients used to open a fresh `httpx.Client` per call, so every article fetch, diarization upload and image generation paid for DNS, TCP and TLS again and no connection was ever reused. `HttpClients` owns one `httpx.Client` per process and one `httpx.AsyncClient` per event loop, shared by every caller:
+
+- connections are kept alive (`http_keepalive_expiry`) and negotiated as HTTP/2 where the server supports it (`http2`, needs the `h2` package; otherwise HTTP/1.1),
+- the pool is bounded (`http_max_connections`, `http_max_keepalive`) and each host gets at most `http_per_host` requests in flight, so one slow domain can't take the whole pool,
+- `http_connect_timeout` / `http_timeout` are the defaults; a call can pass its own `timeout=` (the diarization and image services do).
+
+A forked child starts with no clients, so pooled sockets are never shared across processes.
+
+Usage:
+```python
+from siphon_server.core.http_client import HTTP
+
+response = HTTP.request("GET", url, follow_redirects=True)
+response = await HTTP.request_async("POST", url, json=payload, timeout=300.0)
+```
+"""
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+import weakref
+import threading
+import asyncio
+import os
+import logging
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClients:
+    """
+    One pooled sync client, one pooled async client per event loop, and per-host
+    request slots for both. Clients are created on first use.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive: int | None = None,
+        keepalive_expiry: float | None = None,
+        per_host: int | None = None,
+        connect_timeout: float | None = None,
+        timeout: float | None = None,
+        http2: bool | None = None,
+        transport: "httpx.BaseTransport | httpx.AsyncBaseTransport | None" = None,
+    ):
+        from siphon_server.config import settings
+
+        self.max_connections = max_connections or settings.http_max_connections
+        self.max_keepalive = max_keepalive or settings.http_max_keepalive
+        self.keepalive_expiry = keepalive_expiry or settings.http_keepalive_expiry
+        self.per_host = per_host or settings.http_per_host
+        self.connect_timeout = connect_timeout or settings.http_connect_timeout
+        self.timeout = timeout or settings.http_timeout
+        self.http2 = settings.http2 if http2 is None else http2
+        if self.http2 and find_spec("h2") is None:
+            logger.warning("http2 is enabled but h2 is not installed; using HTTP/1.1.")
+            self.http2 = False
+        self._transport = transport  # Tests inject httpx.MockTransport
+        self._lock = threading.Lock()
+        self._client: "httpx.Client | None" = None
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, "httpx.AsyncClient"
+        ] = weakref.WeakKeyDictionary()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._async_host_slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        ref = weakref.ref(self)
+        os.register_at_fork(after_in_child=lambda: (clients := ref()) and clients._forget())
+
+    def _options(self) -> dict:
+        import httpx
+
+        options = {
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(self.timeout, connect=self.connect_timeout),
+        }
+        if self._transport is not None:
+            options["transport"] = self._transport
+        return options
+
+    @property
+    def client(self) -> "httpx.Client":
+        """The shared sync client."""
+        client = self._client
+        if client is None:
+            import httpx
+
+            with self._lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client(**self._options())
+                    logger.debug(
+                        f"Created HTTP client (http2={self.http2}, "
+                        f"{self.max_connections} connections, {self.per_host} per host)."
+                    )
+        return client
+
+    def async_client(self) -> "httpx.AsyncClient":
+        """The shared async client of the running event loop."""
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = httpx.AsyncClient(**self._options())
+        return client
+
+    @contextmanager
+    def host_slot(self, url: "str | httpx.URL") -> Iterator[None]:
+        """Hold one of the host's request slots (blocking)."""
+        host = _host(url)
+        with self._lock:
+            semaphore = self._host_slots.get(host)
+            if semaphore is None:
+                semaphore = self._host_slots[host] = threading.BoundedSemaphore(
+                    self.per_host
+                )
+        with semaphore:
+            yield
+
+    @asynccontextmanager
+    async def host_slot_async(self, url: "str | httpx.URL") -> AsyncIterator[None]:
+        """Hold one of the host's request slots on the running loop."""
+        host = _host(url)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._async_host_slots.setdefault(loop, {})
+            semaphore = semaphores.get(host)
+            if semaphore is None:
+                semaphore = semaphores[host] = asyncio.Semaphore(self.per_host)
+        async with semaphore:
+            yield
+
+    def request(self, method: str, url: "str | httpx.URL", **kwargs) -> "httpx.Response":
+        """`httpx.Client.request` on the shared client, within the host's slots."""
+        with self.host_slot(url):
+            return self.client.request(method, url, **kwargs)
+
+    async def request_async(
+        self, method: str, url: "str | httpx.URL", **kwargs
+    ) -> "httpx.Response":
+        """`httpx.AsyncClient.request` on the loop's shared client, within the host's slots."""
+        async with self.host_slot_async(url):
+            return await self.async_client().request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """Close the sync client; the next request opens a new one."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client."""
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _forget(self) -> None:
+        # After fork: the parent's sockets and locks are not ours to use
+        self._lock = threading.Lock()
+        self._client = None
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._host_slots = {}
+        self._async_host_slots = weakref.WeakKeyDictionary()
+
+
+def _host(url: "str | httpx.URL") -> str:
+    import httpx
+
+    url = httpx.URL(url)
+    return f"{url.scheme}://{url.netloc.decode('ascii')}"
+
+
+# Singleton
+HTTP = HttpClients()
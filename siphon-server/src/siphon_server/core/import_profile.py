@@ -0,0 +1,111 @@
+"""
+Cold-start import profile for siphon-server.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter (so nothing is already in `sys.modules`) and aggregates the stderr report into the slowest modules by cumulative import time. Used by `siphon-server --import-profile` to keep the pipeline import well under a second: parsers, the dispatch index and the ORM load eagerly; extractors, enrichers, conduit, yt_dlp, markitdown and the Postgres engine load on first use.
+
+Usage:
+```python
+from siphon_server.core.import_profile import profile_imports
+
+profile = profile_imports("siphon_server.core.pipeline")
+print(profile.total_seconds, profile.top(10))
+```
+"""
+
+from dataclasses import dataclass, field
+import subprocess
+import time
+import sys
+import re
+
+DEFAULT_MODULE = "siphon_server.core.pipeline"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S.*)$")
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    module: str
+    wall_seconds: float
+    records: list[ImportRecord] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        """Cumulative import time of the target module itself."""
+        for record in reversed(self.records):
+            if record.module == self.module:
+                return record.cumulative_us / 1e6
+        return sum(r.self_us for r in self.records) / 1e6
+
+    def top(self, n: int = 20) -> list[ImportRecord]:
+        """The n modules with the largest cumulative import time."""
+        return sorted(self.records, key=lambda r: r.cumulative_us, reverse=True)[:n]
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """
+    Parse `-X importtime` output; the header line and unrelated stderr are skipped.
+    """
+    records: list[ImportRecord] = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(
+                    module=module.strip(),
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                    depth=(len(indent) - 1) // 2,
+                )
+            )
+    return records
+
+
+def profile_imports(module: str = DEFAULT_MODULE) -> ImportProfile:
+    """
+    Import module in a fresh interpreter and return its import profile.
+    Raises RuntimeError if the import fails.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    wall_seconds = time.perf_counter() - start
+    if completed.returncode != 0:
+        tail = completed.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"Importing {module} failed: {tail[0]}")
+    return ImportProfile(
+        module=module, wall_seconds=wall_seconds, records=parse_importtime(completed.stderr)
+    )
+
+
+def print_import_profile(profile: ImportProfile, n: int = 20) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=f"Import profile: {profile.module}")
+    table.add_column("Module")
+    table.add_column("Cumulative (ms)", justify="right")
+    table.add_column("Self (ms)", justify="right")
+    for record in profile.top(n):
+        table.add_row(
+            record.module,
+            f"{record.cumulative_us / 1000:.1f}",
+            f"{record.self_us / 1000:.1f}",
+        )
+    console = Console()
+    console.print(table)
+    console.print(
+        f"Total import time: {profile.total_seconds * 1000:.1f} ms "
+        f"(interpreter wall time {profile.wall_seconds * 1000:.1f} ms)"
+    )
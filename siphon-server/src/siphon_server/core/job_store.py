@@ -0,0 +1,137 @@
+"""
+Durable per-item state for `siphon-server batch` runs.
+
+One SQLite file per manifest holds a `jobs` row per source with its status (`pending`, `running`, `done`, `failed`), the parsed URI and source type, the error text of the last failure, the latency of the last attempt and an attempt count. Re-running the same manifest picks up where the last run stopped: sources already `done` are skipped, rows left `running` by a crash or Ctrl-C go back to `pending`, and `failed` rows are retried only on request. Only the coordinating process writes to the store; workers report results back to it.
+
+Location: $XDG_DATA_HOME/siphon/batch/<manifest name>-<path digest>.db, unless given explicitly.
+"""
+
+from xdg_base_dirs import xdg_data_home
+from dataclasses import dataclass
+from collections.abc import Iterable
+from pathlib import Path
+import hashlib
+import sqlite3
+import time
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    source TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    uri TEXT,
+    source_type TEXT,
+    error TEXT,
+    seconds REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, position);
+"""
+
+
+@dataclass
+class JobOutcome:
+    source: str
+    ok: bool
+    seconds: float
+    uri: str | None = None
+    source_type: str | None = None
+    error: str | None = None
+
+
+def default_job_db(manifest: Path) -> Path:
+    """Job database for a manifest, stable across runs from any working directory."""
+    resolved = manifest.expanduser().resolve()
+    digest = hashlib.sha256(str(resolved).encode()).hexdigest()[:8]
+    return Path(xdg_data_home()) / "siphon" / "batch" / f"{resolved.name}-{digest}.db"
+
+
+class JobStore:
+    """
+    SQLite job table for one manifest. Not shared across processes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._con = sqlite3.connect(path)
+        self._con.executescript(_SCHEMA)
+
+    def add(self, sources: Iterable[str]) -> int:
+        """Register sources as pending (existing rows are untouched). Returns rows added."""
+        now = time.time()
+        before = self._con.total_changes
+        start = self._con.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM jobs")
+        position = start.fetchone()[0]
+        with self._con:
+            for offset, source in enumerate(sources):
+                self._con.execute(
+                    "INSERT OR IGNORE INTO jobs (source, position, status, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (source, position + offset, PENDING, now),
+                )
+        return self._con.total_changes - before
+
+    def recover(self, retry_failed: bool = False) -> int:
+        """Return interrupted (and optionally failed) jobs to pending. Returns rows reset."""
+        statuses = (RUNNING, FAILED) if retry_failed else (RUNNING,)
+        placeholders = ", ".join("?" for _ in statuses)
+        with self._con:
+            cursor = self._con.execute(
+                f"UPDATE jobs SET status = ? WHERE status IN ({placeholders})",
+                (PENDING, *statuses),
+            )
+        return cursor.rowcount
+
+    def pending(self) -> list[str]:
+        rows = self._con.execute(
+            "SELECT source FROM jobs WHERE status = ? ORDER BY position", (PENDING,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def mark_running(self, source: str) -> None:
+        with self._con:
+            self._con.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE source = ?",
+                (RUNNING, time.time(), source),
+            )
+
+    def record(self, outcome: JobOutcome) -> None:
+        with self._con:
+            self._con.execute(
+                "UPDATE jobs SET status = ?, uri = ?, source_type = ?, error = ?, "
+                "seconds = ?, updated_at = ? WHERE source = ?",
+                (
+                    DONE if outcome.ok else FAILED,
+                    outcome.uri,
+                    outcome.source_type,
+                    outcome.error,
+                    outcome.seconds,
+                    time.time(),
+                    outcome.source,
+                ),
+            )
+
+    def release(self, sources: Iterable[str]) -> None:
+        """Put sources that were handed out but never finished back to pending."""
+        with self._con:
+            self._con.executemany(
+                "UPDATE jobs SET status = ? WHERE source = ? AND status = ?",
+                [(PENDING, source, RUNNING) for source in sources],
+            )
+
+    def counts(self) -> dict[str, int]:
+        rows = self._con.execute(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+        ).fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self) -> None:
+        self._con.close()
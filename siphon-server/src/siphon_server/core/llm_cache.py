@@ -0,0 +1,29 @@
+"""
+Process-wide conduit response cache.
+
+Every enricher used to build its own `ConduitCache(name="siphon")` at import time and assign it to `ModelAsync.conduit_cache`, so importing any enricher opened the cache and the last import won. `install_conduit_cache()` does this once, on first enricher construction, and is safe to call from every enricher `__init__` and from concurrent threads.
+"""
+
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_cache = None
+
+
+def install_conduit_cache(name: str = "siphon"):
+    """
+    Create the shared ConduitCache and attach it to ModelAsync (idempotent).
+    """
+    global _cache
+    if _cache is None:
+        with _lock:
+            if _cache is None:
+                from conduit.batch import ModelAsync, ConduitCache
+
+                _cache = ConduitCache(name=name)
+                ModelAsync.conduit_cache = _cache
+                logger.debug(f"Installed conduit cache: {name}")
+    return _cache
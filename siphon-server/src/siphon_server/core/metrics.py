@@ -0,0 +1,250 @@
+"""
+Pipeline metrics: per-stage latency histograms and cache hit/miss counters.
+
+Every pipeline step (parse, lookup, extract, tokenize, enrich, persist) is timed into a histogram labelled by stage and `SourceType`, and every cache consulted on the way (the repository check, the stage cache, the article fetch cache, the YouTube metadata and transcript caches) counts hits and misses. `METRICS` is the process-wide registry; the host application exposes it however it serves HTTP:
+
+- `METRICS.prometheus()` renders the Prometheus text exposition format (serve it on `/metrics`).
+- `METRICS.snapshot()` returns a `PipelineStats` with counts, means and bucket-interpolated p50/p95/p99 per (stage, source type), plus hit rates per cache.
+
+Per request, the pipeline also fills a `PipelineTrace` (stage → seconds, cache → hit) and attaches it to the returned `ProcessedContent.trace`. The trace being recorded is held in a context variable, so cache lookups deep inside strategies land on the right request without threading a parameter through every call.
+
+Usage:
+```python
+from siphon_server.core.metrics import METRICS
+
+stats = METRICS.snapshot()
+worst = max(stats.stages, key=lambda s: s.p99)
+print(worst.stage, worst.source_type, worst.p99)
+```
+"""
+
+from siphon_api.models import PipelineTrace
+from siphon_api.enums import SourceType
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from collections.abc import Iterator
+import bisect
+import threading
+import time
+
+# Upper bounds in seconds: sub-ms parses up to multi-minute transcriptions
+BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+UNKNOWN = "unknown"
+
+CURRENT_TRACE: ContextVar[PipelineTrace | None] = ContextVar(
+    "siphon_current_trace", default=None
+)
+
+
+@dataclass
+class StageStats:
+    stage: str
+    source_type: str
+    count: int
+    total_seconds: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+
+
+@dataclass
+class CacheStats:
+    cache: str
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class PipelineStats:
+    """Point-in-time copy of all pipeline metrics."""
+
+    stages: list[StageStats] = field(default_factory=list)
+    caches: list[CacheStats] = field(default_factory=list)
+
+    def stage(self, stage: str, source_type: str) -> StageStats | None:
+        for stats in self.stages:
+            if stats.stage == stage and stats.source_type == source_type:
+                return stats
+        return None
+
+    def cache(self, cache: str) -> CacheStats | None:
+        for stats in self.caches:
+            if stats.cache == cache:
+                return stats
+        return None
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "total")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def quantile(self, q: float) -> float:
+        """Linear interpolation inside the bucket holding the q-th observation."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = BUCKETS[i - 1] if i > 0 else 0.0
+                upper = BUCKETS[i] if i < len(BUCKETS) else BUCKETS[-1]
+                return lower + (upper - lower) * ((rank - seen) / n)
+            seen += n
+        return BUCKETS[-1]
+
+
+class PipelineMetrics:
+    """
+    Thread-safe registry of stage histograms and cache counters.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str], _Histogram] = {}
+        self._caches: dict[str, list[int]] = {}  # cache -> [hits, misses]
+
+    # Recording
+    def observe(
+        self, stage: str, source_type: SourceType | str | None, seconds: float
+    ) -> None:
+        key = (stage, getattr(source_type, "value", source_type) or UNKNOWN)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """
+        Time the block into the histogram for (stage, current trace's source type),
+        and into the current trace if one is active. Failed stages are timed too.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            trace = CURRENT_TRACE.get()
+            source_type = trace.source_type if trace is not None else None
+            self.observe(stage, source_type, elapsed)
+            if trace is not None:
+                trace.timings[stage] = trace.timings.get(stage, 0.0) + elapsed
+
+    def cache(self, cache: str, hit: bool) -> None:
+        """Count one lookup against cache; also noted on the current trace."""
+        with self._lock:
+            counters = self._caches.setdefault(cache, [0, 0])
+            counters[0 if hit else 1] += 1
+        trace = CURRENT_TRACE.get()
+        if trace is not None:
+            trace.cache_hits[cache] = hit
+
+    # Export
+    def snapshot(self) -> PipelineStats:
+        with self._lock:
+            stages = [
+                StageStats(
+                    stage=stage,
+                    source_type=source_type,
+                    count=h.count,
+                    total_seconds=h.total,
+                    mean=h.total / h.count if h.count else 0.0,
+                    p50=h.quantile(0.50),
+                    p95=h.quantile(0.95),
+                    p99=h.quantile(0.99),
+                )
+                for (stage, source_type), h in sorted(self._histograms.items())
+            ]
+            caches = [
+                CacheStats(cache=cache, hits=hits, misses=misses)
+                for cache, (hits, misses) in sorted(self._caches.items())
+            ]
+        return PipelineStats(stages=stages, caches=caches)
+
+    def prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (v0.0.4)."""
+        lines = [
+            "# HELP siphon_stage_duration_seconds Duration of pipeline stages.",
+            "# TYPE siphon_stage_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (stage, source_type), h in sorted(self._histograms.items()):
+                labels = f'stage="{stage}",source_type="{source_type}"'
+                cumulative = 0
+                for bound, n in zip((*BUCKETS, float("inf")), h.counts):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(
+                        f'siphon_stage_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}'
+                    )
+                lines.append(f"siphon_stage_duration_seconds_sum{{{labels}}} {h.total}")
+                lines.append(f"siphon_stage_duration_seconds_count{{{labels}}} {h.count}")
+            lines.append(
+                "# HELP siphon_cache_requests_total Cache lookups by cache and result."
+            )
+            lines.append("# TYPE siphon_cache_requests_total counter")
+            for cache, (hits, misses) in sorted(self._caches.items()):
+                lines.append(
+                    f'siphon_cache_requests_total{{cache="{cache}",result="hit"}} {hits}'
+                )
+                lines.append(
+                    f'siphon_cache_requests_total{{cache="{cache}",result="miss"}} {misses}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded metrics. Mainly for tests."""
+        with self._lock:
+            self._histograms.clear()
+            self._caches.clear()
+
+
+@contextmanager
+def tracing(trace: PipelineTrace | None = None) -> Iterator[PipelineTrace]:
+    """
+    Make trace (or a new one) the current trace for the duration of the block.
+    """
+    trace = trace if trace is not None else PipelineTrace()
+    token = CURRENT_TRACE.set(trace)
+    try:
+        yield trace
+    finally:
+        CURRENT_TRACE.reset(token)
+
+
+# Singleton
+METRICS = PipelineMetrics()
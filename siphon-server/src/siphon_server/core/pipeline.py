@@ -1,20 +1,49 @@
 from siphon_api.models import (
     ProcessedContent,
+    PipelineTrace,
     SourceInfo,
     ContentData,
     EnrichedData,
     PipelineClass,
 )
-from siphon_api.enums import ActionType
+from siphon_api.enums import ActionType, ResourceClass
+from siphon_api.errors import SiphonServerError
+from siphon_api.api.siphon_search import (
+    SiphonRelatedRequest,
+    SiphonRelatedResponse,
+    SiphonSearchRequest,
+    SiphonSearchResponse,
+)
 from siphon_api.interfaces import (
     ParserStrategy,
     ExtractorStrategy,
     EnricherStrategy,
 )
-from siphon_server.database.postgres.repository import ContentRepository
+from siphon_server.core.async_adapters import (
+    as_async_parser,
+    run_sync,
+)
+from siphon_server.core.strategies import LIFECYCLE
+from siphon_server.core.dispatch import DispatchIndex
+from siphon_server.core.stage_cache import STAGE_CACHE, content_hash, strategy_version
+from siphon_server.core.single_flight import FLIGHTS
+from siphon_server.core.metrics import METRICS, CURRENT_TRACE, tracing
+from siphon_server.core.scheduler import (
+    SCHEDULER,
+    EXTRACTOR_DEFAULT,
+    ENRICHER_DEFAULT,
+    resource_class_of,
+)
+from siphon_server.core.batch import BatchItem, BatchResult, Stage, run_stages
+from siphon_server.core.process_pool import PROCESS_POOL
+from siphon_server.database.backend import get_repository
 from siphon_server.sources.registry import load_registry, generate_registry
 from siphon_server.config import load_settings
 from siphon_api.enums import SourceType
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from importlib import import_module
+from typing import TypeVar
+import asyncio
 import time
 
 import logging
@@ -24,9 +53,14 @@ logger = logging.getLogger(__name__)
 # generate_registry()  # We will remove this in production
 
 REGISTRY: list[str] = load_registry()
-REPOSITORY = ContentRepository()
+REPOSITORY = get_repository()  # repository_backend setting: postgres or sqlite
+EMBEDDINGS = None  # EmbeddingStore, created on first find_related (imports pgvector)
 SETTINGS = load_settings()
 PREFERRED_MODEL = SETTINGS.default_model
+_STRATEGY_CLASSES: dict[tuple[SourceType, str], type] = {}
+LEASE_POLL = 0.5  # Seconds between re-checks while another process holds a work lease
+
+T = TypeVar("T")
 
 
 class SourceParser:
@@ -37,6 +71,7 @@ class SourceParser:
     def __init__(self):
         logger.debug("Initializing SourceParser and loading parsers.")
         self.parsers: list[ParserStrategy] = self._find_parser()
+        self.index = DispatchIndex([LIFECYCLE.get(parser) for parser in self.parsers])
 
     def _find_parser(self) -> list[ParserStrategy]:
         """
@@ -62,14 +97,49 @@ class SourceParser:
                 parsers.append(parser)
         return parsers
 
+    def _route(self, source: str) -> ParserStrategy:
+        parser_obj = self.index.route(source)
+        if parser_obj is None:
+            raise ValueError(f"No parser found for source: {source}")
+        logger.info(f"Using parser {type(parser_obj).__name__} for source: {source}")
+        return parser_obj
+
     def execute(self, source: str) -> SourceInfo:
         logger.debug(f"Executing SourceParser for source: {source}")
-        for parser in self.parsers:
-            parser_obj = parser()
-            if parser_obj.can_handle(source=source):
-                logger.info(f"Using parser {parser.__name__} for source: {source}")
-                return parser_obj.parse(source=source)
-        raise ValueError(f"No parser found for source: {source}")
+        return self._route(source).parse(source=source)
+
+    async def execute_async(self, source: str) -> SourceInfo:
+        logger.debug(f"Executing SourceParser (async) for source: {source}")
+        return await as_async_parser(self._route(source)).parse_async(source=source)
+
+
+def _load_strategy(source_type: SourceType, kind: str) -> type | None:
+    """
+    Import `siphon_server.sources.<type>.<kind>` and return its `<Type><Kind>` class.
+    Returns None if the source type is not registered or the module lacks the class.
+    """
+    if source_type.value not in REGISTRY:
+        return None
+    strategy_class = _STRATEGY_CLASSES.get((source_type, kind))
+    if strategy_class is None:
+        module = import_module(f"siphon_server.sources.{source_type.value.lower()}.{kind}")
+        strategy_class = getattr(module, source_type.value + kind.capitalize(), None)
+        if strategy_class is not None:
+            logger.info(f"Loaded {kind} for source type: {source_type.value}")
+            _STRATEGY_CLASSES[(source_type, kind)] = strategy_class
+    return strategy_class
+
+
+def _load_all(kind: str) -> list:
+    """
+    Import the `kind` strategy of every registered source type.
+    """
+    strategies = []
+    for source_type in REGISTRY:
+        strategy_class = _load_strategy(SourceType[source_type.upper()], kind)
+        if strategy_class is not None:
+            strategies.append(strategy_class)
+    return strategies
 
 
 class ContentExtractor:
@@ -78,44 +148,74 @@ class ContentExtractor:
     """
 
     def __init__(self):
-        logger.debug("Initializing ContentExtractor and loading extractors.")
-        self.extractors: list[ExtractorStrategy] = self._find_extractor()
+        # Extractors are imported on first use per source type, so a process that only
+        # ever sees articles never imports yt_dlp or markitdown.
+        logger.debug("Initializing ContentExtractor; extractors load on demand.")
+
+    @property
+    def extractors(self) -> list[type[ExtractorStrategy]]:
+        """
+        Every registered extractor class; importing them all (used by warmup).
+        """
+        return _load_all("extractor")
+
+    def _route(self, source_type: SourceType) -> ExtractorStrategy:
+        extractor = _load_strategy(source_type, "extractor")
+        if extractor is None:
+            raise ValueError(f"No extractor found for source type: {source_type}")
+        logger.info(
+            f"Using extractor {extractor.__name__} for source type: {source_type}"
+        )
+        return LIFECYCLE.get(extractor)
 
-    def _find_extractor(self) -> list[ExtractorStrategy]:
+    def version(self, source_type: SourceType) -> str:
         """
-        Cycle through all registered source types and dynamically load their extractors.
+        Stage cache version of the extractor for source_type, as configured (e.g. the
+        article HTML backend).
         """
-        logger.debug("Finding extractors for registered source types.")
+        extractor = _load_strategy(source_type, "extractor")
+        if extractor is None:
+            raise ValueError(f"No extractor found for source type: {source_type}")
+        return strategy_version(LIFECYCLE.get(extractor))
 
-        def _load_extractor(source_type: str) -> ExtractorStrategy | None:
-            module = __import__(
-                f"siphon_server.sources.{source_type.lower()}.extractor",
-                fromlist=[""],
-            )
-            extractor_class_name = source_type + "Extractor"
-            extractor_class = getattr(module, extractor_class_name, None)
-            return extractor_class
+    def needs_refresh(self, source_info: SourceInfo) -> bool:
+        """
+        Whether cached output for source_info (stage cache, repository) is stale, by the
+        extractor's optional `needs_refresh` hook; e.g. ArticleExtractor's max age and
+        revalidate mode. Extractors without the hook are never stale.
+        """
+        extractor = _load_strategy(source_info.source_type, "extractor")
+        if extractor is None or not hasattr(extractor, "needs_refresh"):
+            return False
+        return LIFECYCLE.get(extractor).needs_refresh(source_info)
 
-        extractors: list[ExtractorStrategy] = []
-        for source_type in REGISTRY:
-            extractor = _load_extractor(SourceType[source_type.upper()])
-            if extractor:
-                logger.info(f"Loaded extractor for source type: {source_type}")
-                extractors.append(extractor)
-        return extractors
+    def resource_class(self, source_type: SourceType) -> ResourceClass:
+        """
+        Resource class the extractor for source_type is scheduled under.
+        """
+        extractor = _load_strategy(source_type, "extractor")
+        return resource_class_of(extractor, EXTRACTOR_DEFAULT)
 
     def execute(self, source_info: SourceInfo) -> ContentData:
         logger.debug(
             f"Executing ContentExtractor for source type: {source_info.source_type}"
         )
-        source_type = source_info.source_type
-        for extractor in self.extractors:
-            if extractor.source_type == source_type:
-                logger.info(
-                    "Using extractor {extractor.__name__} for source type: {source_type}"
-                )
-                extractor_obj = extractor()
-                return extractor_obj.extract(source=source_info)
+        extractor_obj = self._route(source_info.source_type)
+        resource_class = resource_class_of(extractor_obj, EXTRACTOR_DEFAULT)
+        return SCHEDULER.run(resource_class, extractor_obj.extract, source=source_info)
+
+    async def execute_async(self, source_info: SourceInfo) -> ContentData:
+        logger.debug(
+            f"Executing ContentExtractor (async) for source type: {source_info.source_type}"
+        )
+        extractor_obj = self._route(source_info.source_type)
+        resource_class = resource_class_of(extractor_obj, EXTRACTOR_DEFAULT)
+        if hasattr(extractor_obj, "extract_async"):
+            async with SCHEDULER.slot(resource_class):
+                return await extractor_obj.extract_async(source=source_info)
+        return await SCHEDULER.run_async(
+            resource_class, extractor_obj.extract, source=source_info
+        )
 
 
 class ContentEnricher:
@@ -124,43 +224,96 @@ class ContentEnricher:
     """
 
     def __init__(self):
-        logger.debug("Initializing ContentEnricher and loading enrichers.")
-        self.enrichers: list[EnricherStrategy] = self._find_enricher()
+        # Enrichers pull in conduit and their prompt sets; defer until first use.
+        logger.debug("Initializing ContentEnricher; enrichers load on demand.")
 
-    def _find_enricher(self):
-        logger.debug("Finding enrichers for registered source types.")
+    @property
+    def enrichers(self) -> list[type[EnricherStrategy]]:
+        """
+        Every registered enricher class; importing them all (used by warmup).
+        """
+        return _load_all("enricher")
 
-        def _load_enricher(source_type: str) -> EnricherStrategy | None:
-            module = __import__(
-                f"siphon_server.sources.{source_type.lower()}.enricher",
-                fromlist=[""],
-            )
-            enricher_class_name = source_type + "Enricher"
-            enricher_class = getattr(module, enricher_class_name, None)
-            return enricher_class
+    def _route(self, source_type: SourceType) -> EnricherStrategy:
+        enricher = _load_strategy(source_type, "enricher")
+        if enricher is None:
+            raise ValueError(f"No enricher found for source type: {source_type}")
+        logger.info(f"Using enricher {enricher.__name__} for source type: {source_type}")
+        return LIFECYCLE.get(enricher)
 
-        enrichers: list[EnricherStrategy] = []
-        for source_type in REGISTRY:
-            enricher = _load_enricher(SourceType[source_type.upper()])
-            if enricher:
-                logger.info(f"Loaded enricher for source type: {source_type}")
-                enrichers.append(enricher)
-        return enrichers
+    def version(self, source_type: SourceType) -> str:
+        """
+        Stage cache version (enricher source + prompt set) for source_type.
+        """
+        enricher = _load_strategy(source_type, "enricher")
+        if enricher is None:
+            raise ValueError(f"No enricher found for source type: {source_type}")
+        return strategy_version(enricher)
+
+    def resource_class(self, source_type: SourceType) -> ResourceClass:
+        """
+        Resource class the enricher for source_type is scheduled under.
+        """
+        enricher = _load_strategy(source_type, "enricher")
+        return resource_class_of(enricher, ENRICHER_DEFAULT)
 
     def execute(
         self, content_data: ContentData, preferred_model: str = PREFERRED_MODEL
     ) -> EnrichedData:
         logger.debug("Executing ContentEnricher.")
-        source_type = content_data.source_type
-        for enricher in self.enrichers:
-            if enricher.source_type == source_type:
-                logger.info(
-                    "Using enricher {enricher.__name__} for source type: {source_type}"
-                )
-                enricher_obj = enricher()
-                return enricher_obj.enrich(
+        enricher_obj = self._route(content_data.source_type)
+        return SCHEDULER.run(
+            resource_class_of(enricher_obj, ENRICHER_DEFAULT),
+            enricher_obj.enrich,
+            content=content_data,
+            preferred_model=preferred_model,
+        )
+
+    async def execute_async(
+        self, content_data: ContentData, preferred_model: str = PREFERRED_MODEL
+    ) -> EnrichedData:
+        logger.debug("Executing ContentEnricher (async).")
+        enricher_obj = self._route(content_data.source_type)
+        resource_class = resource_class_of(enricher_obj, ENRICHER_DEFAULT)
+        if hasattr(enricher_obj, "enrich_async"):
+            async with SCHEDULER.slot(resource_class):
+                return await enricher_obj.enrich_async(
                     content=content_data, preferred_model=preferred_model
                 )
+        return await SCHEDULER.run_async(
+            resource_class,
+            enricher_obj.enrich,
+            content=content_data,
+            preferred_model=preferred_model,
+        )
+
+
+def _note_source_type(source_info: SourceInfo) -> None:
+    """Label the current trace (and so its stage timings) with the parsed source type."""
+    trace = CURRENT_TRACE.get()
+    if trace is not None:
+        trace.source_type = source_info.source_type
+
+
+def _with_trace(result: PipelineClass, trace: PipelineTrace) -> PipelineClass:
+    """Attach trace to a ProcessedContent result (a copy: results may be shared)."""
+    if isinstance(result, ProcessedContent):
+        return result.model_copy(update={"trace": trace})
+    return result
+
+
+def _traced(fn: Callable[[BatchItem], None]) -> Callable[[BatchItem], None]:
+    """Run a batch stage with the item's trace current; attach it to a final result."""
+
+    def stage(item: BatchItem) -> None:
+        if item.trace is None:
+            item.trace = PipelineTrace()
+        with tracing(item.trace):
+            fn(item)
+        if item.done:
+            item.result = _with_trace(item.result, item.trace)
+
+    return stage
 
 
 class SiphonPipeline:
@@ -181,6 +334,55 @@ class SiphonPipeline:
         self.extractor = ContentExtractor()
         self.enricher = ContentEnricher()
 
+    def warmup(self) -> dict[str, float]:
+        """
+        Build every registered strategy and start the conversion pool's workers now, so
+        the first request pays dispatch cost only. Returns per-strategy init time in seconds.
+        """
+        PROCESS_POOL.warm()
+        init_times = LIFECYCLE.warmup(
+            [
+                *self.parser.parsers,
+                *self.extractor.extractors,
+                *self.enricher.enrichers,
+            ]
+        )
+        logger.info(f"Warmed up {len(init_times)} strategies.")
+        return init_times
+
+    def search(self, request: SiphonSearchRequest) -> SiphonSearchResponse:
+        """
+        Full-text search over persisted content (`ContentRepository.search`): ranked
+        summaries with snippets, served from the GIN index on `search_vector`.
+        """
+        with METRICS.stage("search"):
+            results = REPOSITORY.search(
+                request.query, source_type=request.source_type, limit=request.limit
+            )
+        logger.info(f"Search {request.query!r}: {len(results)} results.")
+        return SiphonSearchResponse(query=request.query, results=results)
+
+    def find_related(self, request: SiphonRelatedRequest) -> SiphonRelatedResponse:
+        """
+        Semantic expansion (`Collection.expand`): content nearest to the seed URIs and/or
+        query in the pgvector store, via its HNSW index. Seeds need embeddings
+        (`siphon-server embed`) to count. Postgres backend only: raises SiphonServerError
+        on any other.
+        """
+        if SETTINGS.repository_backend != "postgres":
+            raise SiphonServerError(
+                "find_related needs the pgvector store, which only the Postgres backend "
+                f"has (repository_backend is {SETTINGS.repository_backend!r})."
+            )
+        from siphon_server.database.vector.pgvector import EmbeddingStore
+
+        global EMBEDDINGS
+        if EMBEDDINGS is None:
+            EMBEDDINGS = EmbeddingStore(repository=REPOSITORY)
+        with METRICS.stage("find_related"):
+            results = EMBEDDINGS.find_related(request.uris, request.query, request.k)
+        return SiphonRelatedResponse(results=results)
+
     def process(
         self,
         source: str,
@@ -194,60 +396,537 @@ class SiphonPipeline:
         Orchestrates a four-stage pipeline: parse source to SourceInfo, extract content
         to ContentData, enrich with LLM to EnrichedData, and assemble final ProcessedContent.
         Supports early termination at any stage via the action parameter. Optionally checks
-        the repository cache to avoid reprocessing duplicate URIs.
+        the repository cache to avoid reprocessing duplicate URIs. Extraction and enrichment
+        also resume from the stage cache (`core.stage_cache`), so e.g. re-enriching with a
+        different model never re-extracts; neither cache is read for a source its extractor
+        reports stale (`ContentExtractor.needs_refresh`, e.g. the article max age or the
+        `article_revalidate` setting). Concurrent calls for the same source share one
+        extraction, enrichment and write (`core.single_flight`); across processes, by a
+        work lease in the repository when the waiters can see the result (the repository,
+        or a stage cache on the same host), unless use_cache is False or the `work_leases`
+        setting is off.
 
         Returns:
         PipelineClass: One of SourceInfo, ContentData, EnrichedData, or ProcessedContent
         depending on action parameter. Cached ProcessedContent if use_cache=True
-        and URI already exists in repository.
+        and URI already exists in repository. A returned ProcessedContent carries this
+        request's per-stage timings in `trace`; aggregates go to `core.metrics.METRICS`.
         """
+        with tracing() as trace:
+            result = self._process(source, action, use_cache, preferred_model)
+        return _with_trace(result, trace)
+
+    def _process(
+        self,
+        source: str,
+        action: ActionType,
+        use_cache: bool,
+        preferred_model: str,
+    ) -> PipelineClass:
         # Step 1: Parse source
-        source_info = self.parser.execute(source)
-        logger.info(f"Parsed source info: {source_info}")
+        source_info = self._parse(source)
         if action == ActionType.PARSE:
             return source_info
 
         # Check repository
         if use_cache:
-            if REPOSITORY.exists(source_info.uri):
-                logger.info(
-                    f"Content already exists in repository for URI: {source_info.uri}"
-                )
-                existing_content: ProcessedContent | None = REPOSITORY.get(
-                    source_info.uri
-                )
-                if existing_content:
-                    match action:
-                        case ActionType.EXTRACT:
-                            return existing_content.content
-                        case ActionType.ENRICH:
-                            return existing_content.enrichment
-                        case ActionType.GULP:
-                            return existing_content
+            cached = self._lookup(source_info, action)
+            if cached is not None:
+                return cached
         else:
             logger.debug("Cache usage disabled; proceeding without repository check.")
 
         # Step 2: Extract content
-        content_data = self.extractor.execute(source_info)
-        logger.info(f"Extracted content data: {content_data}")
+        content_data = self._extract(source_info, use_cache)
         if action == ActionType.EXTRACT:
             return content_data
 
         # Step 3: Grab tokens (optional)
         if action == ActionType.TOKENIZE:
-            from siphon_server.core.count_tokens import count_tokens
+            return self._tokenize(content_data)
 
-            token_count = count_tokens(content_data)
-            content_data.token_count = token_count
+        # Step 4: Enrich with LLM
+        enriched_data = self._enrich(content_data, preferred_model, use_cache)
+        if action == ActionType.ENRICH:
+            return enriched_data
+
+        # Step 5: Assemble result and store in repository
+        assert action == ActionType.GULP, (
+            "Action must be GULP at this stage, suggests error in code."
+        )
+        return self._persist(source_info, content_data, enriched_data, use_cache)
+
+    def process_many(
+        self,
+        sources: Iterable[str],
+        action: ActionType = ActionType.GULP,
+        use_cache: bool = True,
+        preferred_model: str = PREFERRED_MODEL,
+        concurrency: int | dict[str, int] = 4,
+    ) -> Iterator[BatchResult]:
+        """
+        Process many sources concurrently, yielding a BatchResult per source as it completes.
+
+        Runs the same steps as `process`, but as overlapping stages (parse, lookup, extract,
+        enrich, persist) connected by bounded queues, so network-bound extraction and
+        LLM-bound enrichment of different sources run at the same time. `concurrency` is
+        either the worker count for every stage, or a mapping of stage name to worker count
+        (unlisted stages get one worker). Extract and enrich are instead split into one lane
+        per resource class (`core.scheduler`), each with that class's configured slots, so a
+        backlog of audio transcriptions never holds the workers articles need. Results arrive
+        in completion order; use `BatchResult.index` to recover input order. Failures are
+        reported on the result, never raised.
+        """
+
+        def parse(item: BatchItem) -> None:
+            item.source_info = self._parse(item.source)
+            if action == ActionType.PARSE:
+                item.result, item.done = item.source_info, True
+
+        def lookup(item: BatchItem) -> None:
+            cached = self._lookup(item.source_info, action)
+            if cached is not None:
+                item.result, item.done = cached, True
+
+        def extract(item: BatchItem) -> None:
+            item.content_data = self._extract(item.source_info, use_cache)
+            if action == ActionType.EXTRACT:
+                item.result, item.done = item.content_data, True
+            elif action == ActionType.TOKENIZE:
+                item.result, item.done = self._tokenize(item.content_data), True
+
+        def enrich(item: BatchItem) -> None:
+            item.enriched_data = self._enrich(
+                item.content_data, preferred_model, use_cache
+            )
+            if action == ActionType.ENRICH:
+                item.result, item.done = item.enriched_data, True
+
+        def persist(item: BatchItem) -> None:
+            item.result = self._persist(
+                item.source_info, item.content_data, item.enriched_data, use_cache
+            )
+            item.done = True
+
+        # Only build the stages this action can reach
+        steps: list[tuple[str, Callable[[BatchItem], None]]] = [("parse", parse)]
+        if action != ActionType.PARSE:
+            if use_cache:
+                steps.append(("lookup", lookup))
+            steps.append(("extract", extract))
+        if action in (ActionType.ENRICH, ActionType.GULP):
+            steps.append(("enrich", enrich))
+        if action == ActionType.GULP:
+            steps.append(("persist", persist))
+
+        if isinstance(concurrency, int):
+            workers = {name: concurrency for name, _ in steps}
+        else:
+            workers = {name: concurrency.get(name, 1) for name, _ in steps}
+        stages = [
+            Stage(name=name, fn=_traced(fn), workers=workers[name], **self._lanes(name))
+            for name, fn in steps
+        ]
+        queue_size = 2 * max(stage.workers for stage in stages)
+        logger.info(
+            f"Processing batch with stages: {[(s.name, s.workers) for s in stages]}"
+        )
+        yield from run_stages(sources, stages, queue_size=queue_size)
+
+    def _lanes(self, stage: str) -> dict:
+        """
+        Lane routing for the extract and enrich batch stages: one lane per resource class,
+        sized by the scheduler's slots for that class. Strategies are only imported as
+        items reach the stage, so a source type the batch never uses is never loaded.
+        """
+        if stage == "extract":
+            step = self.extractor
+
+            def resource_class(item: BatchItem) -> ResourceClass:
+                return step.resource_class(item.source_info.source_type)
+
+        elif stage == "enrich":
+            step = self.enricher
+
+            def resource_class(item: BatchItem) -> ResourceClass:
+                return step.resource_class(item.content_data.source_type)
+
+        else:
+            return {}
+        return {
+            "lane": lambda item: resource_class(item).value,
+            "lanes": {rc.value: SCHEDULER.slots(rc) for rc in ResourceClass},
+        }
+
+    async def process_async(
+        self,
+        source: str,
+        action: ActionType = ActionType.GULP,
+        use_cache: bool = True,
+        preferred_model: str = PREFERRED_MODEL,
+    ) -> PipelineClass:
+        """
+        Async twin of `process`, for callers that already run an event loop (ASGI).
+
+        Strategies implementing the async protocols are awaited directly; sync strategies
+        and repository calls are offloaded to the shared, bounded executor from
+        `core.async_adapters`, so many in-flight ingestions share a fixed set of threads.
+        """
+        with tracing() as trace:
+            result = await self._process_async(
+                source, action, use_cache, preferred_model
+            )
+        return _with_trace(result, trace)
+
+    async def _process_async(
+        self,
+        source: str,
+        action: ActionType,
+        use_cache: bool,
+        preferred_model: str,
+    ) -> PipelineClass:
+        # Step 1: Parse source
+        with METRICS.stage("parse"):
+            source_info = await self.parser.execute_async(source)
+            _note_source_type(source_info)
+        logger.info(f"Parsed source info: {source_info}")
+        if action == ActionType.PARSE:
+            return source_info
+
+        # Check repository
+        if use_cache:
+            cached = await run_sync(self._lookup, source_info, action)
+            if cached is not None:
+                return cached
+        else:
+            logger.debug("Cache usage disabled; proceeding without repository check.")
+
+        # Step 2: Extract content
+        with METRICS.stage("extract"):
+            content_data = await FLIGHTS.do_async(
+                ("extract", source_info.uri, use_cache),
+                self._extract_async,
+                source_info,
+                use_cache,
+            )
+        # Not the object itself: its repr would copy the whole text into the log line
+        logger.info(
+            f"Extracted {len(content_data.text)} characters from {source_info.uri}"
+        )
+        if action == ActionType.EXTRACT:
             return content_data
 
+        # Step 3: Grab tokens (optional)
+        if action == ActionType.TOKENIZE:
+            return await run_sync(self._tokenize, content_data)
+
         # Step 4: Enrich with LLM
-        enriched_data = self.enricher.execute(content_data, preferred_model)
+        with METRICS.stage("enrich"):
+            enriched_data = await FLIGHTS.do_async(
+                ("enrich", preferred_model, content_hash(content_data), use_cache),
+                self._enrich_async,
+                content_data,
+                preferred_model,
+                use_cache,
+            )
         logger.info(f"Enriched data: {enriched_data}")
         if action == ActionType.ENRICH:
             return enriched_data
 
-        # Step 5: Assemble result
+        # Step 5: Assemble result and store in repository
+        assert action == ActionType.GULP, (
+            "Action must be GULP at this stage, suggests error in code."
+        )
+        with METRICS.stage("persist"):
+            return await FLIGHTS.do_async(
+                ("persist", source_info.uri, use_cache),
+                run_sync,
+                self._persist_exclusive,
+                source_info,
+                content_data,
+                enriched_data,
+                use_cache,
+            )
+
+    # Pipeline steps, shared by process and process_many
+    def _parse(self, source: str) -> SourceInfo:
+        with METRICS.stage("parse"):
+            source_info = self.parser.execute(source)
+            _note_source_type(source_info)
+        logger.info(f"Parsed source info: {source_info}")
+        return source_info
+
+    def _lookup(
+        self, source_info: SourceInfo, action: ActionType
+    ) -> PipelineClass | None:
+        """
+        Return the cached artifact for this action, or None on a miss (or a stale hit).
+        """
+        if self.extractor.needs_refresh(source_info):
+            logger.info(f"Revalidating {source_info.uri}; skipping repository lookup.")
+            return None
+        with METRICS.stage("lookup"):
+            existing_content = REPOSITORY.get_or_none(source_info.uri)
+        METRICS.cache("repository", existing_content is not None)
+        if existing_content:
+            logger.info(
+                f"Content already exists in repository for URI: {source_info.uri}"
+            )
+            match action:
+                case ActionType.EXTRACT:
+                    return existing_content.content
+                case ActionType.ENRICH:
+                    return existing_content.enrichment
+                case ActionType.GULP:
+                    return existing_content
+        return None
+
+    def _extract(self, source_info: SourceInfo, use_cache: bool = True) -> ContentData:
+        with METRICS.stage("extract"):
+            content_data = FLIGHTS.do(
+                ("extract", source_info.uri, use_cache),
+                self._extract_exclusive,
+                source_info,
+                use_cache,
+            )
+        # Not the object itself: its repr would copy the whole text into the log line
+        logger.info(
+            f"Extracted {len(content_data.text)} characters from {source_info.uri}"
+        )
+        return content_data
+
+    def _extract_exclusive(
+        self, source_info: SourceInfo, use_cache: bool
+    ) -> ContentData:
+        version = self.extractor.version(source_info.source_type)
+        readable = self._reads_content(source_info, use_cache)
+
+        def extract() -> ContentData:
+            content_data = self.extractor.execute(source_info)
+            self._store_content(source_info, version, content_data)
+            return content_data
+
+        return self._exclusive(
+            f"extract:{STAGE_CACHE.scope}:{source_info.uri}",
+            lambda: self._cached_content(source_info, version, readable),
+            extract,
+            readable,
+        )
+
+    async def _extract_async(
+        self, source_info: SourceInfo, use_cache: bool
+    ) -> ContentData:
+        version = self.extractor.version(source_info.source_type)
+        readable = await run_sync(self._reads_content, source_info, use_cache)
+
+        async def extract() -> ContentData:
+            content_data = await self.extractor.execute_async(source_info)
+            await run_sync(self._store_content, source_info, version, content_data)
+            return content_data
+
+        return await self._exclusive_async(
+            f"extract:{STAGE_CACHE.scope}:{source_info.uri}",
+            lambda: self._cached_content(source_info, version, readable),
+            extract,
+            readable,
+        )
+
+    def _tokenize(self, content_data: ContentData) -> ContentData:
+        from siphon_server.core.count_tokens import count_tokens
+
+        # A copy: content_data may be shared (a flight's result, the repository LRU)
+        with METRICS.stage("tokenize"):
+            token_count = count_tokens(content_data)
+        return content_data.model_copy(update={"token_count": token_count})
+
+    def _enrich(
+        self, content_data: ContentData, preferred_model: str, use_cache: bool = True
+    ) -> EnrichedData:
+        with METRICS.stage("enrich"):
+            enriched_data = FLIGHTS.do(
+                ("enrich", preferred_model, content_hash(content_data), use_cache),
+                self._enrich_exclusive,
+                content_data,
+                preferred_model,
+                use_cache,
+            )
+        logger.info(f"Enriched data: {enriched_data}")
+        return enriched_data
+
+    def _enrich_exclusive(
+        self, content_data: ContentData, preferred_model: str, use_cache: bool
+    ) -> EnrichedData:
+        version = self.enricher.version(content_data.source_type)
+
+        def enrich() -> EnrichedData:
+            enriched_data = self.enricher.execute(content_data, preferred_model)
+            self._store_enrichment(content_data, preferred_model, version, enriched_data)
+            return enriched_data
+
+        return self._exclusive(
+            f"enrich:{STAGE_CACHE.scope}:{preferred_model}:{content_hash(content_data)}",
+            lambda: self._cached_enrichment(
+                content_data, preferred_model, version, use_cache
+            ),
+            enrich,
+            use_cache and SETTINGS.stage_cache,
+        )
+
+    async def _enrich_async(
+        self, content_data: ContentData, preferred_model: str, use_cache: bool
+    ) -> EnrichedData:
+        version = self.enricher.version(content_data.source_type)
+
+        async def enrich() -> EnrichedData:
+            enriched_data = await self.enricher.execute_async(
+                content_data, preferred_model
+            )
+            await run_sync(
+                self._store_enrichment,
+                content_data,
+                preferred_model,
+                version,
+                enriched_data,
+            )
+            return enriched_data
+
+        return await self._exclusive_async(
+            f"enrich:{STAGE_CACHE.scope}:{preferred_model}:{content_hash(content_data)}",
+            lambda: self._cached_enrichment(
+                content_data, preferred_model, version, use_cache
+            ),
+            enrich,
+            use_cache and SETTINGS.stage_cache,
+        )
+
+    # Cross-process exclusion for a step. In-process callers are already coalesced by
+    # FLIGHTS; across processes the first caller claims a work lease (a row, not a held
+    # connection) and runs compute, while the others poll lookup until its result lands
+    # or the lease frees up. Waiting only pays if lookup can see the holder's result, so
+    # callers pass shared=True only when it reads a store every claimant of key reads:
+    # the repository, or the stage cache with the key scoped to it (STAGE_CACHE.scope).
+    # Otherwise nothing is claimed and the step just runs.
+    def _exclusive(
+        self,
+        key: str,
+        lookup: Callable[[], T | None],
+        compute: Callable[[], T],
+        shared: bool,
+    ) -> T:
+        if not (SETTINGS.work_leases and shared):
+            return compute()
+        while (found := lookup()) is None:
+            token = REPOSITORY.claim_lease(key, SETTINGS.work_lease_ttl)
+            if token is None:
+                time.sleep(LEASE_POLL)
+                continue
+            try:
+                # The last holder may have finished between lookup and claim
+                found = lookup()
+                return found if found is not None else compute()
+            finally:
+                REPOSITORY.release_lease(key, token)
+        return found
+
+    async def _exclusive_async(
+        self,
+        key: str,
+        lookup: Callable[[], T | None],
+        compute: Callable[[], Awaitable[T]],
+        shared: bool,
+    ) -> T:
+        if not (SETTINGS.work_leases and shared):
+            return await compute()
+        while (found := await run_sync(lookup)) is None:
+            token = await run_sync(REPOSITORY.claim_lease, key, SETTINGS.work_lease_ttl)
+            if token is None:
+                await asyncio.sleep(LEASE_POLL)
+                continue
+            try:
+                found = await run_sync(lookup)
+                return found if found is not None else await compute()
+            finally:
+                await run_sync(REPOSITORY.release_lease, key, token)
+        return found
+
+    # Stage cache: use_cache=False skips reads but still records fresh results, so a
+    # forced re-run refreshes the cache rather than bypassing it.
+    def _reads_content(self, source_info: SourceInfo, use_cache: bool) -> bool:
+        """Whether extraction may be served from the stage cache (not off, not stale)."""
+        return (
+            use_cache
+            and SETTINGS.stage_cache
+            and not self.extractor.needs_refresh(source_info)
+        )
+
+    def _cached_content(
+        self, source_info: SourceInfo, version: str, use_cache: bool
+    ) -> ContentData | None:
+        if not (SETTINGS.stage_cache and use_cache):
+            return None
+        content_data = STAGE_CACHE.get_content(source_info.uri, version)
+        METRICS.cache("stage.extract", content_data is not None)
+        if content_data is not None:
+            logger.info(f"Resuming from cached extraction for URI: {source_info.uri}")
+        return content_data
+
+    def _store_content(
+        self, source_info: SourceInfo, version: str, content_data: ContentData
+    ) -> None:
+        if SETTINGS.stage_cache:
+            STAGE_CACHE.set_content(source_info.uri, version, content_data)
+
+    def _cached_enrichment(
+        self,
+        content_data: ContentData,
+        preferred_model: str,
+        version: str,
+        use_cache: bool,
+    ) -> EnrichedData | None:
+        if not (SETTINGS.stage_cache and use_cache):
+            return None
+        enriched_data = STAGE_CACHE.get_enrichment(content_data, preferred_model, version)
+        METRICS.cache("stage.enrich", enriched_data is not None)
+        if enriched_data is not None:
+            logger.info(f"Resuming from cached enrichment for model: {preferred_model}")
+        return enriched_data
+
+    def _store_enrichment(
+        self,
+        content_data: ContentData,
+        preferred_model: str,
+        version: str,
+        enriched_data: EnrichedData,
+    ) -> None:
+        if SETTINGS.stage_cache:
+            STAGE_CACHE.set_enrichment(
+                content_data, preferred_model, version, enriched_data
+            )
+
+    def _persist(
+        self,
+        source_info: SourceInfo,
+        content_data: ContentData,
+        enriched_data: EnrichedData,
+        use_cache: bool,
+    ) -> ProcessedContent:
+        with METRICS.stage("persist"):
+            return FLIGHTS.do(
+                ("persist", source_info.uri, use_cache),
+                self._persist_exclusive,
+                source_info,
+                content_data,
+                enriched_data,
+                use_cache,
+            )
+
+    def _persist_exclusive(
+        self,
+        source_info: SourceInfo,
+        content_data: ContentData,
+        enriched_data: EnrichedData,
+        use_cache: bool,
+    ) -> ProcessedContent:
         result = ProcessedContent(
             source=source_info,
             content=content_data,
@@ -258,17 +937,23 @@ class SiphonPipeline:
         )
         logger.info("Processed content assembled.")
 
-        # Store in repository
-        if use_cache:
+        if not use_cache:
+            logger.debug("Cache usage disabled; not storing in repository.")
+            return result
+
+        def store() -> ProcessedContent:
             REPOSITORY.set(result)
             logger.info(
                 f"Processed content stored in repository for URI: {source_info.uri}"
             )
-        else:
-            logger.debug("Cache usage disabled; not storing in repository.")
+            return result
 
-        assert action == ActionType.GULP, (
-            "Action must be GULP at this stage, suggests error in code."
-        )
+        def stored() -> ProcessedContent | None:
+            # Another process may have stored this URI since our lookup: share its row,
+            # unless it holds other content (a revalidated source changed upstream)
+            existing = REPOSITORY.get_or_none(source_info.uri)
+            if existing is not None and existing.content == content_data:
+                return existing
+            return None
 
-        return result
+        return self._exclusive(f"persist:{source_info.uri}", stored, store, use_cache)
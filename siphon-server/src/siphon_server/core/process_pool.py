@@ -0,0 +1,230 @@
+"""
+Managed process pool for CPU-heavy conversions.
+
+HTML simplification (readabilipy / trafilatura), markdownify and `MarkItDown.convert` are pure-Python CPU work: run on a pipeline thread they hold the GIL and stall every other request in the process, so more scheduler threads never made them faster. `ConversionPool` runs them in worker processes instead; the calling thread just waits on a future (GIL released), and throughput scales with cores.
+
+- Warm: workers come from a forkserver that has already imported the conversion libraries, and `warm()` (called by `SiphonPipeline.warmup`) starts all of them up front.
+- Bounded memory: a worker is replaced after `process_pool_max_tasks` conversions, and once any worker's peak RSS passes `process_pool_max_rss_mb` the pool is swapped for a fresh one (in-flight work finishes on the old workers). A worker that dies (e.g. OOM-killed) breaks its whole pool: every call pending on it, running or still queued, fails with `BrokenProcessPool`, and the next call gets a new pool. A call submitted to a pool that was just broken or swapped out is retried once on its replacement.
+- Handoff without pickling payloads: documents travel as file paths (the worker reads the file), large HTML as a `SharedText` block in shared memory; only the handle is pickled.
+
+`process_pool_workers` sets the size (default: one per core); 0 runs every conversion inline on the calling thread, as do the batch runner's workers, which are already one process each.
+
+Usage:
+```python
+from siphon_server.core.process_pool import PROCESS_POOL, shared_text
+
+text = PROCESS_POOL.run(convert_document, str(path))
+with shared_text(html) as payload:
+    markdown, metadata = PROCESS_POOL.run(convert_html, backend, payload)
+markdown, metadata = await PROCESS_POOL.run_async(convert_html, backend, html)
+```
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import TypeVar
+import multiprocessing
+import threading
+import resource
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SHARED_MIN_BYTES = 64 * 1024  # Smaller payloads are cheaper to pickle than to map
+PRELOAD = (  # Imported once in the forkserver, so every worker starts warm
+    "siphon_server.sources.article.html",
+    "siphon_server.sources.doc.extractor",
+    "markdownify",
+    "markitdown",
+    "readabilipy.simple_json",
+    "trafilatura",
+)
+
+
+class SharedText:
+    """
+    Text handed to a worker through shared memory: the UTF-8 bytes are written once
+    and decoded in the worker straight from the mapping. Owned by the parent, which
+    unlinks it with close() (or on leaving a with block).
+    """
+
+    def __init__(self, text: str):
+        data = text.encode("utf-8", "surrogatepass")
+        self._shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        self._shm.buf[: len(data)] = data
+        self.name = self._shm.name
+        self.size = len(data)
+
+    def __reduce__(self):
+        return (_SharedTextHandle, (self.name, self.size))
+
+    def close(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "SharedText":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _SharedTextHandle:
+    """What a SharedText unpickles to in the worker."""
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+
+    def read(self) -> str:
+        shm = shared_memory.SharedMemory(name=self.name)
+        view = shm.buf[: self.size]
+        try:
+            return str(view, "utf-8", "surrogatepass")
+        finally:
+            view.release()
+            shm.close()
+
+
+@contextmanager
+def shared_text(text: str) -> Iterator["str | SharedText"]:
+    """text itself when small, else a SharedText holding it (unlinked on exit)."""
+    if len(text) < SHARED_MIN_BYTES:
+        yield text
+        return
+    with SharedText(text) as shared:
+        yield shared
+
+
+def text_of(payload: "str | SharedText | _SharedTextHandle") -> str:
+    """The text behind a payload passed to PROCESS_POOL (inline or in a worker)."""
+    if isinstance(payload, str):
+        return payload
+    if isinstance(payload, SharedText):  # Inline call: never left this process
+        return _SharedTextHandle(payload.name, payload.size).read()
+    return payload.read()
+
+
+class ConversionPool:
+    """
+    A recycled, memory-bounded ProcessPoolExecutor for conversion functions.
+    Functions (and their arguments) must be picklable: module-level functions.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_tasks: int | None = None,
+        max_rss_mb: int | None = None,
+    ):
+        from siphon_server.config import settings
+
+        self.workers = settings.process_pool_workers if workers is None else workers
+        self.max_tasks = max_tasks or settings.process_pool_max_tasks
+        self.max_rss_mb = settings.process_pool_max_rss_mb if max_rss_mb is None else max_rss_mb
+        self.inline = self.workers < 1
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.recycled = 0  # Pools replaced for memory or a dead worker
+
+    def executor(self) -> ProcessPoolExecutor:
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                executor = self._executor
+                if executor is None:
+                    context = multiprocessing.get_context("forkserver")
+                    context.set_forkserver_preload(list(PRELOAD))
+                    executor = self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=context,
+                        max_tasks_per_child=self.max_tasks,
+                    )
+                    logger.debug(
+                        f"Started conversion pool: {self.workers} workers, "
+                        f"{self.max_tasks} tasks per worker."
+                    )
+        return executor
+
+    def submit(self, fn: Callable[..., T], *args) -> Future[T]:
+        """Queue fn(*args) on a worker (or run it now, inline)."""
+        result: Future[T] = Future()
+        if self.inline:
+            try:
+                result.set_result(fn(*args))
+            except BaseException as e:
+                result.set_exception(e)
+            return result
+        executor = self.executor()
+        try:
+            inner = executor.submit(_call, fn, args)
+        except (RuntimeError, BrokenProcessPool):
+            # Raced a recycle (shut down) or a dead worker (broken): retry on the successor
+            self._recycle(executor, "it refused new work")
+            executor = self.executor()
+            inner = executor.submit(_call, fn, args)
+        inner.add_done_callback(lambda done: self._settle(executor, done, result))
+        return result
+
+    def run(self, fn: Callable[..., T], *args) -> T:
+        """fn(*args) on a worker; blocks the calling thread (not the GIL) until done."""
+        return self.submit(fn, *args).result()
+
+    async def run_async(self, fn: Callable[..., T], *args) -> T:
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def warm(self) -> None:
+        """Start every worker now, so the first conversion pays no process startup."""
+        if self.inline:
+            return
+        executor = self.executor()
+        for future in [executor.submit(_call, int, ()) for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _settle(self, executor: ProcessPoolExecutor, done: Future, result: Future) -> None:
+        try:
+            value, rss_mb = done.result()
+        except BrokenProcessPool as e:
+            self._recycle(executor, "a worker died")
+            result.set_exception(e)
+            return
+        except BaseException as e:
+            result.set_exception(e)
+            return
+        if self.max_rss_mb and rss_mb > self.max_rss_mb:
+            self._recycle(executor, f"a worker reached {rss_mb:.0f} MB")
+        result.set_result(value)
+
+    def _recycle(self, executor: ProcessPoolExecutor, reason: str) -> None:
+        """Replace executor (if still current); its running work finishes first."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self.recycled += 1
+        logger.info(f"Recycling conversion pool: {reason}.")
+        threading.Thread(target=executor.shutdown, daemon=True).start()
+
+
+def _call(fn: Callable[..., T], args: tuple) -> tuple[T, float]:
+    """Worker side: run fn and report this worker's peak RSS in MB."""
+    value = fn(*args)
+    return value, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# Singleton
+PROCESS_POOL = ConversionPool()
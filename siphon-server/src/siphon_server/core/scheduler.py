@@ -0,0 +1,152 @@
+"""
+Resource-class scheduling for extraction and enrichment work.
+
+Audio transcription is GPU-bound, document conversion CPU-bound, fetches network-bound and enrichment waits on a model server; running all of them inline on whichever thread called the pipeline lets one hour-long podcast occupy the workers a queue of quick article ingests needs. Each extractor and enricher declares the bottleneck it is bound by as a class attribute:
+
+```python
+class AudioExtractor(ExtractorStrategy):
+    source_type: SourceType = SourceType.AUDIO
+    resource_class: ResourceClass = ResourceClass.GPU
+```
+
+`ResourceScheduler` gives every `ResourceClass` its own bounded executor, sized by the `resource_slots` setting (default: 1 GPU, one CPU slot per core, 32 network, 8 LLM). Work of one class queues only behind work of the same class. Native async strategies don't take a thread: they hold a per-event-loop semaphore with the same number of slots. Strategies that declare nothing are CPU-class extractors and LLM-class enrichers.
+
+Usage:
+```python
+from siphon_server.core.scheduler import SCHEDULER
+
+content = SCHEDULER.run(ResourceClass.GPU, extractor.extract, source=source_info)
+content = await SCHEDULER.run_async(ResourceClass.NETWORK, extractor.extract, source=source_info)
+async with SCHEDULER.slot(ResourceClass.NETWORK):
+    content = await extractor.extract_async(source=source_info)
+```
+"""
+
+from siphon_api.enums import ResourceClass
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Callable
+from functools import partial
+from typing import TypeVar
+import weakref
+import contextvars
+import threading
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXTRACTOR_DEFAULT = ResourceClass.CPU
+ENRICHER_DEFAULT = ResourceClass.LLM
+
+_worker = threading.local()  # .resource_class is set on scheduler-owned threads
+
+
+def resource_class_of(strategy: object, default: ResourceClass) -> ResourceClass:
+    """
+    The resource class a strategy declares (looking through async adapters), or default.
+    """
+    strategy = getattr(strategy, "wrapped", strategy)
+    return ResourceClass(getattr(strategy, "resource_class", default))
+
+
+class ResourceScheduler:
+    """
+    One bounded executor (and one async semaphore per loop) per ResourceClass.
+    Executors are created on first use.
+    """
+
+    def __init__(self, slots: dict[str, int] | None = None):
+        if slots is None:
+            from siphon_server.config import settings
+
+            slots = settings.resource_slots
+        self._slots = {ResourceClass(name): int(n) for name, n in slots.items()}
+        for resource_class, n in self._slots.items():
+            if n < 1:
+                raise ValueError(f"Resource class {resource_class.value} needs at least one slot.")
+        self._executors: dict[ResourceClass, ThreadPoolExecutor] = {}
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[ResourceClass, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def slots(self, resource_class: ResourceClass) -> int:
+        """Configured concurrency for resource_class (unconfigured classes get 1)."""
+        return self._slots.get(resource_class, 1)
+
+    def executor(self, resource_class: ResourceClass) -> ThreadPoolExecutor:
+        executor = self._executors.get(resource_class)
+        if executor is None:
+            with self._lock:
+                executor = self._executors.get(resource_class)
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=self.slots(resource_class),
+                        thread_name_prefix=f"siphon-{resource_class.value}",
+                        initializer=_mark_worker,
+                        initargs=(resource_class,),
+                    )
+                    self._executors[resource_class] = executor
+                    logger.debug(
+                        f"Created {resource_class.value} executor with "
+                        f"{self.slots(resource_class)} slots."
+                    )
+        return executor
+
+    def submit(
+        self, resource_class: ResourceClass, fn: Callable[..., T], *args, **kwargs
+    ) -> Future[T]:
+        """Queue fn on its class's executor; context variables carry over."""
+        context = contextvars.copy_context()
+        return self.executor(resource_class).submit(
+            partial(context.run, fn, *args, **kwargs)
+        )
+
+    def run(
+        self, resource_class: ResourceClass, fn: Callable[..., T], *args, **kwargs
+    ) -> T:
+        """
+        Run fn in a slot of resource_class and wait for it. Calls made from a thread that
+        already holds a slot of the same class run inline, so nesting can't deadlock.
+        """
+        if getattr(_worker, "resource_class", None) == resource_class:
+            return fn(*args, **kwargs)
+        return self.submit(resource_class, fn, *args, **kwargs).result()
+
+    async def run_async(
+        self, resource_class: ResourceClass, fn: Callable[..., T], *args, **kwargs
+    ) -> T:
+        """Await a blocking fn running in a slot of resource_class."""
+        return await asyncio.wrap_future(self.submit(resource_class, fn, *args, **kwargs))
+
+    @asynccontextmanager
+    async def slot(self, resource_class: ResourceClass) -> AsyncIterator[None]:
+        """Hold one slot of resource_class on the running loop (for native async work)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(resource_class)
+            if semaphore is None:
+                semaphore = semaphores[resource_class] = asyncio.Semaphore(
+                    self.slots(resource_class)
+                )
+        async with semaphore:
+            yield
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+
+def _mark_worker(resource_class: ResourceClass) -> None:
+    _worker.resource_class = resource_class
+
+
+# Singleton
+SCHEDULER = ResourceScheduler()
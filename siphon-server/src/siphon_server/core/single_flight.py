@@ -0,0 +1,104 @@
+"""
+Single-flight coalescing of identical in-flight work.
+
+When two clients GULP the same URL at the same time, both used to run the full extract and enrich path and then race in `ContentRepository.set`. `SingleFlight` makes the first caller for a key the leader: it runs the computation, and every caller that arrives with the same key while it is running waits for, and shares, the leader's result (or exception). Once the computation finishes the key is released, so later calls run again (and normally hit the stage cache or repository).
+
+`do()` coalesces threads (process, process_many); `do_async()` coalesces coroutines on one event loop (process_async). The shared computation runs as its own task, so a cancelled caller never cancels the work other callers are waiting on. For callers in different processes, the pipeline additionally claims a work lease in the repository (`ContentRepository.claim_lease`) for each expensive step; the other processes poll the stage cache until the result lands, holding no database connection while they wait.
+
+Usage:
+```python
+from siphon_server.core.single_flight import FLIGHTS
+
+content = FLIGHTS.do(("extract", source_info.uri), extractor.extract, source_info)
+content = await FLIGHTS.do_async(("extract", uri), extractor.extract_async, source_info)
+```
+"""
+
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+import asyncio
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Per-key deduplication of concurrent calls, for threads and for coroutines.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self.coalesced = 0  # Callers that shared another caller's result
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run fn(*args, **kwargs) unless a call with the same key is in flight; then wait
+        for it and return (or raise) its outcome.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if not leader:
+            logger.info(f"Joining in-flight call for {key!r}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[..., Awaitable[T]], *args, **kwargs
+    ) -> T:
+        """
+        Async twin of do(): coroutines with the same key on this loop share one task.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._tasks[task_key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+        else:
+            logger.info(f"Joining in-flight task for {key!r}")
+            with self._lock:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Number of keys currently being computed."""
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+
+# Singleton
+FLIGHTS = SingleFlight()
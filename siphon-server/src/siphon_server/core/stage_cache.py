@@ -0,0 +1,202 @@
+"""
+Content-addressed cache for intermediate pipeline stages.
+
+The repository only stores a finished `ProcessedContent` after a GULP, so EXTRACT, TOKENIZE and ENRICH on a new URI redo every step, and re-enriching with another model re-extracts (for audio, that means re-transcribing). `StageCache` keeps each stage's output under a key that says exactly what produced it:
+
+- extracted `ContentData`: (uri, extractor version)
+- `EnrichedData`: (content hash, model, prompt-set version)
+
+A strategy's version is its explicit `version` attribute if it declares one, otherwise a digest of its module source plus, for enrichers, the `prompts/` directory beside it. Editing an extractor or a prompt template therefore invalidates exactly the entries it could have changed, and nothing else. A strategy whose output depends on how it was configured declares `version` as a property and is versioned per instance: ArticleExtractor folds in its HTML backend and `sources/article/html.py`.
+
+Location: $XDG_CACHE_HOME/siphon/stages.db (opened on first use).
+
+Usage:
+```python
+from siphon_server.core.stage_cache import STAGE_CACHE, strategy_version
+
+version = strategy_version(AudioExtractor)
+content = STAGE_CACHE.get_content(source_info.uri, version)
+if content is None:
+    content = AudioExtractor().extract(source_info)
+    STAGE_CACHE.set_content(source_info.uri, version, content)
+```
+"""
+
+from siphon_api.models import ContentData, EnrichedData
+from siphon_api.errors import StageCacheError
+from xdg_base_dirs import xdg_cache_home
+from functools import cache
+from pathlib import Path
+import hashlib
+import inspect
+import socket
+import sqlite3
+import threading
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extracted (
+    uri TEXT NOT NULL,
+    extractor_version TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (uri, extractor_version)
+);
+CREATE TABLE IF NOT EXISTS enriched (
+    content_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (content_hash, model, prompt_version)
+);
+"""
+
+
+@cache
+def source_digest(*paths: Path) -> str:
+    """
+    Short digest of the named files' contents, memoized per process.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+@cache
+def _class_version(strategy_class: type) -> str:
+    source_file = Path(inspect.getfile(strategy_class))
+    prompts_dir = source_file.parent / "prompts"
+    prompts = sorted(prompts_dir.glob("*.jinja2")) if prompts_dir.is_dir() else []
+    return source_digest(source_file, *prompts)
+
+
+def strategy_version(strategy: type | object) -> str:
+    """
+    Version tag for an extractor or enricher class, or for a configured instance of
+    one (an instance's `version` property sees its configuration; a class's cannot).
+    """
+    strategy_class = strategy if isinstance(strategy, type) else type(strategy)
+    explicit = getattr(strategy, "version", None)
+    if explicit and not isinstance(explicit, property):
+        return f"{strategy_class.__name__}:{explicit}"
+    return f"{strategy_class.__name__}:{_class_version(strategy_class)}"
+
+
+def content_hash(content: ContentData) -> str:
+    """
+    Hash of what an enricher sees: source type, text and metadata (not token_count).
+    """
+    digest = hashlib.sha256()
+    digest.update(content.source_type.value.encode())
+    digest.update(b"\0")
+    digest.update(content.text.encode())
+    digest.update(b"\0")
+    digest.update(json.dumps(content.metadata, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class StageCache:
+    """
+    SQLite-backed store of extracted and enriched stage outputs.
+    The connection is opened lazily and shared across threads; a lock serializes access.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or Path(xdg_cache_home()) / "siphon" / "stages.db"
+        self._con: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def scope(self) -> str:
+        """
+        Which processes can read this cache: those on this host using this file. Work
+        leases on stage results are claimed under it, so no other process waits on them.
+        """
+        return f"{socket.gethostname()}:{self.path.resolve()}"
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._con is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                con = sqlite3.connect(self.path, check_same_thread=False)
+                con.executescript(_SCHEMA)
+            except sqlite3.Error as e:
+                raise StageCacheError(f"Failed to initialize stage cache: {e}")
+            self._con = con
+        return self._con
+
+    def _fetch(self, sql: str, params: tuple) -> str | None:
+        try:
+            with self._lock:
+                row = self._connection().execute(sql, params).fetchone()
+        except sqlite3.Error as e:
+            raise StageCacheError(f"Failed to read stage cache: {e}")
+        return row[0] if row else None
+
+    def _store(self, sql: str, params: tuple) -> None:
+        try:
+            with self._lock:
+                con = self._connection()
+                con.execute(sql, params)
+                con.commit()
+        except sqlite3.Error as e:
+            raise StageCacheError(f"Failed to write stage cache: {e}")
+
+    # Extracted content
+    def get_content(self, uri: str, extractor_version: str) -> ContentData | None:
+        payload = self._fetch(
+            "SELECT payload FROM extracted WHERE uri = ? AND extractor_version = ?",
+            (uri, extractor_version),
+        )
+        if payload is None:
+            return None
+        logger.debug(f"Stage cache hit (extracted) for {uri}")
+        return ContentData.model_validate_json(payload)
+
+    def set_content(
+        self, uri: str, extractor_version: str, content: ContentData
+    ) -> None:
+        self._store(
+            "REPLACE INTO extracted (uri, extractor_version, payload) VALUES (?, ?, ?)",
+            (uri, extractor_version, content.model_dump_json(exclude={"token_count"})),
+        )
+
+    # Enrichment
+    def get_enrichment(
+        self, content: ContentData, model: str, prompt_version: str
+    ) -> EnrichedData | None:
+        payload = self._fetch(
+            "SELECT payload FROM enriched WHERE content_hash = ? AND model = ? AND prompt_version = ?",
+            (content_hash(content), model, prompt_version),
+        )
+        if payload is None:
+            return None
+        logger.debug(f"Stage cache hit (enriched) for model {model}")
+        return EnrichedData.model_validate_json(payload)
+
+    def set_enrichment(
+        self,
+        content: ContentData,
+        model: str,
+        prompt_version: str,
+        enriched: EnrichedData,
+    ) -> None:
+        self._store(
+            "REPLACE INTO enriched (content_hash, model, prompt_version, payload) VALUES (?, ?, ?, ?)",
+            (content_hash(content), model, prompt_version, enriched.model_dump_json()),
+        )
+
+    def wipe(self) -> None:
+        with self._lock:
+            con = self._connection()
+            con.execute("DELETE FROM extracted")
+            con.execute("DELETE FROM enriched")
+            con.commit()
+
+
+# Singleton
+STAGE_CACHE = StageCache()
@@ -0,0 +1,42 @@
+"""
+Repository backend selection.
+
+`repository_backend` (setting or `SIPHON_REPOSITORY_BACKEND`) picks where processed content lives:
+
+- "postgres" (default): `ContentRepository` on the networked database found through `dbclients` (or `SIPHON_DATABASE_URL`). Multi-node, with pgvector for `find_related`.
+- "sqlite": `SQLiteContentRepository` on an embedded database at `sqlite_path`, for laptops, CI and single-node deployments. Everything except the pgvector store works the same.
+
+Usage:
+```python
+from siphon_server.database.backend import get_repository
+
+repository = get_repository()  # or get_repository("sqlite")
+```
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from siphon_server.database.postgres.repository import ContentRepository
+    from siphon_server.database.sqlite.repository import SQLiteContentRepository
+
+BACKENDS = ("postgres", "sqlite")
+
+
+def get_repository(
+    backend: str | None = None,
+) -> "ContentRepository | SQLiteContentRepository":
+    """A new repository for backend, or for the `repository_backend` setting."""
+    if backend is None:
+        from siphon_server.config import settings
+
+        backend = settings.repository_backend
+    if backend == "postgres":
+        from siphon_server.database.postgres.repository import ContentRepository
+
+        return ContentRepository()
+    if backend == "sqlite":
+        from siphon_server.database.sqlite.repository import SQLiteContentRepository
+
+        return SQLiteContentRepository()
+    raise ValueError(f"Unknown repository_backend {backend!r}; expected one of {BACKENDS}.")
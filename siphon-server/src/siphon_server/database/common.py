@@ -0,0 +1,60 @@
+"""
+Backend-neutral helpers shared by the repository implementations (Postgres, asyncpg and SQLite): write batching, batch and page size limits, the read-through LRU, and advisory lock ids.
+
+Usage:
+```python
+from siphon_server.database.common import batches, configured_batch_size
+
+for batch in batches(items, configured_batch_size(None)):
+    write(batch)
+```
+"""
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from siphon_api.models import ProcessedContent
+from siphon_server.database.postgres.content_cache import ContentLRU
+import hashlib
+
+MAX_PAGE_SIZE = 1000  # Largest limit list_page accepts
+
+
+def advisory_key(key: str) -> int:
+    """Stable signed 64-bit advisory lock id for an arbitrary string key."""
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big", signed=True)
+
+
+def batches(
+    items: Iterable[ProcessedContent], size: int
+) -> Iterator[list[ProcessedContent]]:
+    """
+    Items in batches of at most size. Within a batch the last item for a URI wins:
+    ON CONFLICT DO UPDATE can't touch the same row twice in one statement.
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield list({pc.source.uri: pc for pc in batch}.values())
+
+
+def configured_batch_size(batch_size: int | None) -> int:
+    """batch_size, or the `repository_batch_size` setting; at least 1."""
+    if batch_size is None:
+        from siphon_server.config import settings
+
+        batch_size = settings.repository_batch_size
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    return batch_size
+
+
+def read_lru(cache_size: int | None, cache_ttl: float | None) -> ContentLRU:
+    """
+    A repository's read-through LRU, sized by the `repository_cache_size` /
+    `repository_cache_ttl` settings unless given.
+    """
+    if cache_size is None or cache_ttl is None:
+        from siphon_server.config import settings
+
+        cache_size = settings.repository_cache_size if cache_size is None else cache_size
+        cache_ttl = settings.repository_cache_ttl if cache_ttl is None else cache_ttl
+    return ContentLRU(maxsize=cache_size, ttl=cache_ttl)
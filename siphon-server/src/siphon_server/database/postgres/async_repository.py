@@ -0,0 +1,321 @@
+"""
+asyncpg-backed twin of ContentRepository, for callers already on an event loop.
+
+`ContentRepository` blocks its thread for every round trip, so an async server has to push each lookup onto a worker thread. `AsyncContentRepository` has the same interface with awaitable methods, runs on the async engine from `connection.get_async_engine()` (pool size, overflow, recycle, pre-ping and statement timeout come from the `db_*` settings), and shares the sync repository's bulk statements, read-through LRU and NOTIFY invalidation, so the two can be mixed freely across processes.
+
+Usage:
+```python
+from siphon_server.database.postgres.async_repository import AsyncContentRepository
+
+repository = AsyncContentRepository()
+content = await repository.get_or_none("article:///https://example.com/post")
+await repository.upsert_many(items)
+```
+"""
+
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Iterable
+from sqlalchemy import exists, select
+from sqlalchemy.exc import IntegrityError
+from siphon_api.enums import SourceType
+from siphon_api.models import (
+    ContentPage,
+    ProcessedContent,
+    ProcessedContentSummary,
+    SearchResult,
+)
+from siphon_server.database.postgres.connection import AsyncSessionLocal, get_async_engine
+from siphon_server.database.postgres.models import ProcessedContentORM, SUMMARY_LOAD
+from siphon_server.database.postgres.converters import from_orm, summary_from_orm
+from siphon_server.database.postgres.repository import (
+    _ADVISORY_LOCK,
+    _ADVISORY_UNLOCK,
+    _CLAIM_LEASE,
+    _NOTIFY,
+    _PRUNE_BODIES,
+    _RELEASE_LEASE,
+    _iter_statement,
+    _page,
+    _page_statement,
+    _search_results,
+    _search_statement,
+    _write_statements,
+    notify_params,
+    read_cache,
+    resolve_batch_size,
+)
+from siphon_server.database.common import MAX_PAGE_SIZE, advisory_key, batches
+from siphon_server.core.metrics import METRICS
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncContentRepository:
+    """
+    Self-managing async repository with automatic session handling.
+    Mirrors ContentRepository; see it for the read cache and its settings.
+    """
+
+    def __init__(
+        self,
+        cache_size: int | None = None,
+        cache_ttl: float | None = None,
+        listen: bool = True,
+    ):
+        self._cache, self._listener = read_cache(cache_size, cache_ttl, listen)
+
+    @asynccontextmanager
+    async def _session(self):
+        """Internal session context manager."""
+        db = AsyncSessionLocal()
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        finally:
+            await db.close()
+
+    @asynccontextmanager
+    async def advisory_lock(self, key: str) -> AsyncIterator[None]:
+        """
+        Hold a session-level Postgres advisory lock on key, waiting until acquired.
+        Shares lock ids with ContentRepository.advisory_lock.
+        """
+        lock_id = advisory_key(key)
+        async with get_async_engine().connect() as conn:
+            for statement in _ADVISORY_LOCK:
+                await conn.execute(statement, {"id": lock_id})
+            await conn.commit()
+            try:
+                yield
+            finally:
+                await conn.execute(_ADVISORY_UNLOCK, {"id": lock_id})
+                await conn.commit()
+
+    async def claim_lease(self, key: str, ttl: float) -> str | None:
+        """Claim key for ttl seconds without waiting; see ContentRepository.claim_lease."""
+        token = uuid.uuid4().hex
+        async with get_async_engine().begin() as conn:
+            claimed = await conn.scalar(
+                _CLAIM_LEASE, {"key": key, "token": token, "ttl": ttl}
+            )
+        return token if claimed else None
+
+    async def release_lease(self, key: str, token: str) -> None:
+        async with get_async_engine().begin() as conn:
+            await conn.execute(_RELEASE_LEASE, {"key": key, "token": token})
+
+    async def get(self, uri: str) -> ProcessedContent | None:
+        """Get content by URI. Returns None if not found."""
+        async with self._session() as db:
+            orm_obj = await db.scalar(select(ProcessedContentORM).filter_by(uri=uri))
+            return from_orm(orm_obj) if orm_obj else None
+
+    async def get_summary(self, uri: str) -> ProcessedContentSummary | None:
+        """Get content by URI without its text and metadata. Returns None if not found."""
+        async with self._session() as db:
+            orm_obj = await db.scalar(
+                select(ProcessedContentORM).options(*SUMMARY_LOAD).filter_by(uri=uri)
+            )
+            return summary_from_orm(orm_obj) if orm_obj else None
+
+    async def get_or_none(self, uri: str) -> ProcessedContent | None:
+        """
+        Get content by URI through the in-process LRU: zero round trips on a hit, one
+        on a miss. Returns None if not found. The result is shared; don't mutate it.
+        """
+        if self._listener is not None:
+            self._listener.start()
+        cached = self._cache.get(uri)
+        METRICS.cache("repository.memory", cached is not None)
+        if cached is not None:
+            return cached
+        epoch = self._cache.epoch
+        pc = await self.get(uri)
+        if pc is not None:
+            self._cache.put(uri, pc, epoch)
+        return pc
+
+    def invalidate(self, uri: str | None = None) -> None:
+        """Evict uri (or everything) from this process's read cache."""
+        if uri is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate(uri)
+
+    async def exists(self, uri: str) -> bool:
+        """Check if content exists without loading data."""
+        async with self._session() as db:
+            return bool(
+                await db.scalar(select(exists().where(ProcessedContentORM.uri == uri)))
+            )
+
+    async def get_many(
+        self, uris: Iterable[str], batch_size: int | None = None
+    ) -> dict[str, ProcessedContent]:
+        """Get content for many URIs, one query per batch. Missing URIs are absent."""
+        batch_size = resolve_batch_size(batch_size)
+        found: dict[str, ProcessedContent] = {}
+        pending = list(dict.fromkeys(uris))
+        async with self._session() as db:
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start : start + batch_size]
+                result = await db.scalars(
+                    select(ProcessedContentORM).where(ProcessedContentORM.uri.in_(chunk))
+                )
+                for orm_obj in result:
+                    found[orm_obj.uri] = from_orm(orm_obj)
+        return found
+
+    async def get_summaries(
+        self, uris: Iterable[str], batch_size: int | None = None
+    ) -> dict[str, ProcessedContentSummary]:
+        """get_many without text and metadata."""
+        batch_size = resolve_batch_size(batch_size)
+        found: dict[str, ProcessedContentSummary] = {}
+        pending = list(dict.fromkeys(uris))
+        async with self._session() as db:
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start : start + batch_size]
+                result = await db.scalars(
+                    select(ProcessedContentORM)
+                    .options(*SUMMARY_LOAD)
+                    .where(ProcessedContentORM.uri.in_(chunk))
+                )
+                for orm_obj in result:
+                    found[orm_obj.uri] = summary_from_orm(orm_obj)
+        return found
+
+    async def set(self, pc: ProcessedContent) -> None:
+        """Create or update content."""
+        await self.upsert_many([pc])
+        logger.info(f"Stored content: {pc.source.uri}")
+
+    async def upsert_many(
+        self, items: Iterable[ProcessedContent], batch_size: int | None = None
+    ) -> int:
+        """
+        Create or update many items with INSERT ... ON CONFLICT (uri) DO UPDATE, one
+        statement and one transaction per batch. Returns rows written.
+        """
+        batch_size = resolve_batch_size(batch_size)
+        written = 0
+        async with self._session() as db:
+            for batch in batches(items, batch_size):
+                uris = [pc.source.uri for pc in batch]
+                for stmt in _write_statements(batch):
+                    await db.execute(stmt)
+                await db.execute(_NOTIFY, notify_params(uris))
+                await db.commit()
+                for uri in uris:
+                    self._cache.invalidate(uri)
+                written += len(batch)
+                logger.debug(f"Upserted {len(batch)} rows ({written} so far).")
+        return written
+
+    async def set_many(
+        self, items: Iterable[ProcessedContent], batch_size: int | None = None
+    ) -> int:
+        """Create or update many items; see upsert_many."""
+        return await self.upsert_many(items, batch_size)
+
+    async def create(self, pc: ProcessedContent) -> ProcessedContent:
+        """Create new content. Raises ValueError if URI already exists."""
+        async with self._session() as db:
+            try:
+                for stmt in _write_statements([pc], upsert=False):
+                    await db.execute(stmt)
+                await db.execute(_NOTIFY, notify_params([pc.source.uri]))
+                await db.commit()
+                logger.info(f"Created content: {pc.source.uri}")
+            except IntegrityError:
+                await db.rollback()
+                raise ValueError(f"Content with URI {pc.source.uri} already exists")
+        self._cache.invalidate(pc.source.uri)
+        return await self.get(pc.source.uri)
+
+    async def update(self, pc: ProcessedContent) -> ProcessedContent:
+        """Update existing content. Raises ValueError if not found."""
+        if not await self.exists(pc.source.uri):
+            raise ValueError(f"Content with URI {pc.source.uri} not found")
+        await self.upsert_many([pc])
+        logger.info(f"Updated content: {pc.source.uri}")
+        return await self.get(pc.source.uri)
+
+    async def prune_bodies(self) -> int:
+        """Delete bodies no row references; see ContentRepository.prune_bodies."""
+        async with self._session() as db:
+            deleted = (await db.execute(_PRUNE_BODIES)).rowcount
+        logger.info(f"Pruned {deleted} unreferenced content bodies.")
+        return deleted
+
+    async def get_existing_uris(self, uris: list[str]) -> list[str]:
+        """Batch check which URIs exist. Returns list of existing URIs."""
+        async with self._session() as db:
+            result = await db.scalars(
+                select(ProcessedContentORM.uri).where(ProcessedContentORM.uri.in_(uris))
+            )
+            return list(result)
+
+    async def get_last_processed_content(self) -> ProcessedContent | None:
+        """Get the last processed content based on creation time."""
+        async with self._session() as db:
+            orm_obj = await db.scalar(
+                select(ProcessedContentORM)
+                .order_by(ProcessedContentORM.created_at.desc())
+                .limit(1)
+            )
+            return from_orm(orm_obj) if orm_obj else None
+
+    async def get_last_summary(self) -> ProcessedContentSummary | None:
+        """get_last_processed_content without text and metadata."""
+        async with self._session() as db:
+            orm_obj = await db.scalar(
+                select(ProcessedContentORM)
+                .options(*SUMMARY_LOAD)
+                .order_by(ProcessedContentORM.created_at.desc())
+                .limit(1)
+            )
+            return summary_from_orm(orm_obj) if orm_obj else None
+
+    async def iter_all(
+        self,
+        source_type: SourceType | None = None,
+        since: int | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[ProcessedContent]:
+        """
+        Stream every row (optionally filtered) in id order through a server-side
+        cursor; see ContentRepository.iter_all.
+        """
+        stmt = _iter_statement(source_type, since, resolve_batch_size(batch_size))
+        async with self._session() as db:
+            async for orm_obj in await db.stream_scalars(stmt):
+                yield from_orm(orm_obj)
+
+    async def search(
+        self, query: str, source_type: SourceType | None = None, limit: int = 20
+    ) -> list[SearchResult]:
+        """Full-text search with ranked snippets; see ContentRepository.search."""
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+        async with self._session() as db:
+            result = await db.execute(_search_statement(query, source_type, limit))
+            return _search_results(result)
+
+    # Last: inside the class body, the name shadows the builtin for later annotations
+    async def list(
+        self,
+        after_id: int | None = None,
+        limit: int = 100,
+        source_type: SourceType | None = None,
+        since: int | None = None,
+    ) -> ContentPage:
+        """One keyset-paginated page of summaries; see ContentRepository.list."""
+        async with self._session() as db:
+            result = await db.scalars(_page_statement(after_id, limit, source_type, since))
+            return _page(result.all(), limit)
@@ -1,36 +1,130 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-from dbclients.discovery.host import get_network_context
+from sqlalchemy import create_engine, Engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from typing import TYPE_CHECKING
+from functools import cache
 import os
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 # SQLAlchemy Base class
 Base = declarative_base()
-# Get network context for DB connection
-network_context = get_network_context()
 
 # Constants for DB connection
-SERVER_IP = network_context.preferred_host
 DBNAME = "siphon2"
 USER = "user"
-PASSWORD = os.getenv("POSTGRES_PASSWORD")
-USERNAME = os.getenv("POSTGRES_USERNAME")
 PORT = 5432
 
-if any(v is None for v in [PASSWORD, USERNAME]):
-    raise ValueError(
-        "POSTGRES_PASSWORD and POSTGRES_USERNAME environment variables must be set"
+
+# Connections are deferred: importing this module (and therefore the ORM models,
+# the repository, and the pipeline) never touches the network. Host discovery and
+# engine creation happen on the first session.
+@cache
+def get_postgres_url() -> str:
+    # Explicit URL (e.g. a local Postgres for benchmarks) skips host discovery
+    if url := os.getenv("SIPHON_DATABASE_URL"):
+        return url
+
+    # Get network context for DB connection
+    from dbclients.discovery.host import get_network_context
+
+    network_context = get_network_context()
+    server_ip = network_context.preferred_host
+    password = os.getenv("POSTGRES_PASSWORD")
+    username = os.getenv("POSTGRES_USERNAME")
+
+    if any(v is None for v in [password, username]):
+        raise ValueError(
+            "POSTGRES_PASSWORD and POSTGRES_USERNAME environment variables must be set"
+        )
+
+    return f"postgresql://{username}:{password}@{server_ip}:{PORT}/{DBNAME}"
+
+
+def pool_options() -> dict:
+    """Pool sizing and health checks shared by the sync and async engines (settings)."""
+    from siphon_server.config import settings
+
+    return dict(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
     )
 
-POSTGRES_URL = f"postgresql://{USERNAME}:{PASSWORD}@{SERVER_IP}:{PORT}/{DBNAME}"
+
+def statement_timeout_ms() -> int:
+    from siphon_server.config import settings
+
+    return int(settings.db_statement_timeout * 1000)
+
+
+@cache
+def get_engine() -> Engine:
+    connect_args = {}
+    if timeout := statement_timeout_ms():
+        connect_args["options"] = f"-c statement_timeout={timeout}"
+    return create_engine(
+        get_postgres_url(),
+        echo=False,
+        connect_args=connect_args,
+        **pool_options(),
+    )
+
+
+@cache
+def get_listen_engine() -> Engine:
+    """
+    Unpooled engine for long-lived LISTEN connections (`ContentListener`). Each one is
+    a connection of its own, closed for real when done: an autocommit, LISTENing
+    connection must never go back to the pool an ORM session checks out of.
+    """
+    return create_engine(get_postgres_url(), echo=False, poolclass=NullPool)
+
+
+@cache
+def get_async_engine() -> "AsyncEngine":
+    """
+    asyncpg-backed engine for AsyncContentRepository. Like every asyncpg pool it must
+    be used from a single event loop (the server's).
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    server_settings = {}
+    if timeout := statement_timeout_ms():
+        server_settings["statement_timeout"] = str(timeout)
+    url = get_postgres_url().replace("postgresql://", "postgresql+asyncpg://", 1)
+    return create_async_engine(
+        url,
+        echo=False,
+        connect_args={"server_settings": server_settings},
+        **pool_options(),
+    )
+
+
+@cache
+def get_sessionmaker() -> sessionmaker:
+    return sessionmaker(bind=get_engine())
+
+
+@cache
+def get_async_sessionmaker() -> "async_sessionmaker[AsyncSession]":
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    # Loaded attributes stay readable after commit without another await
+    return async_sessionmaker(bind=get_async_engine(), expire_on_commit=False)
 
 
-engine = create_engine(
-    POSTGRES_URL,
-    echo=False,
-)
+def SessionLocal() -> Session:
+    """Open a new session; creates the engine on first call."""
+    return get_sessionmaker()()
 
 
-SessionLocal = sessionmaker(bind=engine)
+def AsyncSessionLocal() -> "AsyncSession":
+    """Open a new async session; creates the async engine on first call."""
+    return get_async_sessionmaker()()
 
 
 def get_db():
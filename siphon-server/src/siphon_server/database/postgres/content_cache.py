@@ -0,0 +1,162 @@
+"""
+In-process read-through cache of hydrated ProcessedContent, kept coherent across nodes.
+
+A repository cache hit used to cost two round trips (`exists`, then `get`), each on a fresh session. `ContentRepository.get_or_none` serves hot URIs from a bounded, TTL'd LRU instead, and goes to Postgres at most once on a miss. Every write (`set`, `create`, `update`) evicts the URI locally and sends `NOTIFY siphon_content, '<uri>'` in the writing transaction; a `ContentListener` thread on every node LISTENs on that channel and evicts the same URI from its own LRU when the write commits.
+
+Staleness is bounded twice over: by the TTL, and by a reconnect policy that empties the LRU whenever the LISTEN connection drops (notifications sent while disconnected are lost). A load that races an invalidation is never cached: `ContentLRU.epoch` advances on every eviction, and `put` discards values loaded under an older epoch.
+
+Cached objects are shared between callers; treat them as read-only.
+
+Usage:
+```python
+from siphon_server.database.postgres.content_cache import ContentLRU
+
+lru = ContentLRU(maxsize=1024, ttl=300)
+epoch = lru.epoch
+lru.put(uri, repository.get(uri), epoch)
+lru.get(uri)  # -> ProcessedContent, or None once expired/evicted
+```
+"""
+
+from siphon_api.models import ProcessedContent
+from collections import OrderedDict
+from collections.abc import Callable
+import threading
+import select
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "siphon_content"
+_MAX_PAYLOAD = 7900  # Postgres caps NOTIFY payloads just under 8000 bytes
+_RECONNECT_DELAY = 5.0
+
+
+class ContentLRU:
+    """
+    Thread-safe LRU of ProcessedContent by URI, with a per-entry time to live.
+    maxsize=0 disables caching.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, ProcessedContent]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._epoch = 0
+
+    @property
+    def epoch(self) -> int:
+        """Advances on every invalidation; read before loading, pass to put()."""
+        return self._epoch
+
+    def get(self, uri: str) -> ProcessedContent | None:
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is None:
+                return None
+            expires, content = entry
+            if self._clock() >= expires:
+                del self._entries[uri]
+                return None
+            self._entries.move_to_end(uri)
+            return content
+
+    def put(self, uri: str, content: ProcessedContent, epoch: int) -> bool:
+        """Cache content loaded at epoch; returns False if an invalidation intervened."""
+        if self.maxsize <= 0:
+            return False
+        with self._lock:
+            if epoch != self._epoch:
+                return False
+            self._entries[uri] = (self._clock() + self.ttl, content)
+            self._entries.move_to_end(uri)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self, uri: str) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.pop(uri, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def notify_payload(uri: str) -> str:
+    """NOTIFY payload for uri; an empty payload (too long to send) means 'evict everything'."""
+    return uri if len(uri.encode()) <= _MAX_PAYLOAD else ""
+
+
+class ContentListener:
+    """
+    Daemon thread that LISTENs on CHANNEL and evicts notified URIs from an LRU.
+    Connects through `connect`, a DBAPI connection factory that must not hand out pooled
+    connections (e.g. get_listen_engine().raw_connection): this one is switched to
+    autocommit and left LISTENing.
+    """
+
+    def __init__(self, lru: ContentLRU, connect: Callable[[], object]):
+        self._lru = lru
+        self._connect = connect
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="siphon-content-listener", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                logger.warning(f"Content listener disconnected: {e}")
+            # Notifications sent while we weren't listening are lost
+            self._lru.clear()
+            self._stop.wait(_RECONNECT_DELAY)
+
+    def _listen(self) -> None:
+        raw = self._connect()
+        try:
+            conn = getattr(raw, "driver_connection", raw)  # psycopg2 connection
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+            # Anything cached before LISTEN took effect may already be stale
+            self._lru.clear()
+            logger.debug(f"Listening for content invalidations on {CHANNEL}.")
+            while not self._stop.is_set():
+                if select.select([conn], [], [], 1.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    if notify.payload:
+                        self._lru.invalidate(notify.payload)
+                    else:
+                        self._lru.clear()
+        finally:
+            raw.close()
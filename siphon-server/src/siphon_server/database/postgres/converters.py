@@ -1,18 +1,34 @@
 # pyright: basic
 
-from siphon_api.models import ProcessedContent, SourceInfo, ContentData, EnrichedData
+from siphon_api.models import (
+    ProcessedContent,
+    ProcessedContentSummary,
+    SourceInfo,
+    ContentData,
+    EnrichedData,
+)
 from siphon_api.enums import SourceType
-from siphon_server.database.postgres.models import ProcessedContentORM
+from siphon_server.database.postgres.models import (
+    ProcessedContentORM,
+    SEARCH_CONTENT_CHARS,
+    search_vector,
+)
+from siphon_server.database.postgres.bodies import body_hash, body_row, body_text
 
 
-def to_orm(pc: ProcessedContent) -> ProcessedContentORM:
-    """Convert domain model to ORM model."""
-    return ProcessedContentORM(
+def to_row(pc: ProcessedContent) -> dict:
+    """
+    Convert domain model to a processed_content column -> value dict (for bulk
+    statements). The text goes to content_bodies separately (to_body).
+    """
+    return dict(
         uri=pc.source.uri,
         source_type=pc.source.source_type.value,  # Enum to string
         original_source=pc.source.original_source,
         source_hash=pc.source.hash,
-        content_text=pc.content.text,
+        content_hash=body_hash(pc.content.text),
+        content_length=len(pc.content.text),
+        content_tokens=pc.content.token_count,
         content_metadata=pc.content.metadata,
         title=pc.enrichment.title,
         description=pc.enrichment.description,
@@ -25,28 +41,70 @@ def to_orm(pc: ProcessedContent) -> ProcessedContentORM:
     )
 
 
+def to_write_row(pc: ProcessedContent) -> dict:
+    """to_row plus the row's search_vector expression, for INSERT/UPSERT statements."""
+    return to_row(pc) | dict(
+        search_vector=search_vector(
+            pc.enrichment.title,
+            pc.enrichment.description,
+            pc.enrichment.summary,
+            pc.content.text[:SEARCH_CONTENT_CHARS],
+        )
+    )
+
+
+def to_body(pc: ProcessedContent) -> dict:
+    """Convert domain model's text to a compressed content_bodies row."""
+    return body_row(pc.content.text)
+
+
+def to_orm(pc: ProcessedContent) -> ProcessedContentORM:
+    """Convert domain model to ORM model (without its body)."""
+    return ProcessedContentORM(**to_row(pc))
+
+
+def _source_from_orm(orm: ProcessedContentORM) -> SourceInfo:
+    return SourceInfo(
+        source_type=SourceType(orm.source_type),  # String to enum
+        uri=orm.uri,
+        original_source=orm.original_source,
+        hash=orm.source_hash,
+    )
+
+
+def _enrichment_from_orm(orm: ProcessedContentORM) -> EnrichedData:
+    return EnrichedData(
+        source_type=SourceType(orm.source_type),
+        title=orm.title or "",
+        description=orm.description or "",
+        summary=orm.summary or "",
+        topics=orm.topics or [],
+        entities=orm.entities or [],
+    )
+
+
 def from_orm(orm: ProcessedContentORM) -> ProcessedContent:
-    """Convert ORM model to domain model."""
+    """Convert ORM model (loaded with its body) to domain model."""
     return ProcessedContent(
-        source=SourceInfo(
-            source_type=SourceType(orm.source_type),  # String to enum
-            uri=orm.uri,
-            original_source=orm.original_source,
-            hash=orm.source_hash,
-        ),
+        source=_source_from_orm(orm),
         content=ContentData(
             source_type=SourceType(orm.source_type),
-            text=orm.content_text,
+            text=body_text(orm.body),
             metadata=orm.content_metadata or {},
+            token_count=orm.content_tokens,
         ),
-        enrichment=EnrichedData(
-            source_type=SourceType(orm.source_type),
-            title=orm.title or "",
-            description=orm.description or "",
-            summary=orm.summary or "",
-            topics=orm.topics or [],
-            entities=orm.entities or [],
-        ),
+        enrichment=_enrichment_from_orm(orm),
+        tags=orm.tags or [],
+        created_at=orm.created_at,
+        updated_at=orm.updated_at,
+    )
+
+
+def summary_from_orm(orm: ProcessedContentORM) -> ProcessedContentSummary:
+    """Convert an ORM row loaded with SUMMARY_LOAD (no content columns) to a summary."""
+    return ProcessedContentSummary(
+        source=_source_from_orm(orm),
+        enrichment=_enrichment_from_orm(orm),
         tags=orm.tags or [],
         created_at=orm.created_at,
         updated_at=orm.updated_at,
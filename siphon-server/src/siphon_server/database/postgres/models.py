@@ -1,13 +1,70 @@
 # pyright: basic
 # ^^^ because of SQLAlchemy dynamic attributes
 
-from sqlalchemy import Column, Integer, String, Text, ARRAY
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    ARRAY,
+    func,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import defer, deferred, raiseload, relationship
 from siphon_server.database.postgres.connection import Base
 
 
+# Text search configuration for the search_vector column and its queries
+SEARCH_CONFIG = "english"
+# Leading characters of the body text that are indexed; keeps multi-hour transcripts
+# under Postgres's 1 MB tsvector limit
+SEARCH_CONTENT_CHARS = 200_000
+
+
+def search_vector(title, description, summary, text):
+    """
+    SQL expression for a row's search_vector, from values or column expressions; text
+    is the leading SEARCH_CONTENT_CHARS of the body. Weighted so title matches outrank
+    description/summary matches, which outrank body text. Written by the repository
+    with each row: the body lives compressed in content_bodies, where a generated
+    column can't read it.
+    """
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+
+    def weighted(value: str, weight: str):
+        return func.setweight(func.to_tsvector(config, func.coalesce(value, "")), weight)
+
+    return (
+        weighted(title, "A")
+        .op("||")(weighted(description, "B"))
+        .op("||")(weighted(summary, "B"))
+        .op("||")(weighted(text, "D"))
+    )
+
+
+class ContentBodyORM(Base):
+    """
+    Extracted text, compressed by the application and stored once per distinct body.
+    """
+
+    __tablename__ = "content_bodies"
+
+    content_hash = Column(String, primary_key=True)  # sha256 of the uncompressed text
+    codec = Column(String, nullable=False)  # See database.postgres.bodies
+    body = Column(LargeBinary, nullable=False)
+    length = Column(Integer, nullable=False)  # Characters, uncompressed
+
+
 class ProcessedContentORM(Base):
     __tablename__ = "processed_content"
+    __table_args__ = (
+        Index("ix_processed_content_search", "search_vector", postgresql_using="gin"),
+    )
 
     # Primary key: integer for internal DB operations
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -20,8 +77,12 @@ class ProcessedContentORM(Base):
     original_source = Column(String, nullable=False)
     source_hash = Column(String)
 
-    # ContentData
-    content_text = Column(Text, nullable=False)
+    # ContentData: the text itself is in content_bodies
+    content_hash = Column(
+        String, ForeignKey("content_bodies.content_hash"), nullable=False, index=True
+    )
+    content_length = Column(Integer, nullable=False)  # Characters
+    content_tokens = Column(Integer)  # When known at write time
     content_metadata = Column(JSONB, default=dict)
 
     # EnrichedData fields
@@ -35,3 +96,32 @@ class ProcessedContentORM(Base):
     tags = Column(ARRAY(String), default=list)
     created_at = Column(Integer, nullable=False)
     updated_at = Column(Integer, nullable=False)
+
+    # Full-text search: written with the row (see search_vector()), never loaded
+    search_vector = deferred(Column(TSVECTOR))
+
+    # Full reads join the body in the same query
+    body = relationship(ContentBodyORM, lazy="joined", innerjoin=True, viewonly=True)
+
+
+# Loader options for summary reads: skip the body join and content metadata (a
+# transcript can run to megabytes) and raise, rather than lazy-load, if one is touched.
+SUMMARY_LOAD = (
+    raiseload(ProcessedContentORM.body),
+    defer(ProcessedContentORM.content_metadata, raiseload=True),
+)
+
+
+class WorkLeaseORM(Base):
+    """
+    A claim on one unit of pipeline work (extract a URI, enrich a content hash), so
+    identical work in other processes waits for it rather than repeating it. Held
+    without a connection: a claim is one short statement and expires on its own if the
+    holder dies. See ContentRepository.claim_lease.
+    """
+
+    __tablename__ = "work_leases"
+
+    key = Column(String, primary_key=True)
+    token = Column(String, nullable=False)  # Identifies the holder; release checks it
+    expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,16 +1,231 @@
 from contextlib import contextmanager
+from collections.abc import Iterable, Iterator
+from sqlalchemy import Select, func, literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
-from siphon_api.models import ProcessedContent
-from siphon_server.database.postgres.connection import SessionLocal
-from siphon_server.database.postgres.models import ProcessedContentORM
-from siphon_server.database.postgres.converters import to_orm, from_orm
+from siphon_api.enums import SourceType
+from siphon_api.models import (
+    ContentPage,
+    ProcessedContent,
+    ProcessedContentSummary,
+    SearchResult,
+)
+from siphon_server.database.postgres.connection import (
+    SessionLocal,
+    get_engine,
+    get_listen_engine,
+)
+from siphon_server.database.postgres.models import (
+    ContentBodyORM,
+    ProcessedContentORM,
+    SUMMARY_LOAD,
+    SEARCH_CONFIG,
+)
+from siphon_server.database.postgres.converters import (
+    to_body,
+    to_write_row,
+    from_orm,
+    summary_from_orm,
+)
+from siphon_server.database.postgres.bodies import body_hash
+from siphon_server.database.postgres.content_cache import (
+    CHANNEL,
+    ContentLRU,
+    ContentListener,
+    notify_payload,
+)
+from siphon_server.database.common import (
+    MAX_PAGE_SIZE,
+    advisory_key,
+    batches,
+    configured_batch_size,
+    read_lru,
+)
+from siphon_server.core.metrics import METRICS
+import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Waiting on a lock is not a slow query: exempt it from db_statement_timeout
+_ADVISORY_LOCK = (
+    text("SET LOCAL statement_timeout = 0"),
+    text("SELECT pg_advisory_lock(:id)"),
+)
+_ADVISORY_UNLOCK = text("SELECT pg_advisory_unlock(:id)")
+# Claims key unless a live lease holds it; returns the token only when claimed
+_CLAIM_LEASE = text(
+    "INSERT INTO work_leases (key, token, expires_at) "
+    "VALUES (:key, :token, now() + make_interval(secs => :ttl)) "
+    "ON CONFLICT (key) DO UPDATE SET token = excluded.token, "
+    "expires_at = excluded.expires_at WHERE work_leases.expires_at < now() "
+    "RETURNING token"
+)
+_RELEASE_LEASE = text("DELETE FROM work_leases WHERE key = :key AND token = :token")
+
+
+# Postgres accepts at most 65535 bind parameters per statement
+_MAX_PARAMS = 65535
+
+_NOTIFY = text(
+    "SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"
+)
+
+
+def notify_params(uris: Iterable[str]) -> dict:
+    """Bind parameters for _NOTIFY: one invalidation per URI."""
+    return {"channel": CHANNEL, "payloads": [notify_payload(uri) for uri in uris]}
+
+
+def _upsert_statement(rows: list[dict]):
+    """INSERT rows, updating every column except id on a URI conflict."""
+    stmt = insert(ProcessedContentORM).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[ProcessedContentORM.uri],
+        set_={key: stmt.excluded[key] for key in rows[0] if key != "uri"},
+    )
+
+
+def _write_statements(batch: list[ProcessedContent], upsert: bool = True) -> list:
+    """
+    Statements that persist batch, in order: each distinct body once (bodies already
+    stored under another URI are kept as they are), then the rows that reference them.
+    """
+    by_hash = {body_hash(pc.content.text): pc for pc in batch}
+    bodies = insert(ContentBodyORM).values([to_body(pc) for pc in by_hash.values()])
+    bodies = bodies.on_conflict_do_nothing(index_elements=[ContentBodyORM.content_hash])
+    rows = [to_write_row(pc) for pc in batch]
+    if upsert:
+        return [bodies, _upsert_statement(rows)]
+    return [bodies, insert(ProcessedContentORM).values(rows)]
+
+
+# Bodies no row references (content changed, or its rows were deleted)
+_PRUNE_BODIES = text(
+    "DELETE FROM content_bodies b WHERE NOT EXISTS "
+    "(SELECT 1 FROM processed_content p WHERE p.content_hash = b.content_hash)"
+)
+
+
+def _filtered(
+    stmt: Select, source_type: SourceType | None, since: int | None
+) -> Select:
+    """Restrict stmt to one source type and/or rows updated at or after since."""
+    if source_type is not None:
+        stmt = stmt.where(ProcessedContentORM.source_type == source_type.value)
+    if since is not None:
+        stmt = stmt.where(ProcessedContentORM.updated_at >= since)
+    return stmt
+
+
+def _iter_statement(source_type: SourceType | None, since: int | None, batch_size: int):
+    """Full rows in id order, fetched batch_size at a time from a server-side cursor."""
+    stmt = _filtered(select(ProcessedContentORM), source_type, since)
+    return stmt.order_by(ProcessedContentORM.id).execution_options(yield_per=batch_size)
+
+
+def _page_statement(
+    after_id: int | None, limit: int, source_type: SourceType | None, since: int | None
+) -> Select:
+    """Keyset page: summaries with id > after_id, in id order."""
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+    stmt = _filtered(select(ProcessedContentORM).options(*SUMMARY_LOAD), source_type, since)
+    if after_id is not None:
+        stmt = stmt.where(ProcessedContentORM.id > after_id)
+    return stmt.order_by(ProcessedContentORM.id).limit(limit)
+
+
+def _page(orm_objs: list[ProcessedContentORM], limit: int) -> ContentPage:
+    return ContentPage(
+        items=[summary_from_orm(orm_obj) for orm_obj in orm_objs],
+        # A short page is the last one
+        next_after_id=orm_objs[-1].id if len(orm_objs) == limit else None,
+    )
+
+
+# ts_headline options: marks are plain text so snippets render anywhere
+_HEADLINE_OPTIONS = "StartSel=**, StopSel=**, MaxWords=35, MinWords=15, MaxFragments=2"
+
+
+def _search_statement(query: str, source_type: SourceType | None, limit: int):
+    """
+    Rank matches by the GIN-indexed search_vector, then build snippets for the top
+    `limit` rows only (ts_headline re-parses the text, so it must not run per match).
+    """
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    tsquery = func.websearch_to_tsquery(config, query)
+    rank = func.ts_rank_cd(ProcessedContentORM.search_vector, tsquery)
+    top = _filtered(
+        select(ProcessedContentORM.id, rank.label("rank")).where(
+            ProcessedContentORM.search_vector.bool_op("@@")(tsquery)
+        ),
+        source_type,
+        None,
+    )
+    top = top.order_by(rank.desc(), ProcessedContentORM.id).limit(limit).subquery()
+    # Bodies are compressed by the application, so snippets come from the enrichment
+    document = func.concat_ws(
+        " ... ",
+        ProcessedContentORM.title,
+        ProcessedContentORM.description,
+        ProcessedContentORM.summary,
+    )
+    snippet = func.ts_headline(config, document, tsquery, _HEADLINE_OPTIONS)
+    return (
+        select(ProcessedContentORM, top.c.rank, snippet.label("snippet"))
+        .options(*SUMMARY_LOAD)
+        .join(top, ProcessedContentORM.id == top.c.id)
+        .order_by(top.c.rank.desc(), ProcessedContentORM.id)
+    )
+
+
+def _search_results(rows) -> list[SearchResult]:
+    return [
+        SearchResult(summary=summary_from_orm(orm_obj), rank=rank, snippet=snippet or "")
+        for orm_obj, rank, snippet in rows
+    ]
+
+
+def read_cache(
+    cache_size: int | None, cache_ttl: float | None, listen: bool
+) -> tuple[ContentLRU, ContentListener | None]:
+    """The read-through LRU (and its invalidation listener) for a repository."""
+    lru = read_lru(cache_size, cache_ttl)
+    # Started on the first cached read: constructing a repository never connects
+    listener = (
+        ContentListener(lru, lambda: get_listen_engine().raw_connection())
+        if listen and lru.maxsize > 0
+        else None
+    )
+    return lru, listener
+
+
+def resolve_batch_size(batch_size: int | None) -> int:
+    """batch_size, or the `repository_batch_size` setting, capped by the parameter limit."""
+    # Rows bind each column plus the search_vector inputs; bodies bind a few more
+    per_row = 2 * len(ProcessedContentORM.__table__.columns)
+    return min(configured_batch_size(batch_size), _MAX_PARAMS // per_row)
+
+
 class ContentRepository:
-    """Self-managing repository with automatic session handling."""
+    """
+    Self-managing repository with automatic session handling.
+
+    Reads through `get_or_none` are served from an in-process LRU (see content_cache),
+    sized by the `repository_cache_size` / `repository_cache_ttl` settings. Writes evict
+    the URI here and, via NOTIFY, on every other node. Pass listen=False to skip the
+    LISTEN thread (the TTL alone then bounds staleness).
+    """
+
+    def __init__(
+        self,
+        cache_size: int | None = None,
+        cache_ttl: float | None = None,
+        listen: bool = True,
+    ):
+        self._cache, self._listener = read_cache(cache_size, cache_ttl, listen)
 
     @contextmanager
     def _session(self):
@@ -25,12 +240,86 @@ class ContentRepository:
         finally:
             db.close()
 
+    @contextmanager
+    def advisory_lock(self, key: str):
+        """
+        Hold a session-level Postgres advisory lock on key, blocking until acquired.
+        Keeps a pooled connection for as long as it is held, so only guard short
+        critical sections (a check-and-write) with it; use claim_lease for long work.
+        """
+        lock_id = advisory_key(key)
+        with get_engine().connect() as conn:
+            for statement in _ADVISORY_LOCK:
+                conn.execute(statement, {"id": lock_id})
+            conn.commit()
+            try:
+                yield
+            finally:
+                conn.execute(_ADVISORY_UNLOCK, {"id": lock_id})
+                conn.commit()
+
+    def claim_lease(self, key: str, ttl: float) -> str | None:
+        """
+        Claim key for ttl seconds without waiting: a token for release_lease, or None
+        while another holder's lease is live. Serializes identical long-running work
+        (extracting one URI) across processes and hosts; no connection is held between
+        claim and release, and a holder that dies frees the key when its lease expires.
+        """
+        token = uuid.uuid4().hex
+        with get_engine().begin() as conn:
+            claimed = conn.scalar(_CLAIM_LEASE, {"key": key, "token": token, "ttl": ttl})
+        return token if claimed else None
+
+    def release_lease(self, key: str, token: str) -> None:
+        """Give up a lease from claim_lease (a no-op once it has expired and moved on)."""
+        with get_engine().begin() as conn:
+            conn.execute(_RELEASE_LEASE, {"key": key, "token": token})
+
+    def _notify(self, db, *uris: str) -> None:
+        """Queue cross-node invalidations for uris; delivered when db commits."""
+        db.execute(_NOTIFY, notify_params(uris))
+
     def get(self, uri: str) -> ProcessedContent | None:
         """Get content by URI. Returns None if not found."""
         with self._session() as db:
             orm_obj = db.query(ProcessedContentORM).filter_by(uri=uri).first()
             return from_orm(orm_obj) if orm_obj else None
 
+    def get_summary(self, uri: str) -> ProcessedContentSummary | None:
+        """Get content by URI without its text and metadata. Returns None if not found."""
+        with self._session() as db:
+            orm_obj = (
+                db.query(ProcessedContentORM)
+                .options(*SUMMARY_LOAD)
+                .filter_by(uri=uri)
+                .first()
+            )
+            return summary_from_orm(orm_obj) if orm_obj else None
+
+    def get_or_none(self, uri: str) -> ProcessedContent | None:
+        """
+        Get content by URI through the in-process LRU: zero round trips on a hit, one
+        on a miss. Returns None if not found. The result is shared; don't mutate it.
+        """
+        if self._listener is not None:
+            self._listener.start()
+        cached = self._cache.get(uri)
+        METRICS.cache("repository.memory", cached is not None)
+        if cached is not None:
+            return cached
+        epoch = self._cache.epoch
+        pc = self.get(uri)
+        if pc is not None:
+            self._cache.put(uri, pc, epoch)
+        return pc
+
+    def invalidate(self, uri: str | None = None) -> None:
+        """Evict uri (or everything) from this process's read cache."""
+        if uri is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate(uri)
+
     def exists(self, uri: str) -> bool:
         """Check if content exists without loading data."""
         with self._session() as db:
@@ -38,64 +327,107 @@ class ContentRepository:
                 db.query(ProcessedContentORM).filter_by(uri=uri).exists()
             ).scalar()
 
+    def get_many(
+        self, uris: Iterable[str], batch_size: int | None = None
+    ) -> dict[str, ProcessedContent]:
+        """Get content for many URIs, one query per batch. Missing URIs are absent."""
+        batch_size = resolve_batch_size(batch_size)
+        found: dict[str, ProcessedContent] = {}
+        pending = list(dict.fromkeys(uris))
+        with self._session() as db:
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start : start + batch_size]
+                for orm_obj in db.query(ProcessedContentORM).filter(
+                    ProcessedContentORM.uri.in_(chunk)
+                ):
+                    found[orm_obj.uri] = from_orm(orm_obj)
+        return found
+
+    def get_summaries(
+        self, uris: Iterable[str], batch_size: int | None = None
+    ) -> dict[str, ProcessedContentSummary]:
+        """get_many without text and metadata."""
+        batch_size = resolve_batch_size(batch_size)
+        found: dict[str, ProcessedContentSummary] = {}
+        pending = list(dict.fromkeys(uris))
+        with self._session() as db:
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start : start + batch_size]
+                for orm_obj in (
+                    db.query(ProcessedContentORM)
+                    .options(*SUMMARY_LOAD)
+                    .filter(ProcessedContentORM.uri.in_(chunk))
+                ):
+                    found[orm_obj.uri] = summary_from_orm(orm_obj)
+        return found
+
     def set(self, pc: ProcessedContent) -> None:
         """Create or update content."""
-        with self._session() as db:
-            existing = (
-                db.query(ProcessedContentORM).filter_by(uri=pc.source.uri).first()
-            )
+        self.upsert_many([pc])
+        logger.info(f"Stored content: {pc.source.uri}")
 
-            if existing:
-                # Update
-                for key, value in to_orm(pc).__dict__.items():
-                    if key not in ("id", "_sa_instance_state"):
-                        setattr(existing, key, value)
+    def upsert_many(
+        self, items: Iterable[ProcessedContent], batch_size: int | None = None
+    ) -> int:
+        """
+        Create or update many items with INSERT ... ON CONFLICT (uri) DO UPDATE, one
+        statement and one transaction per batch (`repository_batch_size` by default).
+        Batches before a failing one stay committed. Returns rows written.
+        """
+        batch_size = resolve_batch_size(batch_size)
+        written = 0
+        with self._session() as db:
+            for batch in batches(items, batch_size):
+                uris = [pc.source.uri for pc in batch]
+                for stmt in _write_statements(batch):
+                    db.execute(stmt)
+                self._notify(db, *uris)
                 db.commit()
-                db.refresh(existing)
-                logger.info(f"Updated content: {pc.source.uri}")
-            else:
-                # Create
-                orm_obj = to_orm(pc)
-                db.add(orm_obj)
-                try:
-                    db.commit()
-                    db.refresh(orm_obj)
-                    logger.info(f"Created content: {pc.source.uri}")
-                except IntegrityError:
-                    db.rollback()
-                    raise ValueError(f"Content with URI {pc.source.uri} already exists")
+                for uri in uris:
+                    self._cache.invalidate(uri)
+                written += len(batch)
+                logger.debug(f"Upserted {len(batch)} rows ({written} so far).")
+        return written
+
+    def set_many(
+        self, items: Iterable[ProcessedContent], batch_size: int | None = None
+    ) -> int:
+        """Create or update many items; see upsert_many."""
+        return self.upsert_many(items, batch_size)
 
     def create(self, pc: ProcessedContent) -> ProcessedContent:
         """Create new content. Raises ValueError if URI already exists."""
         with self._session() as db:
-            orm_obj = to_orm(pc)
-            db.add(orm_obj)
             try:
+                for stmt in _write_statements([pc], upsert=False):
+                    db.execute(stmt)
+                self._notify(db, pc.source.uri)
                 db.commit()
-                db.refresh(orm_obj)
                 logger.info(f"Created content: {pc.source.uri}")
-                return from_orm(orm_obj)
             except IntegrityError:
                 db.rollback()
                 raise ValueError(f"Content with URI {pc.source.uri} already exists")
+        self._cache.invalidate(pc.source.uri)
+        return self.get(pc.source.uri)
 
     def update(self, pc: ProcessedContent) -> ProcessedContent:
         """Update existing content. Raises ValueError if not found."""
-        with self._session() as db:
-            existing = (
-                db.query(ProcessedContentORM).filter_by(uri=pc.source.uri).first()
-            )
-            if not existing:
-                raise ValueError(f"Content with URI {pc.source.uri} not found")
-
-            for key, value in to_orm(pc).__dict__.items():
-                if key not in ("id", "_sa_instance_state"):
-                    setattr(existing, key, value)
+        if not self.exists(pc.source.uri):
+            raise ValueError(f"Content with URI {pc.source.uri} not found")
+        self.upsert_many([pc])
+        logger.info(f"Updated content: {pc.source.uri}")
+        return self.get(pc.source.uri)
 
-            db.commit()
-            db.refresh(existing)
-            logger.info(f"Updated content: {pc.source.uri}")
-            return from_orm(existing)
+    def prune_bodies(self) -> int:
+        """
+        Delete bodies no row references any more. Returns bodies deleted. A maintenance
+        step: run it while nothing is ingesting (a concurrent write may be about to
+        reuse a body it considers stored).
+        """
+        with self._session() as db:
+            deleted = db.execute(_PRUNE_BODIES).rowcount
+        logger.info(f"Pruned {deleted} unreferenced content bodies.")
+        return deleted
 
     def get_existing_uris(self, uris: list[str]) -> list[str]:
         """Batch check which URIs exist. Returns list of existing URIs."""
@@ -117,3 +449,60 @@ class ContentRepository:
                 .first()
             )
             return from_orm(orm_obj) if orm_obj else None
+
+    def get_last_summary(self) -> ProcessedContentSummary | None:
+        """get_last_processed_content without text and metadata."""
+        with self._session() as db:
+            orm_obj = (
+                db.query(ProcessedContentORM)
+                .options(*SUMMARY_LOAD)
+                .order_by(ProcessedContentORM.created_at.desc())
+                .first()
+            )
+            return summary_from_orm(orm_obj) if orm_obj else None
+
+    def iter_all(
+        self,
+        source_type: SourceType | None = None,
+        since: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[ProcessedContent]:
+        """
+        Stream every row (optionally one source type, or updated at or after since) in
+        id order through a server-side cursor, batch_size rows at a time, so memory stays
+        flat however large the table. Holds one connection until exhausted or closed.
+        """
+        stmt = _iter_statement(source_type, since, resolve_batch_size(batch_size))
+        with self._session() as db:
+            for orm_obj in db.scalars(stmt):
+                yield from_orm(orm_obj)
+
+    def search(
+        self, query: str, source_type: SourceType | None = None, limit: int = 20
+    ) -> list[SearchResult]:
+        """
+        Full-text search over title, description, summary and content (web-search
+        syntax: "phrases", OR, -term). Returns summaries, best match first, with snippets.
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+        with self._session() as db:
+            return _search_results(db.execute(_search_statement(query, source_type, limit)))
+
+    # Last: inside the class body, the name shadows the builtin for later annotations
+    def list(
+        self,
+        after_id: int | None = None,
+        limit: int = 100,
+        source_type: SourceType | None = None,
+        since: int | None = None,
+    ) -> ContentPage:
+        """
+        One keyset-paginated page of summaries in id order. Start with after_id=None and
+        pass each page's next_after_id to get the next; cost is flat at any depth.
+        """
+        with self._session() as db:
+            orm_objs = db.scalars(
+                _page_statement(after_id, limit, source_type, since)
+            ).all()
+            return _page(orm_objs, limit)
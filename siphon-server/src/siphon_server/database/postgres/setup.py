@@ -7,8 +7,17 @@ This is typically invoked during server startup or development environment setup
 """
 
 # database/postgres/setup.py
-from siphon_server.database.postgres.connection import Base, engine
-from siphon_server.database.postgres.models import ProcessedContentORM  # MUST import!
+from siphon_server.database.postgres.connection import Base, get_engine
+from siphon_server.database.postgres.models import (  # MUST import!
+    ContentBodyORM,
+    ProcessedContentORM,
+    SEARCH_CONTENT_CHARS,
+    WorkLeaseORM,
+    search_vector,
+)
+from siphon_server.database.postgres.bodies import body_row
+from sqlalchemy import bindparam, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import logging
 import os
 
@@ -20,16 +29,156 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Need the pgvector extension; created on demand by create_embedding_tables
+EMBEDDING_TABLES = ("content_embeddings",)
+
 
 def create_tables():
-    """Create all database tables."""
+    """Create all database tables (except the opt-in embedding store)."""
+    engine = get_engine()
     logger.info(f"Creating tables in database: {engine.url.database}")
-    logger.info(f"Models registered: {Base.metadata.tables.keys()}")
+    tables = [
+        table
+        for table in Base.metadata.sorted_tables
+        if table.name not in EMBEDDING_TABLES
+    ]
+    logger.info(f"Models registered: {[table.name for table in tables]}")
 
-    Base.metadata.create_all(engine)
+    Base.metadata.create_all(engine, tables=tables)
+    upgrade_tables()
+    migrate_content_bodies()
 
     logger.info("Tables created successfully!")
 
 
+def create_embedding_tables():
+    """
+    Create content_embeddings and the pgvector extension it needs. Opt-in, so a server
+    without pgvector (or the privilege to create extensions) can still run create_tables;
+    `siphon-server embed` calls it.
+    """
+    from siphon_server.database.vector.pgvector import ContentEmbeddingORM
+
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+    ContentEmbeddingORM.__table__.create(engine, checkfirst=True)
+    logger.info("Embedding tables created successfully!")
+
+
+# Columns added after a table may already exist; create_all won't add them.
+UPGRADES = [
+    "ALTER TABLE processed_content ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    "CREATE INDEX IF NOT EXISTS ix_processed_content_search "
+    "ON processed_content USING gin (search_vector)",
+    "ALTER TABLE processed_content ADD COLUMN IF NOT EXISTS content_hash varchar",
+    "ALTER TABLE processed_content ADD COLUMN IF NOT EXISTS content_length integer",
+    "ALTER TABLE processed_content ADD COLUMN IF NOT EXISTS content_tokens integer",
+    "CREATE INDEX IF NOT EXISTS ix_processed_content_content_hash "
+    "ON processed_content (content_hash)",
+    # Bodies arrive compressed; don't let TOAST try again
+    "ALTER TABLE content_bodies ALTER COLUMN body SET STORAGE EXTERNAL",
+]
+
+
+def upgrade_tables():
+    """Bring existing tables up to the current models (idempotent)."""
+    with get_engine().begin() as conn:
+        for statement in UPGRADES:
+            conn.execute(text(statement))
+
+
+def migrate_content_bodies(batch_size: int = 500):
+    """
+    Move processed_content.content_text (the pre-content_bodies layout) into
+    content_bodies, batch_size rows per transaction, then drop the column. Resumable:
+    rows already moved have a content_hash. A no-op once the column is gone.
+    """
+    engine = get_engine()
+    with engine.begin() as conn:
+        if not conn.scalar(
+            text(
+                "SELECT 1 FROM information_schema.columns WHERE table_name = "
+                "'processed_content' AND column_name = 'content_text'"
+            )
+        ):
+            return
+        # search_vector was generated from content_text; the repository writes it now
+        conn.execute(
+            text(
+                "ALTER TABLE processed_content "
+                "ALTER COLUMN search_vector DROP EXPRESSION IF EXISTS"
+            )
+        )
+
+    table = ProcessedContentORM.__table__
+    set_row = (
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values(
+            content_hash=bindparam("hash"),
+            content_length=bindparam("length"),
+            search_vector=search_vector(
+                table.c.title,
+                table.c.description,
+                table.c.summary,
+                bindparam("text"),
+            ),
+        )
+    )
+    moved = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT id, content_text FROM processed_content "
+                    "WHERE content_hash IS NULL ORDER BY id LIMIT :limit"
+                ),
+                {"limit": batch_size},
+            ).all()
+            if not rows:
+                break
+            bodies = {}
+            params = []
+            for row_id, content_text in rows:
+                body = body_row(content_text or "")
+                bodies[body["content_hash"]] = body
+                params.append(
+                    dict(
+                        row_id=row_id,
+                        hash=body["content_hash"],
+                        length=body["length"],
+                        text=(content_text or "")[:SEARCH_CONTENT_CHARS],
+                    )
+                )
+            conn.execute(
+                pg_insert(ContentBodyORM)
+                .values(list(bodies.values()))
+                .on_conflict_do_nothing(index_elements=["content_hash"])
+            )
+            conn.execute(set_row, params)
+            moved += len(rows)
+            logger.info(f"Moved {moved} bodies into content_bodies...")
+
+    with engine.begin() as conn:
+        conn.execute(
+            text("ALTER TABLE processed_content ALTER COLUMN content_hash SET NOT NULL")
+        )
+        conn.execute(
+            text(
+                "ALTER TABLE processed_content ALTER COLUMN content_length SET NOT NULL"
+            )
+        )
+        conn.execute(
+            text(
+                "ALTER TABLE processed_content ADD CONSTRAINT "
+                "processed_content_content_hash_fkey FOREIGN KEY (content_hash) "
+                "REFERENCES content_bodies (content_hash)"
+            )
+        )
+        conn.execute(text("ALTER TABLE processed_content DROP COLUMN content_text"))
+    logger.info(f"content_bodies migration complete ({moved} rows).")
+
+
 if __name__ == "__main__":
     create_tables()
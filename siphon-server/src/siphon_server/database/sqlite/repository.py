@@ -0,0 +1,700 @@
+"""
+Embedded SQLite implementation of the ContentRepository interface.
+
+For laptops, CI and single-node deployments that shouldn't need a networked Postgres: everything lives in one file (the `sqlite_path` setting, `$XDG_DATA_HOME/siphon/siphon.db` by default) and is selected with `repository_backend = "sqlite"` (see `database.backend.get_repository`). The layout mirrors the Postgres one:
+
+- `processed_content` holds one row per URI; lists and content metadata are JSON text (JSON1 validates them on write).
+- `content_bodies` holds each distinct extracted text once, compressed by the application (`database.postgres.bodies`).
+- `content_fts` is an FTS5 index over title, description, summary and the leading `SEARCH_CONTENT_CHARS` of the body, ranked with bm25 (weights mirror the Postgres search_vector).
+- `content_changes` is a short log of written URIs. Writers append to it in the writing transaction; `get_or_none` reads entries newer than the last it saw and evicts them from its LRU. This is the single-node stand-in for NOTIFY. Other processes sharing the file stay coherent, and a trimmed gap empties the LRU.
+
+The database runs in WAL mode, so readers never block the writer. Each thread has its own connection, and writes take the lock up front (BEGIN IMMEDIATE).
+
+Usage:
+```python
+from siphon_server.database.sqlite.repository import SQLiteContentRepository
+
+repository = SQLiteContentRepository("/tmp/siphon.db")
+repository.set(processed_content)
+repository.get_or_none(processed_content.uri)
+```
+"""
+
+from contextlib import contextmanager
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from siphon_api.enums import SourceType
+from siphon_api.models import (
+    ContentData,
+    ContentPage,
+    EnrichedData,
+    ProcessedContent,
+    ProcessedContentSummary,
+    SearchResult,
+    SourceInfo,
+)
+from siphon_server.database.postgres.bodies import body_hash, decompress
+from siphon_server.database.postgres.converters import to_body, to_row
+from siphon_server.database.postgres.models import SEARCH_CONTENT_CHARS
+from siphon_server.database.common import (
+    MAX_PAGE_SIZE,
+    advisory_key,
+    batches,
+    configured_batch_size,
+    read_lru,
+)
+from siphon_server.core.metrics import METRICS
+import threading
+import sqlite3
+import fcntl
+import time
+import uuid
+import json
+import re
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+_BUSY_TIMEOUT_MS = 30_000  # Wait this long for another writer before failing
+_CHANGE_LOG_ROWS = 10_000  # content_changes entries kept for lagging readers
+_LOCK_STRIPES = 64  # In-process advisory lock stripes (fcntl locks are per process)
+_MAX_VARIABLES = 32766  # SQLite's bound-parameter limit (an IN list binds one per URI)
+# bm25 column weights (title, description, summary, body); like setweight A/B/B/D
+_BM25 = "bm25(content_fts, 10.0, 4.0, 4.0, 1.0)"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS content_bodies (
+    content_hash TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    body BLOB NOT NULL,
+    length INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS processed_content (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    uri TEXT NOT NULL UNIQUE,
+    source_type TEXT NOT NULL,
+    original_source TEXT NOT NULL,
+    source_hash TEXT,
+    content_hash TEXT NOT NULL REFERENCES content_bodies (content_hash),
+    content_length INTEGER NOT NULL,
+    content_tokens INTEGER,
+    content_metadata TEXT NOT NULL DEFAULT '{}' CHECK (json_valid(content_metadata)),
+    title TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL DEFAULT '',
+    topics TEXT NOT NULL DEFAULT '[]' CHECK (json_valid(topics)),
+    entities TEXT NOT NULL DEFAULT '[]' CHECK (json_valid(entities)),
+    tags TEXT NOT NULL DEFAULT '[]' CHECK (json_valid(tags)),
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_processed_content_source_type
+    ON processed_content (source_type);
+CREATE INDEX IF NOT EXISTS ix_processed_content_content_hash
+    ON processed_content (content_hash);
+CREATE INDEX IF NOT EXISTS ix_processed_content_created_at
+    ON processed_content (created_at);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS content_fts USING fts5 (
+    title, description, summary, body, tokenize = 'porter unicode61'
+);
+
+CREATE TABLE IF NOT EXISTS content_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    uri TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS work_leases (
+    key TEXT PRIMARY KEY,
+    token TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+# processed_content columns written from ProcessedContent, in to_row's order
+_COLUMNS = (
+    "uri",
+    "source_type",
+    "original_source",
+    "source_hash",
+    "content_hash",
+    "content_length",
+    "content_tokens",
+    "content_metadata",
+    "title",
+    "description",
+    "summary",
+    "topics",
+    "entities",
+    "tags",
+    "created_at",
+    "updated_at",
+)
+_JSON_COLUMNS = {"content_metadata", "topics", "entities", "tags"}
+_SUMMARY_COLUMNS = (
+    "p.id, p.uri, p.source_type, p.original_source, p.source_hash, p.title, "
+    "p.description, p.summary, p.topics, p.entities, p.tags, p.created_at, p.updated_at"
+)
+_FULL_SELECT = (
+    f"SELECT {_SUMMARY_COLUMNS}, p.content_metadata, p.content_tokens, b.codec, b.body "
+    "FROM processed_content p JOIN content_bodies b USING (content_hash)"
+)
+_SUMMARY_SELECT = f"SELECT {_SUMMARY_COLUMNS} FROM processed_content p"
+
+_INSERT = (
+    f"INSERT INTO processed_content ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_COLUMNS))})"
+)
+_UPSERT = (
+    f"{_INSERT} ON CONFLICT (uri) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])
+    + " RETURNING id"
+)
+_PRUNE_BODIES = (
+    "DELETE FROM content_bodies WHERE NOT EXISTS (SELECT 1 FROM processed_content p "
+    "WHERE p.content_hash = content_bodies.content_hash)"
+)
+
+_CLAIM_LEASE = (
+    "INSERT INTO work_leases (key, token, expires_at) VALUES (?, ?, ?) "
+    "ON CONFLICT (key) DO UPDATE SET token = excluded.token, "
+    "expires_at = excluded.expires_at WHERE work_leases.expires_at < ? "
+    "RETURNING token"
+)
+
+_TOKEN = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+
+def fts_query(query: str) -> str | None:
+    """
+    Translate web-search syntax ("phrases", OR, -term; what the Postgres backend's
+    websearch_to_tsquery accepts) into an FTS5 query. Every term is quoted, so FTS5
+    operators and punctuation in the input are matched as text. None if nothing
+    positive is left to match.
+    """
+    positive: list[str] = []
+    negative: list[str] = []
+    for match in _TOKEN.finditer(query):
+        negated, phrase, word = match.groups()
+        if word is not None and word.upper() == "OR":
+            if positive and positive[-1] != "OR":
+                positive.append("OR")
+            continue
+        if word is not None and word.startswith("-") and len(word) > 1:
+            negated, word = "-", word[1:]
+        term = (phrase if phrase is not None else word).strip()
+        if not term:
+            continue
+        quoted = '"' + term.replace('"', '""') + '"'
+        (negative if negated else positive).append(quoted)
+    while positive and positive[-1] == "OR":
+        positive.pop()
+    if not positive:
+        return None
+    return f"({' '.join(positive)})" + "".join(f" NOT {term}" for term in negative)
+
+
+def _values(pc: ProcessedContent) -> tuple:
+    row = to_row(pc)
+    return tuple(
+        json.dumps(row[column]) if column in _JSON_COLUMNS else row[column]
+        for column in _COLUMNS
+    )
+
+
+def _source(row: sqlite3.Row) -> SourceInfo:
+    return SourceInfo(
+        source_type=SourceType(row["source_type"]),
+        uri=row["uri"],
+        original_source=row["original_source"],
+        hash=row["source_hash"],
+    )
+
+
+def _enrichment(row: sqlite3.Row) -> EnrichedData:
+    return EnrichedData(
+        source_type=SourceType(row["source_type"]),
+        title=row["title"],
+        description=row["description"],
+        summary=row["summary"],
+        topics=json.loads(row["topics"]),
+        entities=json.loads(row["entities"]),
+    )
+
+
+def _from_row(row: sqlite3.Row) -> ProcessedContent:
+    """A _FULL_SELECT row to the domain model."""
+    return ProcessedContent(
+        source=_source(row),
+        content=ContentData(
+            source_type=SourceType(row["source_type"]),
+            text=decompress(row["codec"], row["body"]),
+            metadata=json.loads(row["content_metadata"]),
+            token_count=row["content_tokens"],
+        ),
+        enrichment=_enrichment(row),
+        tags=json.loads(row["tags"]),
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+def _summary_from_row(row: sqlite3.Row) -> ProcessedContentSummary:
+    return ProcessedContentSummary(
+        source=_source(row),
+        enrichment=_enrichment(row),
+        tags=json.loads(row["tags"]),
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+def _filters(
+    source_type: SourceType | None, since: int | None
+) -> tuple[list[str], list]:
+    """WHERE clauses (on alias p) and their parameters."""
+    clauses, params = [], []
+    if source_type is not None:
+        clauses.append("p.source_type = ?")
+        params.append(source_type.value)
+    if since is not None:
+        clauses.append("p.updated_at >= ?")
+        params.append(since)
+    return clauses, params
+
+
+def _where(clauses: list[str]) -> str:
+    return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+
+def default_path() -> Path:
+    """The `sqlite_path` setting, or $XDG_DATA_HOME/siphon/siphon.db."""
+    from siphon_server.config import settings
+    from xdg_base_dirs import xdg_data_home
+
+    if settings.sqlite_path:
+        return Path(settings.sqlite_path).expanduser()
+    return Path(xdg_data_home()) / "siphon" / "siphon.db"
+
+
+def _batch_size(batch_size: int | None) -> int:
+    return min(configured_batch_size(batch_size), _MAX_VARIABLES)
+
+
+class _LockFile:
+    """
+    An open `<database>.locks` file and the in-process stripes guarding it. fcntl record
+    locks belong to the process, and closing any descriptor of the file drops every lock
+    the process holds on it, so there is one per path per process and it is never
+    closed. Same-offset keys share a stripe, so no two threads lock one byte range.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.stripes = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+
+
+_LOCK_FILES: dict[Path, _LockFile] = {}
+_LOCK_FILES_LOCK = threading.Lock()
+
+
+def _lock_file(path: Path) -> _LockFile:
+    """The process-wide _LockFile for path, shared by every repository on it."""
+    path = path.resolve()
+    with _LOCK_FILES_LOCK:
+        lock_file = _LOCK_FILES.get(path)
+        if lock_file is None:
+            lock_file = _LOCK_FILES[path] = _LockFile(path)
+        return lock_file
+
+
+class SQLiteContentRepository:
+    """
+    ContentRepository on an embedded SQLite database; see the module docstring.
+    Same methods, arguments and errors as the Postgres repository. The read cache uses
+    the `repository_cache_size` / `repository_cache_ttl` settings, and writes from
+    other processes sharing the file are picked up through content_changes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        cache_size: int | None = None,
+        cache_ttl: float | None = None,
+    ):
+        self.path = Path(path) if path is not None else default_path()
+        self._cache = read_lru(cache_size, cache_ttl)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self._seen_lock = threading.Lock()
+        self._seen_seq: int | None = None  # Last content_changes entry applied
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened (and the schema created) on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit: transactions are explicit (_transaction), reads see the latest commit
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")  # Durable across crashes, not power loss
+        conn.execute("PRAGMA foreign_keys = ON")
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(SCHEMA)
+                self._schema_ready = True
+        self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction; takes the database write lock up front."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @contextmanager
+    def advisory_lock(self, key: str):
+        """
+        Hold an exclusive lock on key, blocking until acquired. Serializes identical
+        work across threads and across processes on this host (a byte-range lock on
+        `<database>.locks`).
+        """
+        lock_id = advisory_key(key)
+        lock_file = _lock_file(Path(f"{self.path}.locks"))
+        with lock_file.stripes[lock_id % _LOCK_STRIPES]:
+            offset = lock_id % (2**31)
+            fcntl.lockf(lock_file.fd, fcntl.LOCK_EX, 1, offset)
+            try:
+                yield
+            finally:
+                fcntl.lockf(lock_file.fd, fcntl.LOCK_UN, 1, offset)
+
+    def claim_lease(self, key: str, ttl: float) -> str | None:
+        """
+        Claim key for ttl seconds without waiting: a token for release_lease, or None
+        while another holder's lease is live. Like ContentRepository.claim_lease, but
+        across the processes sharing this file.
+        """
+        token = uuid.uuid4().hex
+        now = time.time()
+        with self._transaction() as conn:
+            claimed = conn.execute(_CLAIM_LEASE, (key, token, now + ttl, now)).fetchone()
+        return token if claimed else None
+
+    def release_lease(self, key: str, token: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM work_leases WHERE key = ? AND token = ?", (key, token))
+
+    def _sync_cache(self) -> None:
+        """Evict URIs written by other connections since the last call."""
+        conn = self._connection()
+        with self._seen_lock:
+            if self._seen_seq is None:
+                self._seen_seq = conn.execute(
+                    "SELECT coalesce(max(seq), 0) FROM content_changes"
+                ).fetchone()[0]
+                self._cache.clear()
+                return
+            rows = conn.execute(
+                "SELECT seq, uri FROM content_changes WHERE seq > ? ORDER BY seq",
+                (self._seen_seq,),
+            ).fetchall()
+            if not rows:
+                return
+            if rows[0]["seq"] != self._seen_seq + 1:
+                # Entries we never saw were trimmed
+                self._cache.clear()
+            else:
+                for row in rows:
+                    self._cache.invalidate(row["uri"])
+            self._seen_seq = rows[-1]["seq"]
+
+    def _log_changes(self, conn: sqlite3.Connection, uris: list[str]) -> None:
+        conn.executemany(
+            "INSERT INTO content_changes (uri) VALUES (?)", [(uri,) for uri in uris]
+        )
+        conn.execute(
+            "DELETE FROM content_changes WHERE seq <= "
+            "(SELECT max(seq) FROM content_changes) - ?",
+            (_CHANGE_LOG_ROWS,),
+        )
+
+    def _write(self, conn: sqlite3.Connection, batch: list[ProcessedContent], upsert: bool):
+        """Persist batch (bodies, rows, search index, change log) inside conn's transaction."""
+        by_hash = {body_hash(pc.content.text): pc for pc in batch}
+        conn.executemany(
+            "INSERT OR IGNORE INTO content_bodies (content_hash, codec, body, length) "
+            "VALUES (:content_hash, :codec, :body, :length)",
+            [to_body(pc) for pc in by_hash.values()],
+        )
+        for pc in batch:
+            if upsert:
+                row_id = conn.execute(_UPSERT, _values(pc)).fetchone()[0]
+            else:
+                row_id = conn.execute(_INSERT, _values(pc)).lastrowid
+            conn.execute("DELETE FROM content_fts WHERE rowid = ?", (row_id,))
+            conn.execute(
+                "INSERT INTO content_fts (rowid, title, description, summary, body) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    row_id,
+                    pc.enrichment.title,
+                    pc.enrichment.description,
+                    pc.enrichment.summary,
+                    pc.content.text[:SEARCH_CONTENT_CHARS],
+                ),
+            )
+        self._log_changes(conn, [pc.source.uri for pc in batch])
+
+    def get(self, uri: str) -> ProcessedContent | None:
+        """Get content by URI. Returns None if not found."""
+        row = (
+            self._connection()
+            .execute(f"{_FULL_SELECT} WHERE p.uri = ?", (uri,))
+            .fetchone()
+        )
+        return _from_row(row) if row else None
+
+    def get_summary(self, uri: str) -> ProcessedContentSummary | None:
+        """Get content by URI without its text and metadata. Returns None if not found."""
+        row = (
+            self._connection()
+            .execute(f"{_SUMMARY_SELECT} WHERE p.uri = ?", (uri,))
+            .fetchone()
+        )
+        return _summary_from_row(row) if row else None
+
+    def get_or_none(self, uri: str) -> ProcessedContent | None:
+        """
+        Get content by URI through the in-process LRU. Returns None if not found. The
+        result is shared; don't mutate it.
+        """
+        self._sync_cache()
+        cached = self._cache.get(uri)
+        METRICS.cache("repository.memory", cached is not None)
+        if cached is not None:
+            return cached
+        epoch = self._cache.epoch
+        pc = self.get(uri)
+        if pc is not None:
+            self._cache.put(uri, pc, epoch)
+        return pc
+
+    def invalidate(self, uri: str | None = None) -> None:
+        """Evict uri (or everything) from this process's read cache."""
+        if uri is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate(uri)
+
+    def exists(self, uri: str) -> bool:
+        """Check if content exists without loading data."""
+        return (
+            self._connection()
+            .execute("SELECT 1 FROM processed_content WHERE uri = ?", (uri,))
+            .fetchone()
+            is not None
+        )
+
+    def get_many(
+        self, uris: Iterable[str], batch_size: int | None = None
+    ) -> dict[str, ProcessedContent]:
+        """Get content for many URIs, one query per batch. Missing URIs are absent."""
+        return {
+            row["uri"]: _from_row(row)
+            for row in self._select_in(_FULL_SELECT, uris, batch_size)
+        }
+
+    def get_summaries(
+        self, uris: Iterable[str], batch_size: int | None = None
+    ) -> dict[str, ProcessedContentSummary]:
+        """get_many without text and metadata."""
+        return {
+            row["uri"]: _summary_from_row(row)
+            for row in self._select_in(_SUMMARY_SELECT, uris, batch_size)
+        }
+
+    def _select_in(
+        self, select: str, uris: Iterable[str], batch_size: int | None
+    ) -> Iterator[sqlite3.Row]:
+        batch_size = _batch_size(batch_size)
+        pending = list(dict.fromkeys(uris))
+        conn = self._connection()
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            marks = ", ".join("?" * len(chunk))
+            yield from conn.execute(f"{select} WHERE p.uri IN ({marks})", chunk)
+
+    def set(self, pc: ProcessedContent) -> None:
+        """Create or update content."""
+        self.upsert_many([pc])
+        logger.info(f"Stored content: {pc.source.uri}")
+
+    def upsert_many(
+        self, items: Iterable[ProcessedContent], batch_size: int | None = None
+    ) -> int:
+        """
+        Create or update many items, one transaction per batch. Batches before a
+        failing one stay committed. Returns rows written.
+        """
+        batch_size = _batch_size(batch_size)
+        written = 0
+        for batch in batches(items, batch_size):
+            with self._transaction() as conn:
+                self._write(conn, batch, upsert=True)
+            for pc in batch:
+                self._cache.invalidate(pc.source.uri)
+            written += len(batch)
+            logger.debug(f"Upserted {len(batch)} rows ({written} so far).")
+        return written
+
+    def set_many(
+        self, items: Iterable[ProcessedContent], batch_size: int | None = None
+    ) -> int:
+        """Create or update many items; see upsert_many."""
+        return self.upsert_many(items, batch_size)
+
+    def create(self, pc: ProcessedContent) -> ProcessedContent:
+        """Create new content. Raises ValueError if URI already exists."""
+        try:
+            with self._transaction() as conn:
+                self._write(conn, [pc], upsert=False)
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Content with URI {pc.source.uri} already exists")
+        logger.info(f"Created content: {pc.source.uri}")
+        self._cache.invalidate(pc.source.uri)
+        return self.get(pc.source.uri)
+
+    def update(self, pc: ProcessedContent) -> ProcessedContent:
+        """Update existing content. Raises ValueError if not found."""
+        if not self.exists(pc.source.uri):
+            raise ValueError(f"Content with URI {pc.source.uri} not found")
+        self.upsert_many([pc])
+        logger.info(f"Updated content: {pc.source.uri}")
+        return self.get(pc.source.uri)
+
+    def prune_bodies(self) -> int:
+        """Delete bodies no row references any more. Returns bodies deleted."""
+        with self._transaction() as conn:
+            deleted = conn.execute(_PRUNE_BODIES).rowcount
+        logger.info(f"Pruned {deleted} unreferenced content bodies.")
+        return deleted
+
+    def get_existing_uris(self, uris: list[str]) -> list[str]:
+        """Batch check which URIs exist. Returns list of existing URIs."""
+        return [
+            row["uri"]
+            for row in self._select_in("SELECT p.uri FROM processed_content p", uris, None)
+        ]
+
+    def get_last_processed_content(self) -> ProcessedContent | None:
+        """Get the last processed content based on creation time."""
+        row = (
+            self._connection()
+            .execute(f"{_FULL_SELECT} ORDER BY p.created_at DESC, p.id DESC LIMIT 1")
+            .fetchone()
+        )
+        return _from_row(row) if row else None
+
+    def get_last_summary(self) -> ProcessedContentSummary | None:
+        """get_last_processed_content without text and metadata."""
+        row = (
+            self._connection()
+            .execute(f"{_SUMMARY_SELECT} ORDER BY p.created_at DESC, p.id DESC LIMIT 1")
+            .fetchone()
+        )
+        return _summary_from_row(row) if row else None
+
+    def iter_all(
+        self,
+        source_type: SourceType | None = None,
+        since: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[ProcessedContent]:
+        """
+        Stream every row (optionally one source type, or updated at or after since) in
+        id order, batch_size rows at a time.
+        """
+        batch_size = _batch_size(batch_size)
+        clauses, params = _filters(source_type, since)
+        cursor = self._connection().execute(
+            f"{_FULL_SELECT}{_where(clauses)} ORDER BY p.id", params
+        )
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield _from_row(row)
+        finally:
+            cursor.close()
+
+    def search(
+        self, query: str, source_type: SourceType | None = None, limit: int = 20
+    ) -> list[SearchResult]:
+        """
+        Full-text search over title, description, summary and content (web-search
+        syntax: "phrases", OR, -term). Returns summaries, best match first, with snippets.
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+        match = fts_query(query)
+        if match is None:
+            return []
+        clauses, params = _filters(source_type, None)
+        clauses.insert(0, "content_fts MATCH ?")
+        rows = self._connection().execute(
+            f"SELECT {_SUMMARY_COLUMNS}, -{_BM25} AS rank, "
+            "snippet(content_fts, -1, '**', '**', ' ... ', 24) AS snippet "
+            "FROM content_fts JOIN processed_content p ON p.id = content_fts.rowid"
+            f"{_where(clauses)} ORDER BY {_BM25}, p.id LIMIT ?",
+            [match, *params, limit],
+        )
+        return [
+            SearchResult(
+                summary=_summary_from_row(row), rank=row["rank"], snippet=row["snippet"]
+            )
+            for row in rows
+        ]
+
+    # Last: inside the class body, the name shadows the builtin for later annotations
+    def list(
+        self,
+        after_id: int | None = None,
+        limit: int = 100,
+        source_type: SourceType | None = None,
+        since: int | None = None,
+    ) -> ContentPage:
+        """
+        One keyset-paginated page of summaries in id order. Start with after_id=None and
+        pass each page's next_after_id to get the next.
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+        clauses, params = _filters(source_type, since)
+        if after_id is not None:
+            clauses.append("p.id > ?")
+            params.append(after_id)
+        rows = (
+            self._connection()
+            .execute(
+                f"{_SUMMARY_SELECT}{_where(clauses)} ORDER BY p.id LIMIT ?",
+                [*params, limit],
+            )
+            .fetchall()
+        )
+        return ContentPage(
+            items=[_summary_from_row(row) for row in rows],
+            next_after_id=rows[-1]["id"] if len(rows) == limit else None,
+        )
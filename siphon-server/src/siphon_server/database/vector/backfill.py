@@ -0,0 +1,116 @@
+"""
+Offline embedding backfill behind `siphon-server embed`.
+
+Walks `processed_content` in id order, `batch_size` rows at a time (keyset pages, so no transaction stays open while the embedding model works), chunks each row (`embeddings.chunk_texts`) and embeds only the chunks whose text or model changed since they were last stored. Rerunning is cheap: an unchanged corpus costs one hash comparison per chunk and no embedding calls. Rows ingested after a run are picked up by the next one.
+
+Usage:
+```python
+from siphon_server.database.vector.backfill import backfill_embeddings
+
+report = backfill_embeddings(batch_size=64)
+print(report.rows, report.embedded, report.elapsed)
+```
+"""
+
+from sqlalchemy import select
+from siphon_server.database.postgres.connection import SessionLocal
+from siphon_server.database.postgres.converters import from_orm
+from siphon_server.database.postgres.models import ProcessedContentORM
+from siphon_server.database.vector.embeddings import chunk_texts, text_hash
+from siphon_server.database.vector.pgvector import (
+    ContentEmbeddingORM,
+    EmbeddingRow,
+    EmbeddingStore,
+)
+from dataclasses import dataclass
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackfillReport:
+    rows: int = 0  # Content rows scanned
+    embedded: int = 0  # Chunks (re)embedded
+    unchanged: int = 0  # Chunks already current
+    elapsed: float = 0.0
+
+
+def stored_hashes(uris: list[str]) -> dict[tuple[str, int], tuple[str, str]]:
+    """(uri, chunk) -> (model, text_hash) of the embeddings already stored for uris."""
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(
+                ContentEmbeddingORM.uri,
+                ContentEmbeddingORM.chunk,
+                ContentEmbeddingORM.model,
+                ContentEmbeddingORM.text_hash,
+            ).where(ContentEmbeddingORM.uri.in_(uris))
+        )
+        return {(uri, chunk): (model, digest) for uri, chunk, model, digest in rows}
+
+
+def backfill_embeddings(
+    batch_size: int = 64,
+    limit: int | None = None,
+    store: EmbeddingStore | None = None,
+) -> BackfillReport:
+    """
+    Embed every processed_content row whose chunks are missing or stale.
+    limit caps the rows scanned (for trial runs).
+    """
+    from siphon_server.config import settings
+
+    store = store or EmbeddingStore()
+    model = store.embedder.model
+    report = BackfillReport()
+    start = time.perf_counter()
+    after_id = 0
+    while limit is None or report.rows < limit:
+        page = batch_size if limit is None else min(batch_size, limit - report.rows)
+        with SessionLocal() as db:
+            orm_objs = db.scalars(
+                select(ProcessedContentORM)
+                .where(ProcessedContentORM.id > after_id)
+                .order_by(ProcessedContentORM.id)
+                .limit(page)
+            ).all()
+            if not orm_objs:
+                break
+            after_id = orm_objs[-1].id
+            batch = [from_orm(orm_obj) for orm_obj in orm_objs]
+
+        stored = stored_hashes([pc.uri for pc in batch])
+        pending: list[tuple[str, int, str]] = []  # uri, chunk, text
+        for pc in batch:
+            texts = chunk_texts(
+                pc, settings.embedding_chunk_chars, settings.embedding_max_chunks
+            )
+            for chunk, chunk_text in enumerate(texts):
+                if stored.get((pc.uri, chunk)) == (model, text_hash(chunk_text)):
+                    report.unchanged += 1
+                else:
+                    pending.append((pc.uri, chunk, chunk_text))
+            if any(uri == pc.uri and chunk >= len(texts) for uri, chunk in stored):
+                store.delete_chunks_after(pc.uri, len(texts) - 1)
+
+        if pending:
+            vectors = store.embedder.embed([chunk_text for _, _, chunk_text in pending])
+            store.upsert_many(
+                EmbeddingRow(
+                    uri=uri,
+                    chunk=chunk,
+                    model=model,
+                    text_hash=text_hash(chunk_text),
+                    embedding=vector,
+                )
+                for (uri, chunk, chunk_text), vector in zip(pending, vectors)
+            )
+        report.rows += len(batch)
+        report.embedded += len(pending)
+        logger.info(
+            f"Embedding backfill: {report.rows} rows, {report.embedded} chunks embedded."
+        )
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -0,0 +1,86 @@
+"""
+Embedding inputs and the embedding model client for the pgvector store.
+
+`chunk_texts` turns a ProcessedContent into the texts that get embedded: chunk 0 is the enrichment (title, description, summary), which is what most "find similar" queries match on; chunks 1..n are consecutive windows of the extracted text, capped by the `embedding_max_chunks` setting so a multi-hour transcript costs a bounded number of calls. `Embedder` calls an OpenAI-compatible `/v1/embeddings` endpoint (Ollama, vLLM, OpenAI) named by the `embedding_url` / `embedding_model` settings, in batches.
+"""
+
+from siphon_api.models import ProcessedContent
+import hashlib
+import math
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def chunk_texts(pc: ProcessedContent, chunk_chars: int, max_chunks: int) -> list[str]:
+    """Texts to embed for pc, in chunk order (index 0 is the enrichment)."""
+    header = "\n\n".join(
+        part for part in (pc.title, pc.description, pc.summary) if part
+    )
+    chunks = [header or pc.text[:chunk_chars]]
+    text = pc.text
+    for start in range(0, min(len(text), chunk_chars * max_chunks), chunk_chars):
+        chunks.append(text[start : start + chunk_chars])
+    return chunks
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector] if norm else vector
+
+
+class Embedder:
+    """
+    Client for an OpenAI-compatible embeddings endpoint.
+    """
+
+    def __init__(
+        self,
+        model: str | None = None,
+        url: str | None = None,
+        batch_size: int | None = None,
+        timeout: float = 120.0,
+    ):
+        from siphon_server.config import settings
+
+        self.model = model or settings.embedding_model
+        self.url = url or settings.embedding_url
+        self.batch_size = batch_size or settings.embedding_batch_size
+        self.dimensions = settings.embedding_dimensions
+        self.timeout = timeout
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        One vector per text, in order, over the shared pooled client (core.http_client).
+        Raises on HTTP errors or a dimension mismatch.
+        """
+        from siphon_server.core.http_client import HTTP
+
+        headers = {}
+        if api_key := os.getenv("SIPHON_EMBEDDING_API_KEY"):
+            headers["Authorization"] = f"Bearer {api_key}"
+        vectors: list[list[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start : start + self.batch_size]
+            response = HTTP.request(
+                "POST",
+                self.url,
+                json={"model": self.model, "input": batch},
+                headers=headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            data = sorted(response.json()["data"], key=lambda item: item["index"])
+            vectors.extend(item["embedding"] for item in data)
+        for vector in vectors:
+            if len(vector) != self.dimensions:
+                raise ValueError(
+                    f"{self.model} returned {len(vector)} dimensions; "
+                    f"embedding_dimensions is {self.dimensions}."
+                )
+        return vectors
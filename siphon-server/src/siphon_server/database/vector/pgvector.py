@@ -0,0 +1,231 @@
+"""
+pgvector embedding store for semantic expansion (`Collection.expand`).
+
+Every ProcessedContent gets one embedding per chunk in `content_embeddings`: chunk 0 embeds the enrichment (title, description, summary), chunks 1..n consecutive windows of the extracted text. Rows are keyed by (uri, chunk) and record the embedding model and the hash of the text they were made from, so the backfill job (`database.vector.backfill`) only re-embeds what changed. An HNSW index (cosine distance) serves nearest-neighbour queries inside Postgres.
+
+`find_related(uris, query, k)` averages each seed URI's stored chunks into one vector, blends the seeds with the query embedding (if any; `QUERY_WEIGHT` of the total), asks the index for the nearest chunks and collapses them to the k best distinct URIs, excluding the seeds. Requires the `vector` extension; `database.postgres.setup.create_embedding_tables` creates it and the table (`siphon-server embed` does this first), while the base schema never needs it.
+
+Usage:
+```python
+from siphon_server.database.vector.pgvector import EmbeddingStore
+
+store = EmbeddingStore()
+related = store.find_related(["youtube:///dQw4w9WgXcQ"], query="synth pop", k=10)
+```
+"""
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, Index, Integer, String, UniqueConstraint, select, text
+from sqlalchemy.dialects.postgresql import insert
+from siphon_api.models import SearchResult
+from siphon_server.database.postgres.connection import Base, SessionLocal
+from siphon_server.database.postgres.repository import ContentRepository
+from siphon_server.database.vector.embeddings import Embedder, normalize
+from siphon_server.config import settings
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import islice
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Dimensions are fixed per table; changing embedding_dimensions needs a new table
+DIMENSIONS = settings.embedding_dimensions
+# Nearest chunks fetched per requested result, since several chunks share a URI
+_OVERFETCH = 4
+# Share of the seed vector given to the query when there are seeds too; the seeds
+# (each counting equally) share the rest
+QUERY_WEIGHT = 0.5
+
+
+def _mean(vectors: list[list[float]]) -> list[float]:
+    """Unit-length mean of the unit-length vectors."""
+    units = [normalize(vector) for vector in vectors]
+    return normalize([sum(values) / len(units) for values in zip(*units)])
+
+
+def blend(
+    seeds: list[list[list[float]]],
+    query: list[float] | None,
+    query_weight: float = QUERY_WEIGHT,
+) -> list[float] | None:
+    """
+    Unit-length search vector from each seed's chunk vectors and a query vector. A
+    seed's chunks are averaged first, so every seed counts once however many chunks it
+    has; the query then gets query_weight of the blend and the seeds the rest. None
+    when there is nothing to blend.
+    """
+    seeds = [chunks for chunks in seeds if chunks]
+    if not seeds:
+        return normalize(query) if query else None
+    seed_vector = _mean([_mean(chunks) for chunks in seeds])
+    if not query:
+        return seed_vector
+    query = normalize(query)
+    return normalize(
+        [
+            (1.0 - query_weight) * s + query_weight * q
+            for s, q in zip(seed_vector, query)
+        ]
+    )
+
+
+class ContentEmbeddingORM(Base):
+    __tablename__ = "content_embeddings"
+    __table_args__ = (
+        UniqueConstraint("uri", "chunk", name="uq_content_embeddings_uri_chunk"),
+        Index(
+            "ix_content_embeddings_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    uri = Column(String, nullable=False, index=True)  # processed_content.uri
+    chunk = Column(Integer, nullable=False, default=0)  # 0: enrichment; 1..n: text
+    model = Column(String, nullable=False)
+    text_hash = Column(String, nullable=False)  # sha256 of the embedded text
+    embedding = Column(Vector(DIMENSIONS), nullable=False)
+    created_at = Column(Integer, nullable=False)
+
+
+@dataclass
+class EmbeddingRow:
+    uri: str
+    chunk: int
+    model: str
+    text_hash: str
+    embedding: list[float]
+
+
+class EmbeddingStore:
+    """
+    Batched writes and in-database ANN search over content_embeddings.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder | None = None,
+        repository: ContentRepository | None = None,
+    ):
+        self._embedder = embedder
+        self._repository = repository
+
+    @property
+    def embedder(self) -> Embedder:
+        if self._embedder is None:
+            self._embedder = Embedder()
+        return self._embedder
+
+    @property
+    def repository(self) -> ContentRepository:
+        if self._repository is None:
+            self._repository = ContentRepository()
+        return self._repository
+
+    def upsert_many(self, rows: Iterable[EmbeddingRow], batch_size: int = 500) -> int:
+        """
+        Write embeddings with INSERT ... ON CONFLICT (uri, chunk) DO UPDATE, one statement
+        and one commit per batch. Returns rows written.
+        """
+        written = 0
+        now = int(time.time())
+        iterator = iter(rows)
+        with SessionLocal() as db:
+            while batch := list(islice(iterator, batch_size)):
+                # Last row wins for a repeated (uri, chunk) within one statement
+                values = {
+                    (row.uri, row.chunk): dict(
+                        uri=row.uri,
+                        chunk=row.chunk,
+                        model=row.model,
+                        text_hash=row.text_hash,
+                        embedding=row.embedding,
+                        created_at=now,
+                    )
+                    for row in batch
+                }
+                stmt = insert(ContentEmbeddingORM).values(list(values.values()))
+                stmt = stmt.on_conflict_do_update(
+                    constraint="uq_content_embeddings_uri_chunk",
+                    set_={
+                        key: stmt.excluded[key]
+                        for key in ("model", "text_hash", "embedding", "created_at")
+                    },
+                )
+                db.execute(stmt)
+                db.commit()
+                written += len(values)
+        return written
+
+    def delete_chunks_after(self, uri: str, last_chunk: int) -> None:
+        """Drop chunks beyond last_chunk (the text got shorter since the last embed)."""
+        with SessionLocal() as db:
+            db.query(ContentEmbeddingORM).filter(
+                ContentEmbeddingORM.uri == uri, ContentEmbeddingORM.chunk > last_chunk
+            ).delete()
+            db.commit()
+
+    def seed_vector(
+        self, uris: list[str], query: str | None, query_weight: float = QUERY_WEIGHT
+    ) -> list[float] | None:
+        """The stored chunks of uris blended with the query embedding; see blend()."""
+        seeds: dict[str, list[list[float]]] = {}
+        if uris:
+            with SessionLocal() as db:
+                rows = db.execute(
+                    select(ContentEmbeddingORM.uri, ContentEmbeddingORM.embedding).where(
+                        ContentEmbeddingORM.uri.in_(uris)
+                    )
+                )
+                for uri, embedding in rows:
+                    seeds.setdefault(uri, []).append(list(embedding))
+        query_vector = self.embedder.embed([query])[0] if query else None
+        return blend(list(seeds.values()), query_vector, query_weight)
+
+    def nearest(
+        self, vector: list[float], k: int, exclude: Iterable[str] = ()
+    ) -> list[tuple[str, float]]:
+        """
+        The k distinct URIs closest to vector (cosine similarity, best first), ranked by
+        their best chunk. Runs as an HNSW index scan.
+        """
+        exclude = set(exclude)
+        fetch = (k + len(exclude)) * _OVERFETCH
+        distance = ContentEmbeddingORM.embedding.cosine_distance(vector)
+        with SessionLocal() as db:
+            # The index returns at most ef_search candidates per scan
+            db.execute(text(f"SET LOCAL hnsw.ef_search = {max(40, fetch)}"))
+            rows = db.execute(
+                select(ContentEmbeddingORM.uri, distance.label("distance"))
+                .order_by(distance)
+                .limit(fetch)
+            ).all()
+        best: dict[str, float] = {}
+        for uri, row_distance in rows:
+            if uri not in exclude and uri not in best:
+                best[uri] = 1.0 - row_distance
+        return list(best.items())[:k]
+
+    def find_related(
+        self, uris: list[str], query: str | None = None, k: int = 10
+    ) -> list[SearchResult]:
+        """
+        Content related to the seed uris and/or query, best first; seeds are excluded.
+        Each result's rank is its cosine similarity.
+        """
+        vector = self.seed_vector(uris, query)
+        if vector is None:
+            logger.info("find_related: no stored embeddings for the seeds and no query.")
+            return []
+        hits = self.nearest(vector, k, exclude=uris)
+        summaries = self.repository.get_summaries([uri for uri, _ in hits])
+        return [
+            SearchResult(summary=summaries[uri], rank=similarity)
+            for uri, similarity in hits
+            if uri in summaries  # Content deleted since it was embedded
+        ]
@@ -1,9 +1,28 @@
-from siphon_server.sources.article.parser import ArticleParser
-from siphon_server.sources.article.extractor import ArticleExtractor
-from siphon_server.sources.article.enricher import ArticleEnricher
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from siphon_server.sources.article.parser import ArticleParser
+    from siphon_server.sources.article.extractor import ArticleExtractor
+    from siphon_server.sources.article.enricher import ArticleEnricher
+
+# Exports resolve on first access (PEP 562), so importing the parser for
+# dispatch does not drag in the extractor's and enricher's dependencies.
+_EXPORTS = {
+    "ArticleParser": "siphon_server.sources.article.parser",
+    "ArticleExtractor": "siphon_server.sources.article.extractor",
+    "ArticleEnricher": "siphon_server.sources.article.enricher",
+}
 
 __all__ = [
     "ArticleParser",
     "ArticleExtractor",
     "ArticleEnricher",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -0,0 +1,263 @@
+"""
+Bulk article fetching: many URLs at once, politely.
+
+A 2k-link reading list fetched one URL at a time takes hours; fetched all at once it gets us rate-limited or banned. `BulkArticleFetcher` runs the list on one event loop with two caps:
+
+- a global cap (`article_bulk_concurrency`) on requests in flight,
+- a per-host cap that adapts (AIMD): each host starts at one request in flight and gains roughly one more per round trip while responses stay fast, up to `article_bulk_per_host`; a 429/503, another 5xx, a transport error or a response much slower than the fastest seen from that host halves it.
+
+429 and 503 responses pause the whole host for their Retry-After (seconds or an HTTP date; exponential backoff with jitter when absent; a pause over `MAX_RETRY_AFTER` fails the URL) and the URL is retried. Transport errors and other 5xx responses are retried for that URL alone, after the same jittered backoff. Either way a URL gets at most `article_bulk_attempts` tries; 4xx responses other than 429, and pages that fail to parse, are final. Fresh cached URLs never touch the network; stale ones (see `ArticleExtractor` revalidation) cost a conditional GET. Every extracted article is written to the `ArticleCache` as it arrives, so an interrupted run resumes where it stopped. Results stream back in completion order.
+
+Usage:
+```python
+from siphon_server.sources.article.extractor import ArticleExtractor
+
+async for result in ArticleExtractor().extract_many_async(urls):
+    print(result.url, result.error or len(result.content.text))
+```
+"""
+
+from __future__ import annotations
+from siphon_api.models import ContentData
+from siphon_api.errors import SiphonExtractorError
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+import asyncio
+import random
+import time
+import logging
+
+if TYPE_CHECKING:
+    import httpx
+    from siphon_server.sources.article.extractor import ArticleExtractor
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUSES = (429, 503)
+MAX_RETRY_AFTER = 600.0  # Seconds; a host asking for longer fails the URL instead
+SLOW_FACTOR = 3.0  # A response this many times slower than the host's fastest is congestion
+BACKOFF_BASE = 1.0  # Seconds before the first retry when no Retry-After is given
+
+
+@dataclass
+class FetchResult:
+    """
+    Outcome of one URL in a bulk fetch. Exactly one of content / error is set.
+    """
+
+    url: str
+    content: ContentData | None = None
+    error: Exception | None = None
+    attempts: int = 0  # HTTP requests made (0 for a cache hit)
+    cached: bool = False  # Served from the ArticleCache (after a 304 if attempts > 0)
+
+
+class HostLimiter:
+    """
+    AIMD concurrency limit and Retry-After pause for one host, on one event loop.
+    """
+
+    def __init__(self, host: str, max_limit: int, initial: float = 1.0):
+        self.host = host
+        self.max_limit = max_limit
+        self.limit = min(initial, max_limit)
+        self.in_flight = 0
+        self.not_before = 0.0  # time.monotonic() before which no request starts
+        self.fastest: float | None = None  # Fastest response latency seen, seconds
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            while True:
+                pause = self.not_before - time.monotonic()
+                if pause > 0:
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), pause)
+                    except TimeoutError:
+                        pass
+                elif self.in_flight < int(self.limit):
+                    break
+                else:
+                    await self._condition.wait()
+            self.in_flight += 1
+
+    async def release(
+        self,
+        latency: float | None = None,
+        throttled: bool = False,
+        failed: bool = False,
+        pause: float = 0.0,
+    ) -> None:
+        """
+        Give the slot back and adapt: latency of a good response, or throttled / failed.
+        pause holds off every request to the host for that many seconds.
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if pause > 0:
+                self.not_before = max(self.not_before, now + pause)
+            slow = False
+            if latency is not None:
+                self.fastest = latency if self.fastest is None else min(self.fastest, latency)
+                slow = latency > self.fastest * SLOW_FACTOR
+            if throttled or failed or slow:
+                # Halve at most once per round trip: one congested window, one decrease
+                if now - self._last_decrease >= (self.fastest or 0.0):
+                    self.limit = max(1.0, self.limit / 2)
+                    self._last_decrease = now
+            elif latency is not None:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class BulkArticleFetcher:
+    """
+    Fetches and extracts many article URLs concurrently through one ArticleExtractor.
+    """
+
+    def __init__(
+        self,
+        extractor: ArticleExtractor,
+        concurrency: int | None = None,
+        per_host: int | None = None,
+        attempts: int | None = None,
+    ):
+        from siphon_server.config import settings
+
+        self.extractor = extractor
+        self.concurrency = concurrency or settings.article_bulk_concurrency
+        self.per_host = per_host or settings.article_bulk_per_host
+        self.attempts = attempts or settings.article_bulk_attempts
+        self.hosts: dict[str, HostLimiter] = {}
+
+    async def fetch(
+        self, urls: Iterable[str], use_cache: bool = True
+    ) -> AsyncIterator[FetchResult]:
+        """
+        Fetch every URL (duplicates once); yield results as they complete.
+        Closing the iterator early cancels the fetches still running.
+        """
+        budget = asyncio.Semaphore(self.concurrency)
+        tasks = [
+            asyncio.create_task(self._fetch_one(url, budget, use_cache))
+            for url in dict.fromkeys(urls)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _host(self, url: str) -> HostLimiter:
+        import httpx
+
+        host = httpx.URL(url).host.lower()
+        limiter = self.hosts.get(host)
+        if limiter is None:
+            limiter = self.hosts[host] = HostLimiter(host, self.per_host)
+        return limiter
+
+    async def _fetch_one(
+        self, url: str, budget: asyncio.Semaphore, use_cache: bool
+    ) -> FetchResult:
+        from siphon_server.core.async_adapters import run_sync
+
+        entry = await run_sync(self.extractor._cached_entry, url) if use_cache else None
+        if entry and self.extractor._is_fresh(entry):
+            return FetchResult(url, content=entry.content, cached=True)
+        headers = entry.conditional_headers() if entry else {}
+        try:
+            limiter = self._host(url)
+        except Exception as e:  # Not a URL httpx can parse
+            return FetchResult(url, error=SiphonExtractorError(f"Invalid URL {url}: {e}"))
+
+        result = FetchResult(url)
+        while True:
+            result.attempts += 1
+            retry = result.attempts < self.attempts
+            # Wait for the host before the global budget, so a throttled host never holds
+            # slots other hosts could use
+            await limiter.acquire()
+            try:
+                async with budget:
+                    start = time.monotonic()
+                    response = await self.extractor._fetch_response_async(
+                        url, headers=headers
+                    )
+            except SiphonExtractorError as e:  # Transport failure
+                await limiter.release(failed=True)
+                if not retry:
+                    result.error = e
+                    return result
+                await asyncio.sleep(_backoff(result.attempts))
+                continue
+            except BaseException:
+                await limiter.release()
+                raise
+
+            if response.status_code in THROTTLE_STATUSES:
+                pause = _retry_after(response)
+                if pause is None:
+                    pause = _backoff(result.attempts)
+                if pause > MAX_RETRY_AFTER:
+                    retry = False
+                await limiter.release(throttled=True, pause=pause if retry else 0.0)
+                logger.info(
+                    f"{limiter.host} returned {response.status_code}; "
+                    f"per-host limit now {int(limiter.limit)}, pausing {pause:.1f}s."
+                )
+                if not retry:
+                    result.error = SiphonExtractorError(
+                        f"Failed to fetch {url} - status code {response.status_code}"
+                    )
+                    return result
+                continue
+            if response.status_code >= 500:
+                await limiter.release(failed=True)
+                if retry:
+                    await asyncio.sleep(_backoff(result.attempts))
+                    continue
+            else:
+                await limiter.release(latency=time.monotonic() - start)
+
+            try:
+                cached = await run_sync(self.extractor._not_modified, url, entry, response)
+                if cached is not None:
+                    result.content, result.cached = cached, True
+                    return result
+                article, metadata = await run_sync(
+                    self.extractor._process_response, url, response
+                )
+                result.content = await run_sync(
+                    self.extractor._build_content_data, url, article, metadata, response
+                )
+            except Exception as e:
+                result.error = e
+            return result
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds the Retry-After header asks for (delta-seconds or HTTP date), or None."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, BACKOFF_BASE * 2 ** (attempt - 1))
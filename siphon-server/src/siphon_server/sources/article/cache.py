@@ -1,15 +1,57 @@
 """
 One cache, for trafilatura article fetch results.
+
+Each entry keeps the response's validators (ETag, Last-Modified) and when it was fetched, so ArticleExtractor can revalidate it with a conditional GET instead of refetching and re-parsing the page. It also records the version of the extractor that produced the Markdown (see `ArticleExtractor.version`); an entry from another HTML backend or an older extractor is refetched, not served.
 """
 
 import sqlite3
+from dataclasses import dataclass
 from pathlib import Path
 from xdg_base_dirs import xdg_cache_home
 from siphon_api.enums import SourceType
 from siphon_api.models import ContentData
 from siphon_api.errors import ArticleCacheError
+from siphon_server.core.metrics import METRICS
+import threading
+import time
 import json
 
+# Columns added after the first release of the cache; opened databases are migrated
+_VALIDATOR_COLUMNS = {
+    "etag": "TEXT",
+    "last_modified": "TEXT",
+    "fetched_at": "REAL",
+    "extractor_version": "TEXT",
+}
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached article with the validators of the response it came from.
+    """
+
+    content: ContentData
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float | None = None  # Unix time of the last fetch or 304; None if unknown
+    version: str | None = None  # ArticleExtractor.version that built content
+
+    def conditional_headers(self) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since for a revalidating GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def age(self) -> float:
+        """Seconds since the entry was last confirmed fresh (inf if never recorded)."""
+        if self.fetched_at is None:
+            return float("inf")
+        return time.time() - self.fetched_at
+
 
 class ArticleCache:
     """
@@ -22,14 +64,18 @@ class ArticleCache:
         metadata: dict[str, Any] = Field(default_factory=dict)
 
     Location: $XDG_CACHE_HOME/siphon/readabilipy/fetch_cache.db
-    Schema:   url TEXT PRIMARY KEY, source_type TEXT NOT NULL, text TEXT NOT NULL, metadata TEXT NOT NULL
+    Schema:   url TEXT PRIMARY KEY, source_type TEXT NOT NULL, text TEXT NOT NULL, metadata TEXT NOT NULL,
+              etag TEXT, last_modified TEXT, fetched_at REAL, extractor_version TEXT
+
+    The connection is shared across threads (batch workers); a lock serializes access.
     """
 
     def __init__(self):
         cache_root = Path(xdg_cache_home()) / "siphon" / "readabilipy"
         cache_root.mkdir(parents=True, exist_ok=True)
         self.path = cache_root / "fetch.db"
-        self._con = sqlite3.connect(self.path)
+        self._con = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
         try:
             _ = self._con.execute(
                 """
@@ -37,50 +83,100 @@ class ArticleCache:
                     url TEXT PRIMARY KEY,
                     source_type TEXT NOT NULL,
                     text TEXT NOT NULL,
-                    metadata TEXT NOT NULL
+                    metadata TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL,
+                    extractor_version TEXT
                 )
                 """
             )
+            columns = {row[1] for row in self._con.execute("PRAGMA table_info(fetch)")}
+            for column, kind in _VALIDATOR_COLUMNS.items():
+                if column not in columns:
+                    self._con.execute(f"ALTER TABLE fetch ADD COLUMN {column} {kind}")
+            self._con.commit()
         except sqlite3.Error as e:
             raise ArticleCacheError(f"Failed to initialize cache database: {e}")
 
     # Getters and setters
     def get(self, url: str) -> ContentData | None:
+        entry = self.get_entry(url)
+        return entry.content if entry else None
+
+    def get_entry(self, url: str) -> CacheEntry | None:
         # Fetch row from database
         try:
-            row = self._con.execute(
-                "SELECT * FROM fetch WHERE url = ?",
-                (url,),
-            ).fetchone()
+            with self._lock:
+                row = self._con.execute(
+                    "SELECT source_type, text, metadata, etag, last_modified, fetched_at, "
+                    "extractor_version FROM fetch WHERE url = ?",
+                    (url,),
+                ).fetchone()
         except sqlite3.Error as e:
             raise ArticleCacheError(f"Failed to fetch from cache database: {e}")
+        METRICS.cache("article.fetch", row is not None)
         if row:
-            _, source_type, text, metadata_json = row
+            source_type, text, metadata_json, etag, last_modified, fetched_at, version = row
             metadata = json.loads(metadata_json)
-            return ContentData(
+            content = ContentData(
                 source_type=SourceType(source_type),
                 text=text,
                 metadata=metadata,
             )
+            return CacheEntry(content, etag, last_modified, fetched_at, version)
 
-    def set(self, url: str, content_data: ContentData) -> None:
-        # Store ContentData object in database
+    def set(
+        self,
+        url: str,
+        content_data: ContentData,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        version: str | None = None,
+    ) -> None:
+        # Store ContentData object in database, fetched now
         metadata_json = json.dumps(content_data.metadata)
 
         try:
-            self._con.execute(
-                "REPLACE INTO fetch (url, source_type, text, metadata) VALUES (?, ?, ?, ?)",
-                (
-                    url,
-                    content_data.source_type.value,
-                    content_data.text,
-                    metadata_json,
-                ),
-            )
-            self._con.commit()
+            with self._lock:
+                self._con.execute(
+                    "REPLACE INTO fetch (url, source_type, text, metadata, etag, "
+                    "last_modified, fetched_at, extractor_version) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        content_data.source_type.value,
+                        content_data.text,
+                        metadata_json,
+                        etag,
+                        last_modified,
+                        time.time(),
+                        version,
+                    ),
+                )
+                self._con.commit()
+        except sqlite3.Error as e:
+            raise ArticleCacheError(f"Failed to store in cache database: {e}")
+
+    def touch(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> None:
+        """
+        Record a 304 for url: the entry is fresh as of now. Validators the 304 carried
+        replace the stored ones.
+        """
+        try:
+            with self._lock:
+                self._con.execute(
+                    "UPDATE fetch SET fetched_at = ?, etag = coalesce(?, etag), "
+                    "last_modified = coalesce(?, last_modified) WHERE url = ?",
+                    (time.time(), etag, last_modified, url),
+                )
+                self._con.commit()
         except sqlite3.Error as e:
             raise ArticleCacheError(f"Failed to store in cache database: {e}")
 
     def wipe(self) -> None:
-        self._con.execute("DELETE FROM fetch")
-        self._con.commit()
+        with self._lock:
+            self._con.execute("DELETE FROM fetch")
+            self._con.commit()
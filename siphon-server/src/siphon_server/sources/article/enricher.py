@@ -1,7 +1,8 @@
 from siphon_server.config import settings
+from siphon_server.core.llm_cache import install_conduit_cache
 from siphon_api.interfaces import EnricherStrategy
 from siphon_api.models import ContentData, EnrichedData
-from siphon_api.enums import SourceType
+from siphon_api.enums import SourceType, ResourceClass
 from typing import override, Any
 from pathlib import Path
 import logging
@@ -12,12 +13,8 @@ from conduit.batch import (
     ModelAsync,
     Response,
     Verbosity,
-    ConduitCache,
 )
 
-# Set up cache
-cache = ConduitCache(name="siphon")
-ModelAsync.conduit_cache = cache
 # Set up logging
 logger = logging.getLogger(__name__)
 # Set root logger to silent
@@ -35,10 +32,13 @@ class ArticleEnricher(EnricherStrategy):
     """
 
     source_type: SourceType = SourceType.ARTICLE
+    resource_class: ResourceClass = ResourceClass.LLM
 
     def __init__(self):
         from conduit.prompt.prompt_loader import PromptLoader
 
+        install_conduit_cache()
+
         # Load prompts packaged with this module
         self.prompt_loader = PromptLoader(
             base_dir=PROMPTS_DIR,
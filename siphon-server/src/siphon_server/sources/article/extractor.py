@@ -1,12 +1,18 @@
 from siphon_api.interfaces import ExtractorStrategy
 from siphon_api.models import SourceInfo, ContentData
-from siphon_api.enums import SourceType
+from siphon_api.enums import SourceType, ResourceClass
 from siphon_api.errors import SiphonExtractorError
 from siphon_server.sources.article.metadata import ArticleMetadata
-from siphon_server.sources.article.cache import ArticleCache
-from typing import override
+from siphon_server.sources.article.cache import ArticleCache, CacheEntry
+from pathlib import Path
+from typing import override, TYPE_CHECKING
 import logging
 
+if TYPE_CHECKING:
+    import httpx
+    from collections.abc import AsyncIterator, Iterable
+    from siphon_server.sources.article.bulk import FetchResult
+
 logger = logging.getLogger(__name__)
 fetch_cache = ArticleCache()
 
@@ -16,64 +22,169 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 class ArticleExtractor(ExtractorStrategy):
     """
     Extract content from Article.
-    Uses Readabilipy under the hood.
+    HTML is simplified by the backend the `article_html_backend` setting (or html_backend)
+    names: readabilipy (default) or trafilatura; see sources.article.html.
+
+    Cached articles older than the `article_cache_max_age` setting (0: never) are
+    revalidated with a conditional GET; with revalidate (default: the `article_revalidate`
+    setting) every cached article is. needs_refresh tells the pipeline when its own
+    caches of an article are stale by the same rules.
+    A 304 refreshes the cache entry and skips HTML simplification entirely. Cached
+    articles built by another backend or version (see `version`) are refetched.
     """
 
     source_type: SourceType = SourceType.ARTICLE
+    resource_class: ResourceClass = ResourceClass.NETWORK
+
+    def __init__(self, revalidate: bool | None = None, html_backend: str | None = None):
+        from siphon_server.config import settings
+        from siphon_server.sources.article.html import get_backend
+
+        self.revalidate = settings.article_revalidate if revalidate is None else revalidate
+        self.max_age = settings.article_cache_max_age
+        self.html_backend_name = html_backend or settings.article_html_backend
+        self.html_backend = get_backend(self.html_backend_name)
+
+    @property
+    def version(self) -> str:
+        """
+        Stage and fetch cache version: this module and sources/article/html.py, under
+        the selected HTML backend; switching backends changes it.
+        """
+        from siphon_server.core.stage_cache import source_digest
+        from siphon_server.sources.article import html
+
+        digest = source_digest(Path(__file__), Path(html.__file__))
+        return f"{self.html_backend_name}-{digest}"
 
     @override
     def extract(self, source: SourceInfo) -> ContentData:
         logger.info(f"Extracting Article content from {source.original_source}")
         url = source.original_source
-        cached: ContentData | None = fetch_cache.get(url)
+        entry = self._cached_entry(url)
 
-        if cached:
+        if entry and self._is_fresh(entry):
             logger.debug("Cache hit!")
-            return cached
-        else:
-            article, metadata = self._fetch_url(url)  # Now returns tuple
-
-            if not article or article.strip() == "":
-                raise SiphonExtractorError(
-                    "Extraction returned None (failed heuristics or filtered by settings)."
-                )
-            metadata = ArticleMetadata(**metadata).model_dump()
-            content_data = ContentData(
-                source_type=self.source_type, metadata=metadata, text=article
-            )
-            fetch_cache.set(url, content_data)
-            return content_data
+            return entry.content
+        headers = entry.conditional_headers() if entry else {}
+        response = self._fetch_response(url, headers=headers)
+        if (content := self._not_modified(url, entry, response)) is not None:
+            return content
+        article, metadata = self._process_response(url, response)
+        return self._build_content_data(url, article, metadata, response)
 
-    def _extract_content_from_html(self, html: str) -> tuple[str, dict]:
-        """Extract content and metadata from HTML."""
-        import readabilipy.simple_json
-        import markdownify
+    async def extract_async(self, source: SourceInfo) -> ContentData:
+        """
+        Native async variant: the fetch is awaited, HTML simplification runs off-loop.
+        """
+        from siphon_server.core.async_adapters import run_sync
 
-        ret = readabilipy.simple_json.simple_json_from_html_string(
-            html, use_readability=True
-        )
-        if not ret["content"]:
-            raise SiphonExtractorError("Page failed to be simplified from HTML")
+        logger.info(f"Extracting Article content (async) from {source.original_source}")
+        url = source.original_source
+        entry = await run_sync(self._cached_entry, url)
+
+        if entry and self._is_fresh(entry):
+            logger.debug("Cache hit!")
+            return entry.content
+        headers = entry.conditional_headers() if entry else {}
+        response = await self._fetch_response_async(url, headers=headers)
+        if (content := await run_sync(self._not_modified, url, entry, response)) is not None:
+            return content
+        article, metadata = await run_sync(self._process_response, url, response)
+        return await run_sync(self._build_content_data, url, article, metadata, response)
+
+    def extract_many_async(
+        self, urls: "Iterable[str]", use_cache: bool = True, **options
+    ) -> "AsyncIterator[FetchResult]":
+        """
+        Bulk mode: fetch many URLs concurrently with per-host politeness (see
+        sources.article.bulk); results stream back, and into the cache, as they complete.
+        options: concurrency, per_host, attempts (default to the article_bulk_* settings).
+        With revalidate=True on the extractor this refreshes a cached corpus: unchanged
+        pages cost a 304 each.
+        """
+        from siphon_server.sources.article.bulk import BulkArticleFetcher
+
+        return BulkArticleFetcher(self, **options).fetch(urls, use_cache=use_cache)
+
+    def needs_refresh(self, source: SourceInfo) -> bool:
+        """
+        Whether output cached downstream of the fetch (stage cache, repository) must not
+        be served for source: always in revalidate mode; with a max age, once its fetch
+        cache entry is stale or gone.
+        """
+        if self.revalidate:
+            return True
+        if not self.max_age:
+            return False
+        entry = self._cached_entry(source.original_source)
+        return entry is None or not self._is_fresh(entry)
+
+    def _cached_entry(self, url: str) -> CacheEntry | None:
+        """The fetch cache entry for url, unless another extractor version built it."""
+        entry = fetch_cache.get_entry(url)
+        if entry is None or entry.version != self.version:
+            return None
+        return entry
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether entry can be served without asking the origin."""
+        if self.revalidate:
+            return False
+        return not self.max_age or entry.age() < self.max_age
 
-        content = markdownify.markdownify(
-            ret["content"],
-            heading_style=markdownify.ATX,
+    def _not_modified(
+        self, url: str, entry: CacheEntry | None, response: "httpx.Response"
+    ) -> ContentData | None:
+        """The cached content if response is a 304 for entry (refreshing it), else None."""
+        from siphon_server.core.metrics import METRICS
+
+        if entry is None or not entry.conditional_headers():
+            return None
+        not_modified = response.status_code == 304
+        METRICS.cache("article.revalidate", not_modified)
+        if not not_modified:
+            return None
+        logger.debug(f"Not modified: {url}")
+        fetch_cache.touch(
+            url, response.headers.get("etag"), response.headers.get("last-modified")
         )
+        return entry.content
 
-        # Extract metadata
-        metadata = {
-            "title": ret.get("title"),
-            "byline": ret.get("byline"),
-            "dir": ret.get("dir"),
-            "lang": ret.get("lang"),
-            "length": ret.get("length"),
-            "siteName": ret.get("siteName"),
-        }
+    def _build_content_data(
+        self,
+        url: str,
+        article: str,
+        metadata: dict,
+        response: "httpx.Response | None" = None,
+    ) -> ContentData:
+        if not article or article.strip() == "":
+            raise SiphonExtractorError(
+                "Extraction returned None (failed heuristics or filtered by settings)."
+            )
+        metadata = ArticleMetadata(**metadata).model_dump()
+        content_data = ContentData(
+            source_type=self.source_type, metadata=metadata, text=article
+        )
+        validators = {}
+        if response is not None:
+            validators = {
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+            }
+        fetch_cache.set(url, content_data, version=self.version, **validators)
+        return content_data
 
-        # Remove None values
-        metadata = {k: v for k, v in metadata.items() if v is not None}
+    def _extract_content_from_html(self, html: str) -> tuple[str, dict]:
+        """
+        Extract content and metadata from HTML with the configured backend, on the
+        conversion process pool (large pages are handed over in shared memory).
+        """
+        from siphon_server.core.process_pool import PROCESS_POOL, shared_text
+        from siphon_server.sources.article.html import convert_html
 
-        return content, metadata
+        with shared_text(html) as payload:
+            return PROCESS_POOL.run(convert_html, self.html_backend, payload)
 
     def _fetch_url(
         self,
@@ -82,25 +193,53 @@ class ArticleExtractor(ExtractorStrategy):
         force_raw: bool = False,
     ) -> tuple[str, dict]:
         """Fetch URL and return content + metadata."""
+        response = self._fetch_response(url, user_agent)
+        return self._process_response(url, response, force_raw=force_raw)
+
+    def _fetch_response(
+        self, url: str, user_agent: str = USER_AGENT, headers: dict | None = None
+    ) -> "httpx.Response":
+        """Fetch URL (headers: e.g. conditional headers); returns the raw response."""
         import httpx
+        from siphon_server.core.http_client import HTTP
+
+        try:
+            return HTTP.request(
+                "GET",
+                url,
+                follow_redirects=True,
+                headers={"User-Agent": user_agent, **(headers or {})},
+            )
+        except httpx.HTTPError as e:
+            raise SiphonExtractorError(f"Failed to fetch {url}: {e}")
+
+    async def _fetch_response_async(
+        self, url: str, user_agent: str = USER_AGENT, headers: dict | None = None
+    ) -> "httpx.Response":
+        """Async fetch; returns the raw response for _process_response."""
+        import httpx
+        from siphon_server.core.http_client import HTTP
+
+        try:
+            return await HTTP.request_async(
+                "GET",
+                url,
+                follow_redirects=True,
+                headers={"User-Agent": user_agent, **(headers or {})},
+            )
+        except httpx.HTTPError as e:
+            raise SiphonExtractorError(f"Failed to fetch {url}: {e}")
+
+    def _process_response(
+        self, url: str, response: "httpx.Response", force_raw: bool = False
+    ) -> tuple[str, dict]:
+        """Turn an HTTP response into content + metadata."""
+        if response.status_code >= 400:
+            raise SiphonExtractorError(
+                f"Failed to fetch {url} - status code {response.status_code}"
+            )
 
-        with httpx.Client() as client:
-            try:
-                response = client.get(
-                    url,
-                    follow_redirects=True,
-                    headers={"User-Agent": user_agent},
-                    timeout=30,
-                )
-            except httpx.HTTPError as e:
-                raise SiphonExtractorError(f"Failed to fetch {url}: {e}")
-
-            if response.status_code >= 400:
-                raise SiphonExtractorError(
-                    f"Failed to fetch {url} - status code {response.status_code}"
-                )
-
-            page_raw = response.text
+        page_raw = response.text
 
         # HTTP metadata
         http_metadata = {
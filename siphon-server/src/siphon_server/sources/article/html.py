@@ -0,0 +1,116 @@
+"""
+HTML to Markdown extraction backends for ArticleExtractor.
+
+A backend takes a page's HTML and returns its main content as Markdown plus the metadata `ArticleMetadata` knows about (title, byline, dir, lang, length, siteName). The `article_html_backend` setting picks one:
+
+- "readabilipy" (default): Mozilla's Readability.js, run through Node by readabilipy, then `markdownify`. Needs a JS runtime on the server; one Node process per page.
+- "trafilatura": trafilatura's lxml-based extractor, which renders Markdown itself. Pure Python (lxml is C), no subprocess.
+
+Both are CPU-bound; ArticleExtractor runs them through `convert_html` on the conversion process pool (core.process_pool). `dev/benchmarks/bench_html_extraction.py` compares them on a saved corpus (latency, memory, output parity).
+
+Usage:
+```python
+from siphon_server.sources.article.html import get_backend
+
+markdown, metadata = get_backend("trafilatura")(html)
+```
+"""
+
+from siphon_api.errors import SiphonExtractorError
+from collections.abc import Callable
+
+HtmlBackend = Callable[[str], tuple[str, dict]]
+
+
+def readabilipy_backend(html: str) -> tuple[str, dict]:
+    """Readability.js (via Node) + markdownify."""
+    import readabilipy.simple_json
+    import markdownify
+
+    ret = readabilipy.simple_json.simple_json_from_html_string(
+        html, use_readability=True
+    )
+    if not ret["content"]:
+        raise SiphonExtractorError("Page failed to be simplified from HTML")
+
+    content = markdownify.markdownify(
+        ret["content"],
+        heading_style=markdownify.ATX,
+    )
+
+    # Extract metadata
+    metadata = {
+        "title": ret.get("title"),
+        "byline": ret.get("byline"),
+        "dir": ret.get("dir"),
+        "lang": ret.get("lang"),
+        "length": ret.get("length"),
+        "siteName": ret.get("siteName"),
+    }
+
+    # Remove None values
+    metadata = {k: v for k, v in metadata.items() if v is not None}
+
+    return content, metadata
+
+
+def trafilatura_backend(html: str) -> tuple[str, dict]:
+    """trafilatura's lxml extractor, Markdown output, in-process."""
+    import trafilatura
+
+    document = trafilatura.extract_with_metadata(
+        html,
+        output_format="markdown",
+        include_formatting=True,
+        include_links=True,
+        include_tables=True,
+    )
+    if document is None or not document.text:
+        raise SiphonExtractorError("Page failed to be simplified from HTML")
+
+    content = document.text
+    # Markdown output leads with a YAML front matter block of the same metadata
+    if content.startswith("---\n"):
+        _, _, content = content[4:].partition("\n---\n")
+    content = content.strip()
+
+    metadata = {
+        "title": document.title,
+        "byline": document.author,
+        "lang": document.language,
+        "length": len(document.raw_text or content),
+        "siteName": document.sitename,
+    }
+    metadata = {k: v for k, v in metadata.items() if v is not None}
+
+    return content, metadata
+
+
+def convert_html(backend: HtmlBackend, payload) -> tuple[str, dict]:
+    """
+    backend on the text behind payload (a str or core.process_pool.SharedText); the
+    entry point ArticleExtractor hands to PROCESS_POOL.
+    """
+    from siphon_server.core.process_pool import text_of
+
+    return backend(text_of(payload))
+
+
+BACKENDS: dict[str, HtmlBackend] = {
+    "readabilipy": readabilipy_backend,
+    "trafilatura": trafilatura_backend,
+}
+
+
+def get_backend(name: str | None = None) -> HtmlBackend:
+    """The backend called name, or the one the `article_html_backend` setting names."""
+    if name is None:
+        from siphon_server.config import settings
+
+        name = settings.article_html_backend
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown article_html_backend {name!r}; expected one of {tuple(BACKENDS)}."
+        ) from None
@@ -12,7 +12,7 @@ class ArticleMetadata(BaseModel):
     status_code: int
     content_type: str
 
-    # Readabilipy metadata
+    # HTML backend metadata (sources.article.html)
     title: str
     byline: str | None = None
     dir: str | None = None
@@ -30,6 +30,7 @@ class ArticleParser(ParserStrategy):
     """
 
     source_type: SourceType = SourceType.ARTICLE
+    dispatch_url_fallback: bool = True
 
     @override
     def can_handle(self, source: str) -> bool:
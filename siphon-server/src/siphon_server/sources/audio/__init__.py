@@ -1,9 +1,28 @@
-from siphon_server.sources.audio.parser import AudioParser
-from siphon_server.sources.audio.extractor import AudioExtractor
-from siphon_server.sources.audio.enricher import AudioEnricher
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from siphon_server.sources.audio.parser import AudioParser
+    from siphon_server.sources.audio.extractor import AudioExtractor
+    from siphon_server.sources.audio.enricher import AudioEnricher
+
+# Exports resolve on first access (PEP 562), so importing the parser for
+# dispatch does not drag in the extractor's and enricher's dependencies.
+_EXPORTS = {
+    "AudioParser": "siphon_server.sources.audio.parser",
+    "AudioExtractor": "siphon_server.sources.audio.extractor",
+    "AudioEnricher": "siphon_server.sources.audio.enricher",
+}
 
 __all__ = [
     "AudioParser",
     "AudioExtractor",
     "AudioEnricher",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -1,6 +1,6 @@
 from siphon_api.interfaces import ExtractorStrategy
 from siphon_api.models import SourceInfo, ContentData
-from siphon_api.enums import SourceType
+from siphon_api.enums import SourceType, ResourceClass
 from siphon_api.metadata import FileMetadata
 from siphon_api.file_types import MIME_TYPES
 from datetime import datetime, timezone
@@ -12,6 +12,7 @@ class AudioExtractor(ExtractorStrategy):
     """Extract content from Audio"""
 
     source_type: SourceType = SourceType.AUDIO
+    resource_class: ResourceClass = ResourceClass.GPU
 
     @override
     def extract(self, source: SourceInfo) -> ContentData:
@@ -11,6 +11,7 @@ class AudioParser(ParserStrategy):
     """Parse Audio sources"""
 
     source_type: SourceType = SourceType.AUDIO
+    dispatch_extension_categories: tuple[str, ...] = ("Audio",)
 
     @override
     def can_handle(self, source: str) -> bool:
@@ -15,6 +15,7 @@ ML tasks and detailed exception translation for connection and service failures.
 
 from pathlib import Path
 from siphon_api.audio import DiarizationResponse
+from siphon_server.core.http_client import HTTP
 import httpx
 import logging
 
@@ -36,12 +37,14 @@ def diarize(wav_file: Path) -> DiarizationResponse:
         with open(wav_file, "rb") as f:
             files_payload = {"file": (wav_file.name, f, "audio/wav")}
 
-            # 2. Use httpx to make the request
+            # 2. POST on the shared client (kept-alive connection to the service)
             # We set a long timeout, as this ML task can take time.
-            with httpx.Client(timeout=300.0) as client:
-                response = client.post(
-                    f"{DIARIZATION_SERVICE_URL}/process", files=files_payload
-                )
+            response = HTTP.request(
+                "POST",
+                f"{DIARIZATION_SERVICE_URL}/process",
+                files=files_payload,
+                timeout=300.0,
+            )
 
             # 3. Check for errors from the worker
             response.raise_for_status()
@@ -1,9 +1,28 @@
-from siphon_server.sources.doc.parser import DocParser
-from siphon_server.sources.doc.extractor import DocExtractor
-from siphon_server.sources.doc.enricher import DocEnricher
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from siphon_server.sources.doc.parser import DocParser
+    from siphon_server.sources.doc.extractor import DocExtractor
+    from siphon_server.sources.doc.enricher import DocEnricher
+
+# Exports resolve on first access (PEP 562), so importing the parser for
+# dispatch does not drag in the extractor's and enricher's dependencies.
+_EXPORTS = {
+    "DocParser": "siphon_server.sources.doc.parser",
+    "DocExtractor": "siphon_server.sources.doc.extractor",
+    "DocEnricher": "siphon_server.sources.doc.enricher",
+}
 
 __all__ = [
     "DocParser",
     "DocExtractor",
     "DocEnricher",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
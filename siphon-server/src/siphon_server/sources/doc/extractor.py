@@ -1,12 +1,27 @@
 from siphon_api.interfaces import ExtractorStrategy
 from siphon_api.models import SourceInfo, ContentData
-from siphon_api.enums import SourceType
+from siphon_api.enums import SourceType, ResourceClass
 from siphon_api.metadata import FileMetadata
 from siphon_api.file_types import MIME_TYPES
 from datetime import datetime, timezone
-from markitdown import MarkItDown
 from pathlib import Path
 from typing import override
+import threading
+
+_local = threading.local()  # One MarkItDown per thread (per worker process, in the pool)
+
+
+def convert_document(path: str) -> str:
+    """
+    MarkItDown conversion of the file at path. Runs on a conversion pool worker, which
+    reads the file itself: only the path crosses the process boundary.
+    """
+    from markitdown import MarkItDown
+
+    md = getattr(_local, "markitdown", None)
+    if md is None:
+        md = _local.markitdown = MarkItDown()
+    return md.convert(Path(path)).text_content
 
 
 class DocExtractor(ExtractorStrategy):
@@ -15,6 +30,7 @@ class DocExtractor(ExtractorStrategy):
     """
 
     source_type: SourceType = SourceType.DOC
+    resource_class: ResourceClass = ResourceClass.CPU
 
     @override
     def extract(self, source: SourceInfo) -> ContentData:
@@ -23,9 +39,10 @@ class DocExtractor(ExtractorStrategy):
         return ContentData(source_type=self.source_type, text=text, metadata=metadata)
 
     def _extract(self, source: SourceInfo) -> str:
+        from siphon_server.core.process_pool import PROCESS_POOL
+
         path = Path(source.original_source)
-        md = MarkItDown()
-        return md.convert(path).text_content
+        return PROCESS_POOL.run(convert_document, str(path.resolve()))
 
     def _generate_metadata(self, source: SourceInfo) -> dict[str, str]:
         path = Path(source.original_source)
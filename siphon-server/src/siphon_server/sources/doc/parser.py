@@ -16,6 +16,7 @@ class DocParser(ParserStrategy):
     """
 
     source_type: SourceType = SourceType.DOC
+    dispatch_extension_categories: tuple[str, ...] = ("Doc", "Text")
 
     @override
     def can_handle(self, source: str) -> bool:
@@ -9,7 +9,7 @@ WIP:
 
 from siphon_api.interfaces import ExtractorStrategy
 from siphon_api.models import SourceInfo, ContentData
-from siphon_api.enums import SourceType
+from siphon_api.enums import SourceType, ResourceClass
 from siphon_api.metadata import DriveMetadata
 from typing import override
 from functools import lru_cache
@@ -26,6 +26,7 @@ class DriveExtractor(ExtractorStrategy):
     """Extract content from Drive"""
 
     source_type: SourceType = SourceType.DRIVE
+    resource_class: ResourceClass = ResourceClass.NETWORK
 
     @override
     def extract(self, source: SourceInfo) -> ContentData:
@@ -8,6 +8,7 @@ class DriveParser(ParserStrategy):
     """Parse Drive sources"""
 
     source_type: SourceType = SourceType.DRIVE
+    dispatch_hosts: tuple[str, ...] = ("docs.google.com",)
 
     @override
     def can_handle(self, source: str) -> bool:
@@ -1,9 +1,28 @@
-from siphon_server.sources.youtube.parser import YouTubeParser
-from siphon_server.sources.youtube.extractor import YouTubeExtractor
-from siphon_server.sources.youtube.enricher import YouTubeEnricher
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from siphon_server.sources.youtube.parser import YouTubeParser
+    from siphon_server.sources.youtube.extractor import YouTubeExtractor
+    from siphon_server.sources.youtube.enricher import YouTubeEnricher
+
+# Exports resolve on first access (PEP 562), so importing the parser for
+# dispatch does not drag in the extractor's and enricher's dependencies.
+_EXPORTS = {
+    "YouTubeParser": "siphon_server.sources.youtube.parser",
+    "YouTubeExtractor": "siphon_server.sources.youtube.extractor",
+    "YouTubeEnricher": "siphon_server.sources.youtube.enricher",
+}
 
 __all__ = [
     "YouTubeParser",
     "YouTubeExtractor",
     "YouTubeEnricher",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
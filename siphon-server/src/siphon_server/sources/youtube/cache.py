@@ -5,11 +5,13 @@ Two caches:
 """
 
 from siphon_server.sources.youtube.metadata import YouTubeMetadata
+from siphon_server.core.metrics import METRICS
 import re
 import sqlite3
 from pathlib import Path
 from xdg_base_dirs import xdg_cache_home
 from typing import Any
+import threading
 import json
 
 ID_RE = re.compile(r"^[A-Za-z0-9\-_]{11}$")
@@ -29,7 +31,8 @@ class YouTubeMetadataCache:
         cache_root = Path(xdg_cache_home()) / "siphon" / "youtube"
         cache_root.mkdir(parents=True, exist_ok=True)
         self.path = cache_root / "metadata_cache.db"
-        self._con = sqlite3.connect(self.path)
+        self._con = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
         self._con.execute(
             "CREATE TABLE IF NOT EXISTS metadata ("
             "id TEXT PRIMARY KEY, "
@@ -49,10 +52,12 @@ class YouTubeMetadataCache:
     def get(self, video_id: str) -> dict[str, Any] | None:
         self._validate_id(video_id)
         # Fetch row from database
-        row = self._con.execute(
-            "SELECT * FROM metadata WHERE id = ?",
-            (video_id,),
-        ).fetchone()
+        with self._lock:
+            row = self._con.execute(
+                "SELECT * FROM metadata WHERE id = ?",
+                (video_id,),
+            ).fetchone()
+        METRICS.cache("youtube.metadata", row is not None)
         if row:
             metadata = self._convert_SQL_to_metadata(row)
             return metadata
@@ -65,17 +70,19 @@ class YouTubeMetadataCache:
         metadata = validated_metadata.model_dump()
         # Convert metadata to SQL-compatible tuple
         metadata_tuple = self._convert_metadata_to_SQL(metadata)
-        self._con.execute(
-            "INSERT OR REPLACE INTO metadata ("
-            "id, url, domain, title, published_date, video_id, channel, duration, description, tags) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (video_id, *metadata_tuple),
-        )
-        self._con.commit()
+        with self._lock:
+            self._con.execute(
+                "INSERT OR REPLACE INTO metadata ("
+                "id, url, domain, title, published_date, video_id, channel, duration, description, tags) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (video_id, *metadata_tuple),
+            )
+            self._con.commit()
 
     def wipe(self) -> None:
-        self._con.execute("DELETE FROM metadata")
-        self._con.commit()
+        with self._lock:
+            self._con.execute("DELETE FROM metadata")
+            self._con.commit()
 
     # Converters
     def _convert_metadata_to_SQL(self, metadata: dict[str, str]) -> tuple:
@@ -165,7 +172,8 @@ class YouTubeTranscriptCache:
         cache_root = Path(xdg_cache_home()) / "siphon" / "youtube"
         cache_root.mkdir(parents=True, exist_ok=True)
         self.path = cache_root / "transcript_cache.db"
-        self._con = sqlite3.connect(self.path)
+        self._con = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
         self._con.execute(
             "CREATE TABLE IF NOT EXISTS transcripts ("
             "id TEXT PRIMARY KEY, "
@@ -175,23 +183,27 @@ class YouTubeTranscriptCache:
 
     def get(self, video_id: str) -> str | None:
         self._validate_id(video_id)
-        row = self._con.execute(
-            "SELECT transcript FROM transcripts WHERE id = ?",
-            (video_id,),
-        ).fetchone()
+        with self._lock:
+            row = self._con.execute(
+                "SELECT transcript FROM transcripts WHERE id = ?",
+                (video_id,),
+            ).fetchone()
+        METRICS.cache("youtube.transcript", row is not None)
         return row[0] if row else None
 
     def set(self, video_id: str, transcript: str) -> None:
         self._validate_id(video_id)
-        self._con.execute(
-            "INSERT OR REPLACE INTO transcripts (id, transcript) VALUES (?, ?)",
-            (video_id, transcript),
-        )
-        self._con.commit()
+        with self._lock:
+            self._con.execute(
+                "INSERT OR REPLACE INTO transcripts (id, transcript) VALUES (?, ?)",
+                (video_id, transcript),
+            )
+            self._con.commit()
 
     def wipe(self) -> None:
-        self._con.execute("DELETE FROM transcripts")
-        self._con.commit()
+        with self._lock:
+            self._con.execute("DELETE FROM transcripts")
+            self._con.commit()
 
     @staticmethod
     def _validate_id(video_id: str) -> None:
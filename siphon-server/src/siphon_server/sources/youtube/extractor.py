@@ -1,15 +1,12 @@
 from siphon_api.interfaces import ExtractorStrategy
 from siphon_api.models import SourceInfo, ContentData
-from siphon_api.enums import SourceType
+from siphon_api.enums import SourceType, ResourceClass
 from siphon_server.sources.youtube.metadata import YouTubeMetadata
 from siphon_server.sources.youtube.get_video_id import get_video_id
 from siphon_server.sources.youtube.cache import (
     YouTubeTranscriptCache,
     YouTubeMetadataCache,
 )
-import yt_dlp
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.proxies import WebshareProxyConfig
 from functools import lru_cache
 from typing import override, Any
 import os
@@ -21,11 +18,6 @@ metadata_cache = YouTubeMetadataCache()
 
 WEBSHARE_USERNAME = os.getenv("WEBSHARE_USERNAME")
 WEBSHARE_PASS = os.getenv("WEBSHARE_PASS")
-if not WEBSHARE_USERNAME or not WEBSHARE_PASS:
-    logger.warning(
-        "Webshare credentials not set in environment variables. Transcript downloads may fail if rate limits are exceeded."
-    )
-    raise EnvironmentError("Webshare credentials not set in environment variables.")
 
 
 class YouTubeExtractor(ExtractorStrategy):
@@ -34,6 +26,18 @@ class YouTubeExtractor(ExtractorStrategy):
     """
 
     source_type: SourceType = SourceType.YOUTUBE
+    resource_class: ResourceClass = ResourceClass.NETWORK
+
+    def __init__(self):
+        # Checked on construction rather than import, so importing the YouTube source
+        # (e.g. for routing) works without credentials.
+        if not WEBSHARE_USERNAME or not WEBSHARE_PASS:
+            logger.warning(
+                "Webshare credentials not set in environment variables. Transcript downloads may fail if rate limits are exceeded."
+            )
+            raise EnvironmentError(
+                "Webshare credentials not set in environment variables."
+            )
 
     @override
     def extract(self, source: SourceInfo) -> ContentData:
@@ -112,6 +116,7 @@ class YouTubeExtractor(ExtractorStrategy):
         If not cached, download the metadata using yt-dlp.
         """
         logger.debug("Getting metadata from yt_dlp api...")
+        import yt_dlp
 
         with yt_dlp.YoutubeDL({"quiet": True}) as ydl:
             info = ydl.extract_info(video_id, download=False)
@@ -162,6 +167,9 @@ class YouTubeExtractor(ExtractorStrategy):
         """
         logger.debug("Using youtube-transcript-api to download transcript...")
         logger.debug("Setting up YouTubeTranscriptApi with Webshare proxy...")
+        from youtube_transcript_api import YouTubeTranscriptApi
+        from youtube_transcript_api.proxies import WebshareProxyConfig
+
         ytt_api = YouTubeTranscriptApi(
             proxy_config=WebshareProxyConfig(
                 proxy_username=WEBSHARE_USERNAME,
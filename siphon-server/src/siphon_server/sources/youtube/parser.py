@@ -11,6 +11,7 @@ class YouTubeParser(ParserStrategy):
     """
 
     source_type: SourceType = SourceType.YOUTUBE
+    dispatch_hosts: tuple[str, ...] = ("youtube.com", "youtu.be")
 
     @override
     def can_handle(self, source: str) -> bool:
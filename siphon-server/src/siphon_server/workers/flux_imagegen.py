@@ -16,6 +16,7 @@ verification of service health.
 
 from pathlib import Path
 import httpx
+from siphon_server.core.http_client import HTTP
 import logging
 from jinja2 import Template
 import os
@@ -121,30 +122,31 @@ def generate_image(
     try:
         # We use a significant timeout (300s) because 30B parameter models
         # can take 30-60s to generate an image depending on settings.
-        with httpx.Client(timeout=300.0) as client:
-            response = client.post(f"{FLUX_SERVICE_URL}/generate", json=payload)
-
-            # 1. Check for errors from the worker (e.g., OOM, 500s)
-            if response.status_code != 200:
-                # Try to parse detail if available, else use text
-                try:
-                    error_detail = response.json().get("detail", response.text)
-                except Exception:
-                    error_detail = response.text
-
-                raise RuntimeError(
-                    f"Flux service error ({response.status_code}): {error_detail}"
-                )
-
-            # 2. Write the binary image content to disk
-            # Using binary write mode since we receive raw PNG bytes
-            with open(output_file, "wb") as f:
-                f.write(response.content)
-
-            logger.info(
-                f"[FLUX] Image successfully saved to {output_file} ({len(response.content)} bytes)"
+        response = HTTP.request(
+            "POST", f"{FLUX_SERVICE_URL}/generate", json=payload, timeout=300.0
+        )
+
+        # 1. Check for errors from the worker (e.g., OOM, 500s)
+        if response.status_code != 200:
+            # Try to parse detail if available, else use text
+            try:
+                error_detail = response.json().get("detail", response.text)
+            except Exception:
+                error_detail = response.text
+
+            raise RuntimeError(
+                f"Flux service error ({response.status_code}): {error_detail}"
             )
-            return output_file
+
+        # 2. Write the binary image content to disk
+        # Using binary write mode since we receive raw PNG bytes
+        with open(output_file, "wb") as f:
+            f.write(response.content)
+
+        logger.info(
+            f"[FLUX] Image successfully saved to {output_file} ({len(response.content)} bytes)"
+        )
+        return output_file
 
     except httpx.ConnectError:
         raise RuntimeError(
@@ -1,7 +1,7 @@
 import os
 import argparse
 import logging
-import httpx
+from siphon_server.core.http_client import HTTP
 from pathlib import Path
 from jinja2 import Template
 
@@ -32,14 +32,15 @@ def generate_hidream(
     payload = {"prompt": prompt, "steps": steps, "guidance": guidance, "seed": seed}
 
     try:
-        with httpx.Client(timeout=120.0) as client:
-            response = client.post(f"{HIDREAM_SERVICE_URL}/generate", json=payload)
-            if response.status_code != 200:
-                raise RuntimeError(f"HiDream error: {response.text}")
-
-            with open(output_file, "wb") as f:
-                f.write(response.content)
-            return output_file
+        response = HTTP.request(
+            "POST", f"{HIDREAM_SERVICE_URL}/generate", json=payload, timeout=120.0
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"HiDream error: {response.text}")
+
+        with open(output_file, "wb") as f:
+            f.write(response.content)
+        return output_file
     except Exception as e:
         raise RuntimeError(f"Generation failed: {e}")
 
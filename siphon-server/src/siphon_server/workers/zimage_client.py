@@ -1,5 +1,6 @@
 from pathlib import Path
 import httpx
+from siphon_server.core.http_client import HTTP
 import logging
 from jinja2 import Template
 import os
@@ -88,16 +89,17 @@ def generate_zimage(
 
     try:
         # Timeout can be shorter (60s) because Turbo is incredibly fast
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(f"{ZIMAGE_SERVICE_URL}/generate", json=payload)
+        response = HTTP.request(
+            "POST", f"{ZIMAGE_SERVICE_URL}/generate", json=payload, timeout=60.0
+        )
 
-            if response.status_code != 200:
-                raise RuntimeError(f"Z-Image error: {response.text}")
+        if response.status_code != 200:
+            raise RuntimeError(f"Z-Image error: {response.text}")
 
-            with open(output_file, "wb") as f:
-                f.write(response.content)
+        with open(output_file, "wb") as f:
+            f.write(response.content)
 
-            return output_file
+        return output_file
 
     except httpx.ConnectError:
         raise RuntimeError(f"Failed to connect to {ZIMAGE_SERVICE_URL}")
@@ -0,0 +1,113 @@
+import asyncio
+import httpx
+import pytest
+from siphon_server.core import http_client
+from siphon_server.sources.article import bulk, extractor
+from siphon_server.sources.article.bulk import HostLimiter, _retry_after
+from siphon_server.sources.article.cache import ArticleCache
+from siphon_server.sources.article.extractor import ArticleExtractor
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache = ArticleCache()
+    monkeypatch.setattr(extractor, "fetch_cache", cache)
+    monkeypatch.setattr(bulk, "BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(
+        ArticleExtractor,
+        "_extract_content_from_html",
+        lambda self, html: (html, {"title": "t"}),
+    )
+    return cache
+
+
+def _serve(monkeypatch, handler):
+    clients = http_client.HttpClients(http2=False, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client, "HTTP", clients)
+
+
+async def _collect(urls, **options):
+    return [r async for r in ArticleExtractor().extract_many_async(urls, **options)]
+
+
+class TestHostLimiter:
+    def test_additive_increase_multiplicative_decrease(self):
+        async def run():
+            limiter = HostLimiter("a.test", max_limit=4)
+            for _ in range(10):
+                await limiter.acquire()
+                await limiter.release(latency=0.0)
+            assert limiter.limit == 4
+            await limiter.acquire()
+            await limiter.release(throttled=True)
+            assert limiter.limit == 2
+            await limiter.acquire()
+            await limiter.release(failed=True)
+            assert limiter.limit == 1
+
+        asyncio.run(run())
+
+    def test_pause_holds_off_requests(self):
+        async def run():
+            limiter = HostLimiter("a.test", max_limit=4)
+            await limiter.acquire()
+            await limiter.release(throttled=True, pause=0.1)
+            start = asyncio.get_running_loop().time()
+            await limiter.acquire()
+            return asyncio.get_running_loop().time() - start
+
+        assert asyncio.run(run()) >= 0.09
+
+    def test_retry_after_forms(self):
+        assert _retry_after(httpx.Response(429, headers={"Retry-After": "7"})) == 7
+        date = "Wed, 21 Oct 2015 07:28:00 GMT"  # In the past
+        assert _retry_after(httpx.Response(429, headers={"Retry-After": date})) == 0
+        assert _retry_after(httpx.Response(429)) is None
+
+
+class TestBulkFetch:
+    def test_streams_into_cache_within_host_limits(self, cache, monkeypatch):
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request):
+            host = request.url.host
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, html=f"text {request.url.path}")
+
+        _serve(monkeypatch, handler)
+        urls = [f"https://{host}/{n}" for host in ("a.test", "b.test") for n in range(12)]
+        results = asyncio.run(_collect(urls + urls[:3], per_host=3))
+        assert sorted(r.url for r in results) == sorted(urls)
+        assert all(r.error is None and r.attempts == 1 for r in results)
+        assert max(peak.values()) <= 3
+        assert cache.get("https://a.test/5").text == "text /5"
+        again = asyncio.run(_collect(urls[:2]))
+        assert all(r.cached and r.attempts == 0 for r in again)
+
+    def test_throttled_urls_are_retried(self, cache, monkeypatch):
+        seen: dict[str, int] = {}
+
+        def handler(request):
+            path = request.url.path
+            seen[path] = seen.get(path, 0) + 1
+            if path == "/busy" and seen[path] == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            if path == "/down":
+                return httpx.Response(503)
+            if path == "/gone":
+                return httpx.Response(404)
+            return httpx.Response(200, html="ok")
+
+        _serve(monkeypatch, handler)
+        urls = ["https://a.test/busy", "https://a.test/down", "https://a.test/gone"]
+        results = {r.url: r for r in asyncio.run(_collect(urls, attempts=3))}
+        busy, down, gone = (results[url] for url in urls)
+        assert busy.content.text == "ok" and busy.attempts == 2
+        assert down.error is not None and down.attempts == 3
+        assert gone.error is not None and gone.attempts == 1
+        assert cache.get("https://a.test/gone") is None
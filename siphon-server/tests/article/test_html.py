@@ -0,0 +1,44 @@
+import pytest
+from siphon_api.errors import SiphonExtractorError
+from siphon_server.sources.article.extractor import ArticleExtractor
+from siphon_server.sources.article.html import (
+    get_backend,
+    readabilipy_backend,
+    trafilatura_backend,
+)
+
+PAGE = f"""<html lang="en"><head><title>Post | Site</title>
+<meta property="og:site_name" content="Site"><meta name="author" content="Jane Doe"></head>
+<body><nav>Home About</nav><article><h1>Post</h1>
+<p>First paragraph with <b>bold</b> and <a href="https://x.test">a link</a>. {"Lorem ipsum dolor sit amet. " * 20}</p>
+<h2>Section</h2><ul><li>one</li><li>two</li></ul><p>{"More text here. " * 20}</p>
+</article><footer>Copyright</footer></body></html>"""
+
+
+class TestBackends:
+    def test_selected_by_name_or_setting(self, monkeypatch):
+        from siphon_server.config import settings
+
+        assert get_backend("trafilatura") is trafilatura_backend
+        monkeypatch.setattr(settings, "article_html_backend", "readabilipy")
+        assert get_backend() is readabilipy_backend
+        assert ArticleExtractor().html_backend is readabilipy_backend
+        assert ArticleExtractor(html_backend="trafilatura").html_backend is trafilatura_backend
+        with pytest.raises(ValueError):
+            get_backend("lynx")
+
+    def test_trafilatura_markdown_and_metadata(self):
+        text, metadata = trafilatura_backend(PAGE)
+        assert text.startswith("# Post")
+        assert "**bold**" in text and "[a link](https://x.test)" in text
+        assert "## Section" in text and "- one" in text
+        assert "Home About" not in text and "Copyright" not in text
+        assert not text.startswith("---")
+        assert metadata["title"] == "Post"
+        assert metadata["byline"] == "Jane Doe"
+        assert metadata["siteName"] == "Site"
+        assert metadata["length"] > 0
+
+    def test_trafilatura_empty_page_fails(self):
+        with pytest.raises(SiphonExtractorError):
+            trafilatura_backend("<html><body></body></html>")
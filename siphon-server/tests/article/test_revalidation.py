@@ -0,0 +1,141 @@
+import asyncio
+import sqlite3
+import httpx
+import pytest
+from siphon_api.enums import SourceType
+from siphon_api.models import ContentData, SourceInfo
+from siphon_server.core import http_client
+from siphon_server.sources.article import extractor
+from siphon_server.sources.article.cache import ArticleCache
+from siphon_server.sources.article.extractor import ArticleExtractor
+
+URL = "https://a.test/post"
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache = ArticleCache()
+    monkeypatch.setattr(extractor, "fetch_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def origin(cache, monkeypatch):
+    """A server that honours If-None-Match; counts requests and HTML parses."""
+    calls = {"requests": 0, "parses": 0, "conditional": 0}
+
+    def handler(request):
+        calls["requests"] += 1
+        if request.headers.get("if-none-match") == '"v1"':
+            calls["conditional"] += 1
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, html="<html>body", headers={"ETag": '"v1"'})
+
+    def parse(self, html):
+        calls["parses"] += 1
+        return html, {"title": "t"}
+
+    clients = http_client.HttpClients(http2=False, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client, "HTTP", clients)
+    monkeypatch.setattr(ArticleExtractor, "_extract_content_from_html", parse)
+    return calls
+
+
+def _source(url: str = URL) -> SourceInfo:
+    return SourceInfo(source_type=SourceType.ARTICLE, uri="article:///post", original_source=url)
+
+
+class TestArticleCache:
+    def test_validators_round_trip_and_touch(self, cache):
+        content = ContentData(source_type=SourceType.ARTICLE, text="x", metadata={})
+        cache.set(URL, content, etag='"a"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        entry = cache.get_entry(URL)
+        assert entry.content == content
+        assert entry.conditional_headers() == {
+            "If-None-Match": '"a"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert entry.age() < 5
+        cache.touch(URL, etag='"b"')
+        entry = cache.get_entry(URL)
+        assert entry.etag == '"b"'
+        assert entry.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert cache.get(URL) == content
+
+    def test_old_databases_are_migrated(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        path = tmp_path / "siphon" / "readabilipy" / "fetch.db"
+        path.parent.mkdir(parents=True)
+        con = sqlite3.connect(path)
+        con.execute(
+            "CREATE TABLE fetch (url TEXT PRIMARY KEY, source_type TEXT NOT NULL, "
+            "text TEXT NOT NULL, metadata TEXT NOT NULL)"
+        )
+        con.execute("INSERT INTO fetch VALUES (?, 'Article', 'old', '{}')", (URL,))
+        con.commit()
+        con.close()
+        entry = ArticleCache().get_entry(URL)
+        assert entry.content.text == "old"
+        assert entry.conditional_headers() == {}
+        assert entry.age() == float("inf")
+
+
+class TestRevalidation:
+    def test_cache_hits_skip_the_network_by_default(self, origin):
+        ArticleExtractor().extract(_source())
+        ArticleExtractor().extract(_source())
+        assert origin == {"requests": 1, "parses": 1, "conditional": 0}
+
+    def test_304_skips_parsing(self, origin, cache):
+        first = ArticleExtractor().extract(_source())
+        fetched_at = cache.get_entry(URL).fetched_at
+        again = ArticleExtractor(revalidate=True).extract(_source())
+        assert again == first
+        assert origin == {"requests": 2, "parses": 1, "conditional": 1}
+        assert cache.get_entry(URL).fetched_at >= fetched_at
+
+    def test_max_age_makes_entries_stale(self, origin, monkeypatch):
+        ArticleExtractor().extract(_source())
+        stale = ArticleExtractor()
+        stale.max_age = 1e-9
+        asyncio.run(stale.extract_async(_source()))
+        assert origin["conditional"] == 1
+
+    def test_needs_refresh_tells_the_pipeline_when_its_caches_are_stale(
+        self, origin, monkeypatch
+    ):
+        from siphon_server.config import settings
+
+        fresh = ArticleExtractor()
+        assert not fresh.needs_refresh(_source())  # No max age: never stale
+        fresh.max_age = 60.0
+        assert fresh.needs_refresh(_source())  # Not fetched yet
+        fresh.extract(_source())
+        assert not fresh.needs_refresh(_source())
+        fresh.max_age = 1e-9
+        assert fresh.needs_refresh(_source())
+        monkeypatch.setattr(settings, "article_revalidate", True)
+        assert ArticleExtractor().needs_refresh(_source())
+        assert not ArticleExtractor(revalidate=False).needs_refresh(_source())
+
+    def test_switching_html_backend_refetches(self, origin, cache):
+        readabilipy = ArticleExtractor(html_backend="readabilipy")
+        trafilatura = ArticleExtractor(html_backend="trafilatura")
+        assert readabilipy.version != trafilatura.version
+        readabilipy.extract(_source())
+        trafilatura.extract(_source())
+        # Not a cache hit, and not a conditional GET a 304 could answer with old Markdown
+        assert origin == {"requests": 2, "parses": 2, "conditional": 0}
+        assert cache.get_entry(URL).version == trafilatura.version
+
+    def test_bulk_refresh_costs_304s(self, origin):
+        urls = [f"https://a.test/{n}" for n in range(5)]
+
+        async def collect(revalidate):
+            return [r async for r in ArticleExtractor(revalidate).extract_many_async(urls)]
+
+        asyncio.run(collect(False))
+        results = asyncio.run(collect(True))
+        assert all(r.cached and r.attempts == 1 for r in results)
+        assert origin == {"requests": 10, "parses": 5, "conditional": 5}
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+from siphon_api.enums import SourceType
+from siphon_api.models import SourceInfo
+from siphon_server.core.async_adapters import (
+    as_async_parser,
+    get_offload_executor,
+    ThreadedParser,
+)
+
+
+class SyncParser:
+    source_type = SourceType.ARTICLE
+
+    def __init__(self):
+        self.threads: set[str] = set()
+
+    def can_handle(self, source: str) -> bool:
+        return True
+
+    def parse(self, source: str) -> SourceInfo:
+        self.threads.add(threading.current_thread().name)
+        return SourceInfo(
+            source_type=self.source_type,
+            uri=f"article:///{source}",
+            original_source=source,
+        )
+
+
+class NativeParser(SyncParser):
+    async def parse_async(self, source: str) -> SourceInfo:
+        return SourceInfo(
+            source_type=self.source_type, uri="article:///native", original_source=source
+        )
+
+
+class TestAsyncAdapters:
+    def test_native_async_strategy_is_used_directly(self):
+        parser = NativeParser()
+        assert as_async_parser(parser) is parser
+        result = asyncio.run(parser.parse_async("x"))
+        assert result.uri == "article:///native"
+
+    def test_sync_strategy_runs_on_bounded_offload_pool(self):
+        parser = SyncParser()
+        adapter = as_async_parser(parser)
+        assert isinstance(adapter, ThreadedParser)
+        assert adapter.can_handle("0")
+
+        async def many():
+            return await asyncio.gather(
+                *(adapter.parse_async(str(n)) for n in range(200))
+            )
+
+        results = asyncio.run(many())
+        assert [r.uri for r in results] == [f"article:///{n}" for n in range(200)]
+        assert all(name.startswith("siphon-offload") for name in parser.threads)
+        assert len(parser.threads) <= get_offload_executor()._max_workers
@@ -0,0 +1,102 @@
+import threading
+import time
+import pytest
+from siphon_server.core.batch import BatchItem, Stage, run_stages
+
+
+class TestRunStages:
+    def test_every_source_yields_one_result(self):
+        def double(item: BatchItem):
+            item.result = item.source * 2
+
+        results = list(run_stages(["a", "b", "c"], [Stage("double", double, 2)]))
+        assert sorted(r.result for r in results) == ["aa", "bb", "cc"]
+        assert sorted(r.index for r in results) == [0, 1, 2]
+
+    def test_errors_are_attached_not_raised(self):
+        def explode(item: BatchItem):
+            if item.source == "bad":
+                raise ValueError("boom")
+            item.result = item.source
+
+        results = {r.source: r for r in run_stages(["ok", "bad"], [Stage("x", explode)])}
+        assert results["ok"].ok and results["ok"].result == "ok"
+        assert not results["bad"].ok
+        assert isinstance(results["bad"].error, ValueError)
+        assert results["bad"].result is None
+
+    def test_done_items_skip_later_stages(self):
+        seen = []
+
+        def first(item: BatchItem):
+            if item.source == "early":
+                item.result, item.done = "stopped", True
+
+        def second(item: BatchItem):
+            seen.append(item.source)
+            item.result = "finished"
+
+        results = {
+            r.source: r.result
+            for r in run_stages(
+                ["early", "late"], [Stage("first", first), Stage("second", second)]
+            )
+        }
+        assert results == {"early": "stopped", "late": "finished"}
+        assert seen == ["late"]
+
+    def test_stages_overlap(self):
+        """A slow stage must not serialize the batch: workers run concurrently."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow(item: BatchItem):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            item.result = item.source
+
+        sources = [str(i) for i in range(8)]
+        start = time.perf_counter()
+        results = list(run_stages(sources, [Stage("slow", slow, workers=4)]))
+        elapsed = time.perf_counter() - start
+        assert len(results) == 8
+        assert peak == 4
+        assert elapsed < 8 * 0.05
+
+    def test_rejects_empty_chain(self):
+        with pytest.raises(ValueError):
+            list(run_stages(["a"], []))
+
+    def test_slow_lane_does_not_block_fast_lane(self):
+        release = threading.Event()
+
+        def work(item: BatchItem):
+            if item.source == "podcast":
+                release.wait(5)
+            item.result = item.source
+
+        stage = Stage(
+            "extract",
+            work,
+            lane=lambda item: "gpu" if item.source == "podcast" else "network",
+            lanes={"gpu": 1, "network": 2},
+        )
+        sources = ["podcast"] + [f"article-{n}" for n in range(6)]
+        finished = []
+        for result in run_stages(sources, [stage]):
+            finished.append(result.source)
+            if len(finished) == 6:
+                release.set()
+        assert finished[-1] == "podcast"
+
+    def test_unknown_lane_is_an_error_result(self):
+        stage = Stage("x", lambda item: None, lane=lambda item: "tpu", lanes={"cpu": 1})
+        (result,) = run_stages(["a"], [stage])
+        assert not result.ok
+        assert isinstance(result.error, KeyError)
@@ -0,0 +1,45 @@
+import json
+from siphon_server.core.batch_runner import read_manifest
+from siphon_server.core.job_store import JobStore, JobOutcome
+
+
+class TestManifest:
+    def test_text_manifest_skips_blanks_and_comments(self, tmp_path):
+        manifest = tmp_path / "sources.txt"
+        manifest.write_text("# backfill\nhttps://a.example\n\n  /tmp/b.pdf  \n")
+        assert list(read_manifest(manifest)) == ["https://a.example", "/tmp/b.pdf"]
+
+    def test_jsonl_manifest_accepts_strings_and_objects(self, tmp_path):
+        manifest = tmp_path / "sources.jsonl"
+        lines = [json.dumps("https://a.example"), json.dumps({"source": "/tmp/b.pdf"})]
+        manifest.write_text("\n".join(lines))
+        assert list(read_manifest(manifest)) == ["https://a.example", "/tmp/b.pdf"]
+
+    def test_directory_manifest_lists_files_recursively(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.txt").write_text("b")
+        (tmp_path / "a.txt").write_text("a")
+        assert list(read_manifest(tmp_path)) == [
+            str(tmp_path / "a.txt"),
+            str(tmp_path / "sub" / "b.txt"),
+        ]
+
+
+class TestJobStore:
+    def test_resume_skips_done_and_recovers_interrupted(self, tmp_path):
+        store = JobStore(tmp_path / "jobs.db")
+        assert store.add(["a", "b", "c"]) == 3
+        store.mark_running("a")
+        store.record(JobOutcome(source="a", ok=True, seconds=0.1, source_type="Doc"))
+        store.mark_running("b")  # Crash while b was in flight
+        store.mark_running("c")
+        store.record(JobOutcome(source="c", ok=False, seconds=0.1, error="boom"))
+        store.close()
+
+        store = JobStore(tmp_path / "jobs.db")
+        assert store.add(["a", "b", "c", "d"]) == 1
+        assert store.recover() == 1
+        assert store.pending() == ["b", "d"]
+        assert store.recover(retry_failed=True) == 1
+        assert store.pending() == ["b", "c", "d"]
+        assert store.counts() == {"done": 1, "pending": 3}
@@ -0,0 +1,65 @@
+from pathlib import Path
+from siphon_api.enums import SourceType
+from siphon_server.core.dispatch import DispatchIndex
+
+
+class StubParser:
+    def __init__(self, source_type: SourceType, accepts: bool = True, **hints):
+        self.source_type = source_type
+        self.accepts = accepts
+        self.calls = 0
+        for name, value in hints.items():
+            setattr(self, name, value)
+
+    def can_handle(self, source: str) -> bool:
+        self.calls += 1
+        return self.accepts
+
+
+class TestDispatchIndex:
+    def make_index(self, *extra):
+        self.youtube = StubParser(
+            SourceType.YOUTUBE, dispatch_hosts=("youtube.com", "youtu.be")
+        )
+        self.drive = StubParser(SourceType.DRIVE, dispatch_hosts=("docs.google.com",))
+        self.article = StubParser(SourceType.ARTICLE, dispatch_url_fallback=True)
+        self.doc = StubParser(
+            SourceType.DOC, dispatch_extension_categories=("Doc", "Text")
+        )
+        self.audio = StubParser(SourceType.AUDIO, dispatch_extension_categories=("Audio",))
+        parsers = [self.article, self.audio, self.drive, self.youtube, self.doc, *extra]
+        return DispatchIndex(parsers)
+
+    def test_routes_urls_by_host_suffix(self):
+        index = self.make_index()
+        assert index.route("https://www.youtube.com/watch?v=dQw4w9WgXcQ") is self.youtube
+        assert index.route("http://youtu.be/dQw4w9WgXcQ") is self.youtube
+        assert index.route("https://docs.google.com/document/d/abc/edit") is self.drive
+        assert index.route("https://example.com/post") is self.article
+
+    def test_routes_paths_by_extension(self, tmp_path: Path):
+        index = self.make_index()
+        assert index.route(str(tmp_path / "a.PDF")) is self.doc
+        assert index.route(str(tmp_path / "a.html")) is self.doc
+        assert index.route(str(tmp_path / "a.mp3")) is self.audio
+        assert index.route(str(tmp_path / "a.unknown")) is None
+        assert index.route("ftp://youtube.com/video") is None
+
+    def test_only_the_candidate_is_asked(self):
+        index = self.make_index()
+        index.route("/tmp/talk.mp3")
+        assert self.audio.calls == 1
+        assert self.doc.calls == self.youtube.calls == self.article.calls == 0
+
+    def test_candidate_rejection_falls_through_to_unindexed(self):
+        legacy = StubParser(SourceType.AUDIO)  # no hints
+        index = self.make_index(legacy)
+        self.article.accepts = False
+        assert index.route("https://drive.google.com/file/d/x") is legacy
+        legacy.accepts = False
+        assert index.route("https://drive.google.com/file/d/x") is None
+
+    def test_priority_follows_source_type_order(self):
+        first = StubParser(SourceType.DOC, dispatch_extension_categories=("Audio",))
+        index = self.make_index(first)
+        assert index.candidate("/tmp/song.mp3") is first
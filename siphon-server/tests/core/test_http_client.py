@@ -0,0 +1,67 @@
+import asyncio
+import os
+import threading
+import time
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from siphon_server.core.http_client import HttpClients
+
+
+def _clients(handler, per_host: int = 2) -> HttpClients:
+    return HttpClients(per_host=per_host, http2=False, transport=httpx.MockTransport(handler))
+
+
+class TestHttpClients:
+    def test_one_client_is_shared(self):
+        clients = _clients(lambda request: httpx.Response(200, text=request.url.host))
+        assert clients.client is clients.client
+        assert clients.request("GET", "https://a.example/x").text == "a.example"
+        clients.close()
+        assert clients._client is None
+
+    def test_per_host_slots_bound_concurrency(self):
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def handler(request):
+            host = request.url.host
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return httpx.Response(200)
+
+        clients = _clients(handler, per_host=2)
+        urls = [f"https://{host}/{n}" for n in range(6) for host in ("a.test", "b.test")]
+        with ThreadPoolExecutor(12) as pool:
+            list(pool.map(lambda url: clients.request("GET", url), urls))
+        assert peak == {"a.test": 2, "b.test": 2}
+
+    def test_async_client_per_loop(self):
+        clients = _clients(lambda request: httpx.Response(204))
+
+        async def fetch():
+            response = await clients.request_async("GET", "https://a.test/")
+            client = clients.async_client()
+            assert client is clients.async_client()
+            await clients.aclose()
+            return response.status_code, client
+
+        first, second = asyncio.run(fetch()), asyncio.run(fetch())
+        assert first[0] == second[0] == 204
+        assert first[1] is not second[1]
+
+    def test_forked_child_starts_without_clients(self):
+        clients = _clients(lambda request: httpx.Response(200))
+        parent = clients.client
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write, b"1" if clients._client is None else b"0")
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert os.read(read, 1) == b"1"
+        assert clients.client is parent
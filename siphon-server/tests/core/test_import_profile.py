@@ -0,0 +1,34 @@
+from siphon_server.core.import_profile import parse_importtime, ImportProfile
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        450 |     siphon_api.enums
+import time:       200 |        650 |   siphon_api.models
+import time:        50 |        700 | siphon_server.core.pipeline
+Traceback noise that is not part of the report
+"""
+
+
+class TestImportProfile:
+    def test_parse_importtime(self):
+        records = parse_importtime(SAMPLE)
+        assert [r.module for r in records] == [
+            "_io",
+            "siphon_api.enums",
+            "siphon_api.models",
+            "siphon_server.core.pipeline",
+        ]
+        assert [r.depth for r in records] == [1, 2, 1, 0]
+
+    def test_total_and_top(self):
+        profile = ImportProfile(
+            module="siphon_server.core.pipeline",
+            wall_seconds=0.01,
+            records=parse_importtime(SAMPLE),
+        )
+        assert profile.total_seconds == 0.0007
+        assert [r.module for r in profile.top(2)] == [
+            "siphon_server.core.pipeline",
+            "siphon_api.models",
+        ]
@@ -0,0 +1,61 @@
+import asyncio
+from siphon_api.enums import SourceType
+from siphon_server.core.async_adapters import run_sync
+from siphon_server.core.metrics import PipelineMetrics, tracing
+
+
+class TestPipelineMetrics:
+    def test_snapshot_by_stage_and_source_type(self):
+        metrics = PipelineMetrics()
+        for seconds in (0.002, 0.004, 0.2):
+            metrics.observe("extract", SourceType.YOUTUBE, seconds)
+        metrics.observe("extract", SourceType.ARTICLE, 0.01)
+        metrics.cache("repository", True)
+        metrics.cache("repository", False)
+        metrics.cache("repository", False)
+
+        stats = metrics.snapshot()
+        youtube = stats.stage("extract", "YouTube")
+        assert youtube.count == 3
+        assert 0.001 <= youtube.p50 <= 0.005
+        assert 0.1 <= youtube.p99 <= 0.25
+        assert stats.stage("extract", "Article").count == 1
+        assert stats.cache("repository").hits == 1
+        assert round(stats.cache("repository").hit_rate, 2) == 0.33
+
+    def test_prometheus_text(self):
+        metrics = PipelineMetrics()
+        metrics.observe("parse", "Doc", 0.003)
+        metrics.cache("stage.extract", True)
+        text = metrics.prometheus()
+        assert "# TYPE siphon_stage_duration_seconds histogram" in text
+        assert (
+            'siphon_stage_duration_seconds_bucket{stage="parse",source_type="Doc",le="0.001"} 0'
+            in text
+        )
+        assert (
+            'siphon_stage_duration_seconds_bucket{stage="parse",source_type="Doc",le="+Inf"} 1'
+            in text
+        )
+        assert 'siphon_stage_duration_seconds_count{stage="parse",source_type="Doc"} 1' in text
+        assert 'siphon_cache_requests_total{cache="stage.extract",result="hit"} 1' in text
+
+    def test_trace_records_stages_and_follows_offloaded_calls(self):
+        metrics = PipelineMetrics()
+
+        def lookup():
+            with metrics.stage("lookup"):
+                metrics.cache("repository", False)
+
+        async def request():
+            with tracing() as trace:
+                trace.source_type = SourceType.AUDIO
+                with metrics.stage("parse"):
+                    pass
+                await run_sync(lookup)
+            return trace
+
+        trace = asyncio.run(request())
+        assert set(trace.timings) == {"parse", "lookup"}
+        assert trace.cache_hits == {"repository": False}
+        assert metrics.snapshot().stage("lookup", "Audio").count == 1
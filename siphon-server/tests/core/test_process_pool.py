@@ -0,0 +1,63 @@
+import os
+import pytest
+from siphon_server.core.process_pool import (
+    ConversionPool,
+    SharedText,
+    shared_text,
+    text_of,
+)
+
+BIG = "héllo wörld " * 10_000  # Over SHARED_MIN_BYTES
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ConversionPool(workers=2, max_tasks=50, max_rss_mb=0)
+    pool.warm()
+    yield pool
+    pool.shutdown()
+
+
+class TestConversionPool:
+    def test_runs_in_worker_processes(self, pool):
+        assert pool.run(os.getpid) != os.getpid()
+        with pytest.raises(ValueError):
+            pool.run(int, "not a number")
+
+    def test_shared_text_round_trip(self, pool):
+        with shared_text("small") as payload:
+            assert payload == "small"
+        with shared_text(BIG) as payload:
+            assert isinstance(payload, SharedText)
+            assert pool.run(text_of, payload) == BIG
+
+    def test_inline_when_no_workers(self):
+        pool = ConversionPool(workers=0)
+        assert pool.run(os.getpid) == os.getpid()
+        with shared_text(BIG) as payload:
+            assert pool.run(text_of, payload) == BIG
+
+    def test_workers_are_recycled(self):
+        pool = ConversionPool(workers=1, max_tasks=1, max_rss_mb=0)
+        try:
+            assert pool.run(os.getpid) != pool.run(os.getpid)  # max_tasks_per_child
+        finally:
+            pool.shutdown()
+
+    def test_memory_bound_swaps_the_pool(self):
+        pool = ConversionPool(workers=1, max_tasks=50, max_rss_mb=1)
+        try:
+            first = pool.run(os.getpid)
+            assert pool.recycled == 1
+            assert pool.run(os.getpid) != first
+        finally:
+            pool.shutdown()
+
+    def test_submit_to_a_shut_down_pool_retries_on_a_new_one(self):
+        pool = ConversionPool(workers=1, max_tasks=50, max_rss_mb=0)
+        try:
+            pool.executor().shutdown()  # As a concurrent _recycle would, mid-submit
+            assert pool.run(os.getpid) != os.getpid()
+            assert pool.recycled == 1
+        finally:
+            pool.shutdown()
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+from siphon_api.enums import ResourceClass
+from siphon_server.core.scheduler import ResourceScheduler, resource_class_of
+
+
+class GpuExtractor:
+    resource_class = ResourceClass.GPU
+
+
+class TestResourceScheduler:
+    def test_slots_bound_concurrency_per_class(self):
+        scheduler = ResourceScheduler({"cpu": 2})
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        futures = [scheduler.submit(ResourceClass.CPU, work) for _ in range(8)]
+        for future in futures:
+            future.result()
+        assert peak == 2
+        scheduler.shutdown()
+
+    def test_busy_class_does_not_block_another(self):
+        scheduler = ResourceScheduler({"gpu": 1, "network": 4})
+        release = threading.Event()
+        podcast = scheduler.submit(ResourceClass.GPU, release.wait, 5)
+        start = time.perf_counter()
+        results = [
+            scheduler.run(ResourceClass.NETWORK, lambda n=n: n * 2) for n in range(10)
+        ]
+        assert results == [n * 2 for n in range(10)]
+        assert time.perf_counter() - start < 1
+        assert not podcast.done()
+        release.set()
+        assert podcast.result() is True
+        scheduler.shutdown()
+
+    def test_nested_run_in_same_class_runs_inline(self):
+        scheduler = ResourceScheduler({"gpu": 1})
+
+        def outer():
+            return scheduler.run(ResourceClass.GPU, threading.current_thread)
+
+        inner_thread = scheduler.run(ResourceClass.GPU, outer)
+        assert inner_thread.name.startswith("siphon-gpu")
+        scheduler.shutdown()
+
+    def test_async_slot_limits_native_coroutines(self):
+        scheduler = ResourceScheduler({"llm": 3})
+        active = 0
+        peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with scheduler.slot(ResourceClass.LLM):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def main():
+            await asyncio.gather(*(call() for _ in range(12)))
+
+        asyncio.run(main())
+        assert peak == 3
+
+    def test_resource_class_of(self):
+        assert resource_class_of(GpuExtractor(), ResourceClass.CPU) == ResourceClass.GPU
+        assert resource_class_of(object(), ResourceClass.LLM) == ResourceClass.LLM
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+import pytest
+from siphon_server.core.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    def test_concurrent_threads_share_one_call(self):
+        flights = SingleFlight()
+        calls = []
+
+        def slow(uri: str) -> str:
+            calls.append(uri)
+            time.sleep(0.05)
+            return uri.upper()
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(flights.do("a", slow, "youtube:///a"))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["youtube:///a"]
+        assert results == ["YOUTUBE:///A"] * 8
+        assert flights.coalesced == 7
+        assert flights.in_flight() == 0
+
+    def test_exception_is_shared_and_key_released(self):
+        flights = SingleFlight()
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.05)
+            raise RuntimeError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                flights.do("k", failing)
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=call)
+        follower.start()
+        leader.join()
+        follower.join()
+
+        assert len(errors) == 2
+        assert flights.do("k", lambda: "again") == "again"
+
+    def test_coroutines_share_one_task(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch(n: int) -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return n * 2
+
+        async def main():
+            return await asyncio.gather(
+                *(flights.do_async("x", fetch, 21) for _ in range(5)),
+                flights.do_async("y", fetch, 1),
+            )
+
+        assert asyncio.run(main()) == [42, 42, 42, 42, 42, 2]
+        assert calls == 2
+
+    def test_cancelled_caller_does_not_cancel_shared_work(self):
+        flights = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def main():
+            first = asyncio.ensure_future(flights.do_async("k", work))
+            second = asyncio.ensure_future(flights.do_async("k", work))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(main()) == "done"
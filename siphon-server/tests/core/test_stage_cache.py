@@ -0,0 +1,68 @@
+from siphon_api.enums import SourceType
+from siphon_api.models import ContentData, EnrichedData
+from siphon_server.core.stage_cache import StageCache, content_hash, strategy_version
+
+
+class VersionedExtractor:
+    version = "3"
+
+
+class UnversionedExtractor:
+    pass
+
+
+class ConfiguredExtractor:
+    def __init__(self, backend: str):
+        self.backend = backend
+
+    @property
+    def version(self) -> str:
+        return self.backend
+
+
+def _content(text: str = "hello", **metadata) -> ContentData:
+    return ContentData(source_type=SourceType.ARTICLE, text=text, metadata=metadata)
+
+
+class TestStageCache:
+    def test_content_round_trip_is_keyed_by_extractor_version(self, tmp_path):
+        cache = StageCache(tmp_path / "stages.db")
+        cache.set_content("article:///a", "v1", _content(title="A"))
+        assert cache.get_content("article:///a", "v1") == _content(title="A")
+        assert cache.get_content("article:///a", "v2") is None
+        assert cache.get_content("article:///b", "v1") is None
+
+    def test_enrichment_is_keyed_by_content_model_and_prompts(self, tmp_path):
+        cache = StageCache(tmp_path / "stages.db")
+        enriched = EnrichedData(source_type=SourceType.ARTICLE, title="T")
+        cache.set_enrichment(_content(), "model-a", "p1", enriched)
+        assert cache.get_enrichment(_content(), "model-a", "p1") == enriched
+        assert cache.get_enrichment(_content(), "model-b", "p1") is None
+        assert cache.get_enrichment(_content(), "model-a", "p2") is None
+        assert cache.get_enrichment(_content("changed"), "model-a", "p1") is None
+
+    def test_content_hash_ignores_token_count_and_key_order(self):
+        a = _content(x=1, y=2)
+        b = _content(y=2, x=1)
+        b.token_count = 42
+        assert content_hash(a) == content_hash(b)
+
+    def test_strategy_version(self):
+        assert strategy_version(VersionedExtractor) == "VersionedExtractor:3"
+        version = strategy_version(UnversionedExtractor)
+        assert version.startswith("UnversionedExtractor:")
+        assert len(version.split(":")[1]) == 16
+
+    def test_instances_are_versioned_by_their_configuration(self):
+        assert strategy_version(ConfiguredExtractor("a")) == "ConfiguredExtractor:a"
+        assert strategy_version(ConfiguredExtractor("b")) == "ConfiguredExtractor:b"
+        # The class alone can't see a configuration: it falls back to its source
+        version = strategy_version(ConfiguredExtractor)
+        assert len(version.split(":")[1]) == 16
+
+    def test_scope_names_the_host_and_file(self, tmp_path):
+        import socket
+
+        a = StageCache(tmp_path / "a.db")
+        assert a.scope.startswith(f"{socket.gethostname()}:")
+        assert a.scope != StageCache(tmp_path / "b.db").scope
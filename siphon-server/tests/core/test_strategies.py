@@ -0,0 +1,45 @@
+import threading
+import time
+from siphon_server.core.strategies import StrategyLifecycle
+
+
+class SlowStrategy:
+    builds = 0
+
+    def __init__(self):
+        type(self).builds += 1
+        time.sleep(0.02)
+
+
+class WarmableStrategy:
+    def __init__(self):
+        self.warmed = False
+
+    def warmup(self):
+        self.warmed = True
+
+
+class TestStrategyLifecycle:
+    def test_builds_once_across_threads(self):
+        lifecycle = StrategyLifecycle()
+        SlowStrategy.builds = 0
+        instances = []
+
+        def grab():
+            instances.append(lifecycle.get(SlowStrategy))
+
+        threads = [threading.Thread(target=grab) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert SlowStrategy.builds == 1
+        assert all(instance is instances[0] for instance in instances)
+
+    def test_warmup_calls_hook_and_reports_init_time(self):
+        lifecycle = StrategyLifecycle()
+        init_times = lifecycle.warmup([SlowStrategy, WarmableStrategy])
+        assert lifecycle.get(WarmableStrategy).warmed
+        assert set(init_times) == {"SlowStrategy", "WarmableStrategy"}
+        assert init_times["SlowStrategy"] >= 0.02
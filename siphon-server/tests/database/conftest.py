@@ -0,0 +1,39 @@
+import pytest
+from siphon_api.enums import SourceType
+from siphon_api.models import ContentData, EnrichedData, ProcessedContent, SourceInfo
+
+
+@pytest.fixture
+def processed():
+    """Factory for ProcessedContent test rows; uri defaults to <source type>:///a."""
+
+    def make(
+        uri: str | None = None,
+        text: str = "body",
+        title: str = "T",
+        summary: str = "",
+        source_type: SourceType = SourceType.ARTICLE,
+        topics: list[str] | None = None,
+        metadata: dict | None = None,
+        tags: list[str] | None = None,
+        created_at: int = 0,
+        updated_at: int = 0,
+    ) -> ProcessedContent:
+        uri = uri or f"{source_type.name.lower()}:///a"
+        return ProcessedContent(
+            source=SourceInfo(source_type=source_type, uri=uri, original_source=uri),
+            content=ContentData(
+                source_type=source_type, text=text, metadata=metadata or {}
+            ),
+            enrichment=EnrichedData(
+                source_type=source_type,
+                title=title,
+                summary=summary,
+                topics=topics or [],
+            ),
+            tags=tags or [],
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    return make
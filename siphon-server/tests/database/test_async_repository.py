@@ -0,0 +1,36 @@
+import asyncio
+from siphon_server.config import settings
+from siphon_server.database.postgres.async_repository import AsyncContentRepository
+from siphon_server.database.postgres.connection import pool_options
+
+
+class TestAsyncContentRepository:
+    def test_concurrent_lookups_share_the_read_cache(self, processed, monkeypatch):
+        repository = AsyncContentRepository(cache_size=8, cache_ttl=60, listen=False)
+        loads = []
+
+        async def get(uri):
+            loads.append(uri)
+            await asyncio.sleep(0)
+            return processed(uri)
+
+        monkeypatch.setattr(repository, "get", get)
+
+        async def main():
+            first = await repository.get_or_none("article:///a")
+            rest = await asyncio.gather(
+                *(repository.get_or_none("article:///a") for _ in range(5))
+            )
+            return first, rest
+
+        first, rest = asyncio.run(main())
+        assert all(pc is first for pc in rest)
+        assert loads == ["article:///a"]
+
+    def test_pool_options_come_from_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_pool_size", 3)
+        monkeypatch.setattr(settings, "db_pool_pre_ping", False)
+        options = pool_options()
+        assert options["pool_size"] == 3
+        assert options["pool_pre_ping"] is False
+        assert options["max_overflow"] == settings.db_max_overflow
@@ -0,0 +1,42 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.dialects import postgresql
+from siphon_server.database.postgres.bodies import body_row, compress, decompress
+from siphon_server.database.postgres.converters import from_orm, to_orm
+from siphon_server.database.postgres.models import ContentBodyORM
+from siphon_server.database.postgres.repository import _write_statements
+
+
+class TestContentBodies:
+    @pytest.mark.parametrize("codec", ["zstd", "zlib"])
+    def test_round_trip(self, codec):
+        text = "the transcript goes on " * 500
+        data = compress(text, codec)
+        assert len(data) < len(text) // 4
+        assert decompress(codec, data) == text
+
+    def test_codec_contexts_are_per_thread(self):
+        texts = [f"thread {n} " * 200 for n in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda t: decompress("zstd", compress(t)), texts * 4))
+        assert results == texts * 4
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            decompress("lz4", b"")
+
+    def test_rows_reference_bodies_by_hash(self, processed):
+        pc = processed("article:///a", "body text")
+        pc.content.token_count = 2
+        orm_obj = to_orm(pc)
+        body = body_row(pc.text)
+        assert orm_obj.content_hash == body["content_hash"]
+        assert orm_obj.content_length == len(pc.text)
+        orm_obj.body = ContentBodyORM(**body)
+        assert from_orm(orm_obj) == pc
+
+    def test_identical_bodies_are_written_once(self, processed):
+        batch = [processed(f"article:///{n}", "shared") for n in range(3)]
+        bodies, _ = _write_statements(batch)
+        params = bodies.compile(dialect=postgresql.dialect()).params
+        assert len([key for key in params if key.startswith("content_hash")]) == 1
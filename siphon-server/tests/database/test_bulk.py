@@ -0,0 +1,35 @@
+from sqlalchemy.dialects import postgresql
+from siphon_server.database.postgres.repository import (
+    _write_statements,
+    resolve_batch_size,
+)
+from siphon_server.database.common import batches
+
+
+class TestBulkUpsert:
+    def test_batches_are_bounded_and_deduplicated_last_wins(self, processed):
+        items = [processed(f"article:///{n}") for n in range(5)]
+        items.append(processed("article:///4", title="newer"))
+        batched = list(batches(items, 3))
+        assert [len(batch) for batch in batched] == [3, 2]
+        assert batched[1][-1].title == "newer"
+
+    def test_statement_upserts_on_uri(self, processed):
+        batch = next(batches([processed("article:///a")], 10))
+        bodies, rows = _write_statements(batch)
+        sql = str(rows.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (uri) DO UPDATE SET" in sql
+        assert "content_hash = excluded.content_hash" in sql
+        assert "search_vector = excluded.search_vector" in sql
+        assert "uri = excluded.uri" not in sql
+        sql = str(bodies.compile(dialect=postgresql.dialect()))
+        assert "INSERT INTO content_bodies" in sql
+        assert "ON CONFLICT (content_hash) DO NOTHING" in sql
+
+    def test_create_fails_on_an_existing_uri(self, processed):
+        _, rows = _write_statements([processed("article:///a")], upsert=False)
+        assert "ON CONFLICT" not in str(rows.compile(dialect=postgresql.dialect()))
+
+    def test_batch_size_respects_bind_parameter_limit(self):
+        assert resolve_batch_size(100) == 100
+        assert resolve_batch_size(1_000_000) * 15 <= 65535
@@ -0,0 +1,85 @@
+from siphon_server.database.postgres.content_cache import ContentLRU, notify_payload
+from siphon_server.database.postgres.repository import ContentRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestContentLRU:
+    def test_entries_expire_after_ttl(self, processed):
+        clock = FakeClock()
+        lru = ContentLRU(maxsize=4, ttl=10, clock=clock)
+        lru.put("a", processed(), lru.epoch)
+        clock.now = 9.9
+        assert lru.get("a") is not None
+        clock.now = 10.0
+        assert lru.get("a") is None
+
+    def test_least_recently_used_is_evicted(self, processed):
+        lru = ContentLRU(maxsize=2)
+        for uri in ("a", "b"):
+            lru.put(uri, processed(uri), lru.epoch)
+        lru.get("a")
+        lru.put("c", processed("c"), lru.epoch)
+        assert lru.get("a") is not None
+        assert lru.get("b") is None
+        assert len(lru) == 2
+
+    def test_load_racing_an_invalidation_is_not_cached(self, processed):
+        lru = ContentLRU()
+        epoch = lru.epoch
+        lru.invalidate("a")  # A write committed while we were loading
+        assert not lru.put("a", processed(), epoch)
+        assert lru.get("a") is None
+
+    def test_zero_size_disables_caching(self, processed):
+        lru = ContentLRU(maxsize=0)
+        assert not lru.put("a", processed(), lru.epoch)
+
+    def test_oversized_uris_notify_a_full_flush(self):
+        assert notify_payload("article:///a") == "article:///a"
+        assert notify_payload("x" * 9000) == ""
+
+
+class TestGetOrNone:
+    def test_hot_uri_costs_one_load(self, processed, monkeypatch):
+        repository = ContentRepository(cache_size=8, cache_ttl=60, listen=False)
+        loads = []
+
+        def get(uri):
+            loads.append(uri)
+            return processed(uri) if uri == "article:///a" else None
+
+        monkeypatch.setattr(repository, "get", get)
+        for _ in range(3):
+            assert repository.get_or_none("article:///a").source.uri == "article:///a"
+        assert loads == ["article:///a"]
+
+        # Misses aren't cached: a row created elsewhere shows up on the next read
+        assert repository.get_or_none("article:///b") is None
+        assert repository.get_or_none("article:///b") is None
+        assert loads.count("article:///b") == 2
+
+        repository.invalidate("article:///a")
+        repository.get_or_none("article:///a")
+        assert loads.count("article:///a") == 2
+
+
+class TestListenConnection:
+    def test_listener_connections_bypass_the_pool(self, monkeypatch):
+        from sqlalchemy.pool import NullPool
+        from siphon_server.database.postgres import connection
+
+        monkeypatch.setenv("SIPHON_DATABASE_URL", "sqlite://")
+        connection.get_postgres_url.cache_clear()
+        connection.get_listen_engine.cache_clear()
+        try:
+            assert isinstance(connection.get_listen_engine().pool, NullPool)
+        finally:
+            connection.get_postgres_url.cache_clear()
+            connection.get_listen_engine.cache_clear()
@@ -0,0 +1,99 @@
+import httpx
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+from siphon_api.api.siphon_search import SiphonRelatedRequest
+from siphon_server.core.http_client import HTTP
+from siphon_server.database.vector.embeddings import Embedder, chunk_texts, normalize
+from siphon_server.database.vector.pgvector import (
+    ContentEmbeddingORM,
+    EmbeddingStore,
+    blend,
+)
+
+
+class StubEmbedder:
+    model = "stub"
+
+    def embed(self, texts):
+        return [[3.0, 4.0] for _ in texts]
+
+
+class TestEmbeddings:
+    def test_chunks_are_enrichment_then_bounded_text_windows(self, processed):
+        chunks = chunk_texts(processed(text="x" * 2500, summary="S"), chunk_chars=1000, max_chunks=2)
+        assert chunks[0] == "T\n\nS"
+        assert [len(c) for c in chunks[1:]] == [1000, 1000]
+
+    def test_embedder_batches_and_orders_by_index(self, monkeypatch):
+        calls = []
+
+        def request(method, url, json, headers, timeout):
+            assert method == "POST"
+            calls.append(json["input"])
+            data = [
+                {"index": i, "embedding": [float(len(t)), 0.0]}
+                for i, t in enumerate(json["input"])
+            ]
+            return httpx.Response(
+                200, json={"data": data[::-1]}, request=httpx.Request("POST", url)
+            )
+
+        monkeypatch.setattr(HTTP, "request", request)
+        embedder = Embedder(model="m", url="http://embed/v1/embeddings", batch_size=2)
+        embedder.dimensions = 2
+        vectors = embedder.embed(["a", "bb", "ccc"])
+        assert calls == [["a", "bb"], ["ccc"]]
+        assert vectors == [[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]]
+        embedder.dimensions = 3
+        with pytest.raises(ValueError):
+            embedder.embed(["a"])
+
+    def test_query_only_seed_is_unit_length(self):
+        store = EmbeddingStore(embedder=StubEmbedder())
+        assert store.seed_vector([], "synth pop") == pytest.approx([0.6, 0.8])
+        assert store.seed_vector([], None) is None
+        assert normalize([0.0, 0.0]) == [0.0, 0.0]
+
+    def test_blend_weighs_seeds_equally_and_the_query_explicitly(self):
+        long_seed = [[1.0, 0.0]] * 9  # Nine chunks
+        short_seed = [[0.0, 1.0]]
+        diagonal = pytest.approx([0.7071, 0.7071], abs=1e-4)
+        assert blend([long_seed, short_seed], None) == diagonal
+        # One seed plus a query: half each, however many chunks the seed has
+        assert blend([long_seed], [0.0, 5.0]) == diagonal
+        assert blend([long_seed], [0.0, 5.0], query_weight=1.0) == pytest.approx([0.0, 1.0])
+        assert blend([[]], None) is None
+
+    def test_hnsw_cosine_index(self):
+        (hnsw,) = [
+            i for i in ContentEmbeddingORM.__table__.indexes if i.name.endswith("hnsw")
+        ]
+        sql = str(CreateIndex(hnsw).compile(dialect=postgresql.dialect()))
+        assert "USING hnsw (embedding vector_cosine_ops)" in sql
+        assert "WITH (m = 16, ef_construction = 64)" in sql
+
+    def test_base_schema_leaves_out_the_embedding_store(self, monkeypatch):
+        from types import SimpleNamespace
+        from siphon_server.database.postgres import setup
+
+        created = []
+        monkeypatch.setattr(
+            setup, "get_engine", lambda: SimpleNamespace(url=SimpleNamespace(database="t"))
+        )
+        monkeypatch.setattr(
+            setup.Base.metadata,
+            "create_all",
+            lambda engine, tables: created.extend(t.name for t in tables),
+        )
+        monkeypatch.setattr(setup, "upgrade_tables", lambda: None)
+        monkeypatch.setattr(setup, "migrate_content_bodies", lambda: None)
+        setup.create_tables()
+        assert "processed_content" in created
+        assert "content_embeddings" not in created  # Registered, but needs pgvector
+
+    def test_related_request_needs_a_seed(self):
+        with pytest.raises(ValidationError):
+            SiphonRelatedRequest()
+        assert SiphonRelatedRequest(query="x").k == 10
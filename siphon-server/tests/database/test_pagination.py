@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+from siphon_api.enums import SourceType
+from siphon_api.models import ContentData, EnrichedData, ProcessedContent, SourceInfo
+from siphon_server.database.postgres.converters import to_orm
+from siphon_server.database.postgres.repository import (
+    ContentRepository,
+    _iter_statement,
+    _page,
+    _page_statement,
+)
+
+
+def _sql(stmt) -> str:
+    return str(
+        stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+def _row(n: int):
+    uri = f"article:///{n}"
+    orm_obj = to_orm(
+        ProcessedContent(
+            source=SourceInfo(source_type=SourceType.ARTICLE, uri=uri, original_source=uri),
+            content=ContentData(source_type=SourceType.ARTICLE, text="body"),
+            enrichment=EnrichedData(source_type=SourceType.ARTICLE),
+            created_at=n,
+            updated_at=n,
+        )
+    )
+    orm_obj.id = n
+    return orm_obj
+
+
+class TestKeysetPagination:
+    def test_page_seeks_past_after_id_with_filters(self):
+        sql = _sql(_page_statement(40, 20, SourceType.YOUTUBE, since=1700000000))
+        assert "processed_content.id > 40" in sql
+        assert "processed_content.source_type = 'YouTube'" in sql
+        assert "processed_content.updated_at >= 1700000000" in sql
+        assert " ".join(sql.split()).endswith("ORDER BY processed_content.id LIMIT 20")
+        assert "OFFSET" not in sql
+        assert "content_text" not in sql
+
+    def test_full_page_points_to_next_and_short_page_ends(self):
+        assert _page([_row(1), _row(2)], limit=2).next_after_id == 2
+        last = _page([_row(3)], limit=2)
+        assert last.next_after_id is None
+        assert [item.uri for item in last.items] == ["article:///3"]
+
+    def test_limit_is_bounded(self):
+        with pytest.raises(ValueError):
+            _page_statement(None, 0, None, None)
+        with pytest.raises(ValueError):
+            _page_statement(None, 10_000, None, None)
+
+    def test_iteration_streams_in_id_order(self):
+        stmt = _iter_statement(None, None, 250)
+        assert stmt.get_execution_options()["yield_per"] == 250
+        assert "ORDER BY processed_content.id" in _sql(stmt)
+
+    def test_list_does_not_shadow_builtin_annotations(self):
+        annotations = ContentRepository.get_existing_uris.__annotations__
+        assert annotations["return"] == list[str]
@@ -0,0 +1,31 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from siphon_api.enums import SourceType
+from siphon_server.database.postgres.converters import summary_from_orm, to_orm
+from siphon_server.database.postgres.models import ProcessedContentORM, SUMMARY_LOAD
+
+
+class TestSummaryProjection:
+    def test_summary_query_skips_content_columns(self):
+        stmt = select(ProcessedContentORM).options(*SUMMARY_LOAD)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "processed_content.title" in sql
+        assert "content_text" not in sql
+        assert "content_metadata" not in sql
+
+    def test_summary_from_orm_keeps_everything_but_content(self, processed):
+        pc = processed(
+            "youtube:///dQw4w9WgXcQ",
+            text="transcript " * 10000,
+            summary="S",
+            source_type=SourceType.YOUTUBE,
+            tags=["music"],
+            created_at=1,
+            updated_at=2,
+        )
+        summary = summary_from_orm(to_orm(pc))
+        assert summary.uri == pc.uri
+        assert summary.title == "T" and summary.summary == "S"
+        assert summary.tags == ["music"]
+        assert (summary.created_at, summary.updated_at) == (1, 2)
+        assert "content" not in summary.model_dump()
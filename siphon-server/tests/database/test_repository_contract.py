@@ -0,0 +1,287 @@
+"""
+Behaviour every repository backend must share. SQLite always runs; Postgres runs when
+SIPHON_TEST_DATABASE_URL names a disposable database (its tables are emptied per test).
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import pytest
+from siphon_api.enums import SourceType
+from siphon_api.models import ProcessedContent
+from siphon_server.database.sqlite.repository import SQLiteContentRepository, fts_query
+
+TEST_DATABASE_URL = os.getenv("SIPHON_TEST_DATABASE_URL")
+
+
+def _postgres(monkeypatch):
+    from sqlalchemy import text
+    from siphon_server.database.postgres import connection
+    from siphon_server.database.postgres.repository import ContentRepository
+    from siphon_server.database.postgres.setup import create_tables
+
+    monkeypatch.setenv("SIPHON_DATABASE_URL", TEST_DATABASE_URL)
+    for cached in (
+        connection.get_postgres_url,
+        connection.get_engine,
+        connection.get_listen_engine,
+        connection.get_sessionmaker,
+    ):
+        cached.cache_clear()
+    create_tables()
+    with connection.get_engine().begin() as conn:
+        conn.execute(
+            text("TRUNCATE processed_content, content_bodies, work_leases RESTART IDENTITY")
+        )
+    return lambda: ContentRepository()
+
+
+@pytest.fixture(params=["sqlite", "postgres"])
+def make_repository(request, tmp_path, monkeypatch):
+    """Factory for repositories sharing one empty database."""
+    if request.param == "sqlite":
+        return lambda: SQLiteContentRepository(tmp_path / "siphon.db")
+    if not TEST_DATABASE_URL:
+        pytest.skip("SIPHON_TEST_DATABASE_URL is not set")
+    return _postgres(monkeypatch)
+
+
+@pytest.fixture
+def repository(make_repository):
+    return make_repository()
+
+
+@pytest.fixture
+def item(processed):
+    """Factory for the n-th stored item: uri <source type>:///n, created at n."""
+
+    def make(
+        n: int,
+        title: str = "",
+        text: str = "body",
+        source_type: SourceType = SourceType.ARTICLE,
+        updated_at: int | None = None,
+    ) -> ProcessedContent:
+        return processed(
+            f"{source_type.name.lower()}:///{n}",
+            text=text,
+            title=title or f"Item {n}",
+            source_type=source_type,
+            topics=["a", "b"],
+            metadata={"n": n},
+            tags=["t"],
+            created_at=n,
+            updated_at=n if updated_at is None else updated_at,
+        )
+
+    return make
+
+
+class TestReadsAndWrites:
+    def test_round_trip(self, repository, item):
+        pc = item(1, text="long text " * 100)
+        repository.set(pc)
+        assert repository.get(pc.uri) == pc
+        assert repository.exists(pc.uri)
+        assert repository.get("article:///missing") is None
+        assert not repository.exists("article:///missing")
+
+    def test_summary_omits_content(self, repository, item):
+        pc = item(1)
+        repository.set(pc)
+        summary = repository.get_summary(pc.uri)
+        assert summary.uri == pc.uri
+        assert summary.enrichment == pc.enrichment
+        assert repository.get_summary("article:///missing") is None
+
+    def test_create_and_update(self, repository, item):
+        pc = item(1)
+        assert repository.create(pc) == pc
+        with pytest.raises(ValueError):
+            repository.create(pc)
+        changed = pc.model_copy(update={"tags": ["new"]})
+        assert repository.update(changed).tags == ["new"]
+        with pytest.raises(ValueError):
+            repository.update(item(2))
+
+    def test_bulk(self, repository, item):
+        items = [item(n) for n in range(5)]
+        items.append(item(4, title="newer"))
+        assert repository.upsert_many(items, batch_size=2) == 5
+        found = repository.get_many([f"article:///{n}" for n in range(7)])
+        assert sorted(found) == [f"article:///{n}" for n in range(5)]
+        assert found["article:///4"].title == "newer"
+        assert sorted(repository.get_summaries(["article:///0", "article:///9"])) == [
+            "article:///0"
+        ]
+        assert repository.get_existing_uris(["article:///1", "article:///9"]) == [
+            "article:///1"
+        ]
+
+    def test_shared_bodies_are_pruned_once_unreferenced(self, repository, item):
+        repository.upsert_many([item(1, text="same"), item(2, text="same")])
+        repository.set(item(1, text="changed"))
+        assert repository.prune_bodies() == 0  # Still referenced by item 2
+        repository.set(item(2, text="changed"))
+        assert repository.prune_bodies() == 1
+        assert repository.get("article:///2").text == "changed"
+
+    def test_last_processed(self, repository, item):
+        assert repository.get_last_processed_content() is None
+        repository.upsert_many([item(3), item(1)])
+        assert repository.get_last_processed_content().uri == "article:///3"
+        assert repository.get_last_summary().uri == "article:///3"
+
+
+class TestCache:
+    def test_hit_then_invalidated_by_another_instance(self, make_repository, item):
+        reader, writer = make_repository(), make_repository()
+        pc = item(1)
+        writer.set(pc)
+        assert reader.get_or_none(pc.uri) == pc
+        writer.set(pc.model_copy(update={"tags": ["new"]}))
+        deadline = time.monotonic() + 5  # NOTIFY is asynchronous
+        while reader.get_or_none(pc.uri).tags != ["new"]:
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        assert reader.get_or_none("article:///missing") is None
+
+    def test_advisory_lock_excludes(self, repository):
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with repository.advisory_lock("key"):
+                held.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        held.wait(5)
+        acquired = []
+
+        def wait():
+            with repository.advisory_lock("key"):
+                acquired.append(1)
+
+        waiter = threading.Thread(target=wait, daemon=True)
+        waiter.start()
+        waiter.join(0.2)
+        assert not acquired
+        release.set()
+        thread.join()
+        waiter.join(5)
+        assert acquired
+
+    def test_work_lease_excludes_until_released_or_expired(self, make_repository):
+        first, second = make_repository(), make_repository()
+        token = first.claim_lease("extract:a", ttl=60)
+        assert token is not None
+        assert second.claim_lease("extract:a", ttl=60) is None
+        assert second.claim_lease("extract:b", ttl=60) is not None
+        second.release_lease("extract:a", "not-the-holder")
+        assert second.claim_lease("extract:a", ttl=60) is None
+        first.release_lease("extract:a", token)
+        stale = second.claim_lease("extract:a", ttl=0.01)
+        assert stale is not None
+        time.sleep(0.05)  # A dead holder's lease frees up on its own
+        assert first.claim_lease("extract:a", ttl=60) is not None
+        second.release_lease("extract:a", stale)  # Expired and moved on: a no-op
+        assert second.claim_lease("extract:a", ttl=60) is None
+
+
+class TestScans:
+    def test_iter_all_filters(self, repository, item):
+        repository.upsert_many(
+            [
+                item(1),
+                item(2, updated_at=50),
+                item(3, source_type=SourceType.YOUTUBE),
+            ]
+        )
+        assert [pc.uri for pc in repository.iter_all(batch_size=1)] == [
+            "article:///1",
+            "article:///2",
+            "youtube:///3",
+        ]
+        assert [pc.uri for pc in repository.iter_all(SourceType.ARTICLE, since=10)] == [
+            "article:///2"
+        ]
+
+    def test_list_pages(self, repository, item):
+        repository.upsert_many([item(n) for n in range(5)])
+        page = repository.list(limit=2)
+        uris = [item.uri for item in page.items]
+        while page.next_after_id is not None:
+            page = repository.list(after_id=page.next_after_id, limit=2)
+            uris.extend(item.uri for item in page.items)
+        assert uris == [f"article:///{n}" for n in range(5)]
+        with pytest.raises(ValueError):
+            repository.list(limit=0)
+
+
+class TestSearch:
+    @pytest.fixture
+    def corpus(self, repository, item):
+        repository.upsert_many(
+            [
+                item(1, title="Rust async runtimes", text="tokio internals"),
+                item(2, title="Cooking", text="a rust coloured sauce"),
+                item(3, title="Python", text="asyncio and rust extensions"),
+                item(4, title="Rust", text="video", source_type=SourceType.YOUTUBE),
+            ]
+        )
+        return repository
+
+    def test_title_matches_rank_first(self, corpus):
+        results = corpus.search("rust")
+        assert results[0].summary.uri in ("article:///1", "youtube:///4")
+        assert {r.summary.uri for r in results} == {
+            "article:///1",
+            "article:///2",
+            "article:///3",
+            "youtube:///4",
+        }
+        assert all(r.rank > 0 for r in results)
+
+    def test_web_search_syntax_and_filters(self, corpus):
+        results = corpus.search("rust -sauce -python", SourceType.ARTICLE)
+        assert [r.summary.uri for r in results] == ["article:///1"]
+        assert [r.summary.uri for r in corpus.search('"coloured sauce"')] == ["article:///2"]
+        assert len(corpus.search("tokio or asyncio")) == 2
+        assert corpus.search("rust", limit=1)[0].snippet
+        with pytest.raises(ValueError):
+            corpus.search("rust", limit=0)
+
+
+def test_fts_query_quotes_terms():
+    assert fts_query('rust "async io" or go -java') == '("rust" "async io" OR "go") NOT "java"'
+    assert fts_query("-only negative") == '("negative") NOT "only"'
+    assert fts_query("-x") is None
+    assert fts_query('a"b') == '("a""b")'
+
+
+def test_sqlite_lock_survives_other_keys_and_instances(tmp_path):
+    """Releasing one key (from any instance) must not drop the process's other locks."""
+    from siphon_server.database.common import advisory_key
+
+    path = tmp_path / "siphon.db"
+    held = SQLiteContentRepository(path)
+    with held.advisory_lock("held"):
+        with SQLiteContentRepository(path).advisory_lock("other"):
+            pass
+        probe = (
+            "import fcntl, os, sys\n"
+            "fd = os.open(sys.argv[1], os.O_RDWR)\n"
+            "try:\n"
+            "    fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, int(sys.argv[2]))\n"
+            "except OSError:\n"
+            "    sys.exit(1)\n"
+        )
+        offset = str(advisory_key("held") % 2**31)
+        other_process = subprocess.run(
+            [sys.executable, "-c", probe, f"{path}.locks", offset]
+        )
+        assert other_process.returncode == 1  # Still held
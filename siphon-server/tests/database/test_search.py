@@ -0,0 +1,46 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+from siphon_api.api.siphon_search import SiphonSearchRequest
+from siphon_api.enums import SourceType
+from siphon_server.database.postgres.models import ProcessedContentORM
+from siphon_server.database.postgres.repository import _search_statement
+
+
+def _sql(element) -> str:
+    return " ".join(str(element.compile(dialect=postgresql.dialect())).split())
+
+
+class TestSearch:
+    def test_search_vector_is_gin_indexed(self):
+        table = _sql(CreateTable(ProcessedContentORM.__table__))
+        assert "search_vector TSVECTOR," in table
+        indexes = [_sql(CreateIndex(i)) for i in ProcessedContentORM.__table__.indexes]
+        assert (
+            "CREATE INDEX ix_processed_content_search ON processed_content "
+            "USING gin (search_vector)" in indexes
+        )
+
+    def test_query_matches_through_the_index_and_ranks(self):
+        sql = _sql(_search_statement("rust async", SourceType.ARTICLE, 5))
+        assert "processed_content.search_vector @@ websearch_to_tsquery('english'::regconfig" in sql
+        assert "ts_rank_cd(processed_content.search_vector" in sql
+        assert "processed_content.source_type =" in sql
+        assert "ts_headline(" in sql
+
+    def test_snippets_are_built_for_the_top_rows_only(self):
+        sql = _sql(_search_statement("rust", None, 5))
+        inner = sql[sql.index("JOIN (") : sql.index(") AS anon_1")]
+        assert "LIMIT" in inner
+        assert "ts_headline" not in inner
+        assert "content_metadata" not in sql  # Rows load as summaries
+
+    def test_request_limits(self):
+        with pytest.raises(ValidationError):
+            SiphonSearchRequest(query="")
+        with pytest.raises(ValidationError):
+            SiphonSearchRequest(query="x", limit=1000)
+        assert SiphonSearchRequest(query="x", source_type="YouTube").source_type == (
+            SourceType.YOUTUBE
+        )